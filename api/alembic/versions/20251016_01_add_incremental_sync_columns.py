@@ -0,0 +1,32 @@
+"""add incremental sync columns to github_project
+
+Revision ID: 20251016_01
+Revises: 20251009_02
+Create Date: 2025-10-16 09:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_01"
+down_revision = "20251009_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "github_project",
+        sa.Column("items_high_water_mark", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "github_project",
+        sa.Column("last_full_sync_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("github_project", "last_full_sync_at")
+    op.drop_column("github_project", "items_high_water_mark")
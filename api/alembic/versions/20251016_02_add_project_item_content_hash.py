@@ -0,0 +1,27 @@
+"""add content_hash to project_item
+
+Revision ID: 20251016_02
+Revises: 20251016_01
+Create Date: 2025-10-16 10:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_02"
+down_revision = "20251016_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "project_item",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("project_item", "content_hash")
@@ -0,0 +1,58 @@
+"""add webhook_delivery inbox table
+
+Revision ID: 20251016_03
+Revises: 20251016_02
+Create Date: 2025-10-16 11:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_03"
+down_revision = "20251016_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "webhook_delivery",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("delivery_id", sa.String(length=255), nullable=False),
+        sa.Column("event", sa.String(length=100), nullable=False),
+        sa.Column("action", sa.String(length=100), nullable=True),
+        sa.Column("partition_key", sa.String(length=255), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "received_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False
+        ),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("delivery_id", name="uq_webhook_delivery_delivery_id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_webhook_delivery_status_next_attempt",
+        "webhook_delivery",
+        ["status", "next_attempt_at"],
+    )
+    op.create_index(
+        "ix_webhook_delivery_partition",
+        "webhook_delivery",
+        ["partition_key", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhook_delivery_partition", table_name="webhook_delivery")
+    op.drop_index("ix_webhook_delivery_status_next_attempt", table_name="webhook_delivery")
+    op.drop_table("webhook_delivery")
@@ -0,0 +1,37 @@
+"""add metadata cache columns to github_project
+
+Revision ID: 20251016_04
+Revises: 20251016_03
+Create Date: 2025-10-16 12:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_04"
+down_revision = "20251016_03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "github_project",
+        sa.Column("owner_type", sa.String(length=20), nullable=True),
+    )
+    op.add_column(
+        "github_project",
+        sa.Column("field_mappings_hash", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "github_project",
+        sa.Column("metadata_synced_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("github_project", "metadata_synced_at")
+    op.drop_column("github_project", "field_mappings_hash")
+    op.drop_column("github_project", "owner_type")
@@ -0,0 +1,43 @@
+"""add issue_content_cache table
+
+Revision ID: 20251016_05
+Revises: 20251016_04
+Create Date: 2025-10-16 13:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_05"
+down_revision = "20251016_04"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "issue_content_cache",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("content_node_id", sa.String(length=255), nullable=False),
+        sa.Column("details", sa.LargeBinary(), nullable=True),
+        sa.Column("content_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("details_fetched_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("comments", sa.LargeBinary(), nullable=True),
+        sa.Column("comments_watermark", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("comments_fetched_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("content_node_id", name="uq_issue_content_cache_content_node_id"),
+        sqlite_autoincrement=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("issue_content_cache")
@@ -0,0 +1,70 @@
+"""add item_mutation_outbox table and remote sync status on project_item
+
+Revision ID: 20251016_06
+Revises: 20251016_05
+Create Date: 2025-10-16 14:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_06"
+down_revision = "20251016_05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "project_item",
+        sa.Column("remote_sync_status", sa.String(length=20), nullable=True),
+    )
+    op.add_column(
+        "project_item",
+        sa.Column("remote_sync_error", sa.Text(), nullable=True),
+    )
+
+    op.create_table(
+        "item_mutation_outbox",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("item_node_id", sa.String(length=255), nullable=False),
+        sa.Column("field_id", sa.String(length=255), nullable=False),
+        sa.Column("value", sa.JSON(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False
+        ),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["github_project.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["item_id"], ["project_item.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_item_mutation_outbox_status_next_attempt",
+        "item_mutation_outbox",
+        ["status", "next_attempt_at"],
+    )
+    op.create_index(
+        "ix_item_mutation_outbox_item",
+        "item_mutation_outbox",
+        ["item_id", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_item_mutation_outbox_item", table_name="item_mutation_outbox")
+    op.drop_index("ix_item_mutation_outbox_status_next_attempt", table_name="item_mutation_outbox")
+    op.drop_table("item_mutation_outbox")
+    op.drop_column("project_item", "remote_sync_error")
+    op.drop_column("project_item", "remote_sync_status")
@@ -0,0 +1,84 @@
+"""add status_category to project_item
+
+Revision ID: 20251016_07
+Revises: 20251016_06
+Create Date: 2025-10-16 15:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_07"
+down_revision = "20251016_06"
+branch_labels = None
+depends_on = None
+
+# Cópia congelada de app.utils.status_category na data desta migração: mudanças
+# futuras nas regras não devem alterar o backfill já aplicado
+DONE_STATUS_KEYWORDS = ("done", "concluído", "concluido", "finalizado", "finished", "completo", "completed")
+TODO_STATUS_KEYWORDS = ("todo", "to do", "backlog", "a fazer", "não iniciado", "nao iniciado")
+
+
+def _keyword_category(normalized: str) -> str | None:
+    if any(keyword in normalized for keyword in DONE_STATUS_KEYWORDS):
+        return "done"
+    if any(keyword in normalized for keyword in TODO_STATUS_KEYWORDS):
+        return "todo"
+    return None
+
+
+def _derive_status_category(status: str | None, status_columns: list | None) -> str:
+    normalized = (status or "").strip().lower()
+    if not normalized:
+        return "todo"
+
+    mapping: dict[str, str] = {}
+    columns = [column for column in status_columns or () if isinstance(column, str)]
+    for index, column in enumerate(columns):
+        column_normalized = column.strip().lower()
+        if not column_normalized or column_normalized in mapping:
+            continue
+        category = _keyword_category(column_normalized)
+        if category is None:
+            category = "todo" if index == 0 else "in_progress"
+        mapping[column_normalized] = category
+    return mapping.get(normalized) or _keyword_category(normalized) or "in_progress"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "project_item",
+        sa.Column("status_category", sa.String(length=20), nullable=True),
+    )
+    op.create_index(
+        "ix_project_item_project_status_category",
+        "project_item",
+        ["project_id", "status_category"],
+    )
+
+    # Backfill: uma atualização por (projeto, status distinto)
+    bind = op.get_bind()
+    project_table = sa.table("github_project", sa.column("id", sa.Integer), sa.column("status_columns", sa.JSON))
+    item_table = sa.table(
+        "project_item",
+        sa.column("project_id", sa.Integer),
+        sa.column("status", sa.String),
+        sa.column("status_category", sa.String),
+    )
+    status_columns = dict(bind.execute(sa.select(project_table.c.id, project_table.c.status_columns)).all())
+    pairs = bind.execute(sa.select(item_table.c.project_id, item_table.c.status).distinct()).all()
+    for project_id, status in pairs:
+        category = _derive_status_category(status, status_columns.get(project_id))
+        status_filter = item_table.c.status.is_(None) if status is None else item_table.c.status == status
+        bind.execute(
+            item_table.update()
+            .where(item_table.c.project_id == project_id, status_filter)
+            .values(status_category=category)
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_item_project_status_category", table_name="project_item")
+    op.drop_column("project_item", "status_category")
@@ -0,0 +1,27 @@
+"""add parent_content_node_id to project_item
+
+Revision ID: 20251016_08
+Revises: 20251016_07
+Create Date: 2025-10-16 16:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_08"
+down_revision = "20251016_07"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "project_item",
+        sa.Column("parent_content_node_id", sa.String(length=255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("project_item", "parent_content_node_id")
@@ -0,0 +1,28 @@
+"""add index matching the project item list ordering
+
+Revision ID: 20251016_09
+Revises: 20251016_08
+Create Date: 2025-10-16 17:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_09"
+down_revision = "20251016_08"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_project_item_list_order",
+        "project_item",
+        ["project_id", "start_date", "end_date", sa.text("updated_at DESC NULLS LAST"), "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_item_list_order", table_name="project_item")
@@ -0,0 +1,26 @@
+"""add lease columns to webhook_delivery
+
+Revision ID: 20251016_10
+Revises: 20251016_09
+Create Date: 2025-10-16 18:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_10"
+down_revision = "20251016_09"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("webhook_delivery", sa.Column("lease_token", sa.String(length=36), nullable=True))
+    op.add_column("webhook_delivery", sa.Column("lease_until", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("webhook_delivery", "lease_until")
+    op.drop_column("webhook_delivery", "lease_token")
@@ -0,0 +1,26 @@
+"""add lease columns to item_mutation_outbox
+
+Revision ID: 20251016_11
+Revises: 20251016_10
+Create Date: 2025-10-16 18:30:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251016_11"
+down_revision = "20251016_10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("item_mutation_outbox", sa.Column("lease_token", sa.String(length=36), nullable=True))
+    op.add_column("item_mutation_outbox", sa.Column("lease_until", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("item_mutation_outbox", "lease_until")
+    op.drop_column("item_mutation_outbox", "lease_token")
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
@@ -15,6 +15,7 @@ from app.schemas.github import GithubProjectResponse
 from app.services.github import get_github_token, sync_github_project
 from app.services.scheduler import get_scheduler_status
 from app.services.webhook import WEBHOOK_HANDLERS, verify_webhook_signature
+from app.services.webhook_inbox import enqueue_webhook_delivery, process_webhook_inbox
 
 router = APIRouter(prefix="/github", tags=["github"])
 logger = logging.getLogger("tactyo.api.github")
@@ -23,9 +24,16 @@ logger = logging.getLogger("tactyo.api.github")
 @router.post("/sync/{project_id}")
 async def sync_project(
     project_id: int,
+    full: bool = False,
     db: AsyncSession = Depends(deps.get_db),
     current_user: AppUser = Depends(deps.require_roles("owner", "admin")),
 ) -> dict[str, int]:
+    """
+    Sincroniza o projeto com o GitHub.
+
+    Por padrão o sync é incremental (apenas itens alterados); use `?full=true`
+    para forçar a reconciliação completa.
+    """
     account = await db.get(Account, current_user.account_id) if current_user.account_id else None
     if not account:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Usuário não possui conta")
@@ -35,8 +43,13 @@ async def sync_project(
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Projeto não encontrado")
 
     token = await get_github_token(db, account)
-    count = await sync_github_project(db, account, project, token)
-    return {"synced_items": count}
+    result = await sync_github_project(db, account, project, token, full=full or None)
+    return {
+        "synced_items": result.total,
+        "changed_items": result.changed,
+        "unchanged_items": result.unchanged,
+        "deleted_items": result.deleted,
+    }
 
 
 @router.get("/scheduler/status")
@@ -57,35 +70,47 @@ async def get_scheduler_info(
         "name": "Sincronização automática de projetos GitHub",
         "next_run_time": "2025-10-07T23:30:00",
         "trigger": "cron[minute='*/15']"
-      }]
+      }],
+      "rate_limits": {
+        "<account_id>": {
+          "resources": {"graphql": {"limit": 5000, "remaining": 4210, "reset_at": "2025-10-07T23:41:12+00:00"}},
+          "cooldown_until": null
+        }
+      }
     }
     ```
     """
-    return get_scheduler_status()
+    return get_scheduler_status(current_user.account_id)
 
 
-@router.post("/webhooks")
+@router.post("/webhooks", status_code=status.HTTP_202_ACCEPTED)
 async def receive_github_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(deps.get_db),
     x_hub_signature_256: str | None = Header(None, alias="X-Hub-Signature-256"),
     x_github_event: str | None = Header(None, alias="X-GitHub-Event"),
     x_github_delivery: str | None = Header(None, alias="X-GitHub-Delivery"),
 ) -> dict[str, str]:
     """
-    Recebe e processa webhooks do GitHub.
+    Recebe webhooks do GitHub e os enfileira para processamento.
+
+    A entrega é validada, gravada na fila (`webhook_delivery`) e respondida com
+    202 imediatamente; o processamento roda em background, em ordem por projeto.
+    Redeliveries com o mesmo `X-GitHub-Delivery` são ignoradas.
 
     **Eventos suportados:**
     - `project_v2_item`: Itens adicionados/editados/removidos do projeto
     - `issues`: Issues criadas/editadas/fechadas
     - `pull_request`: PRs criados/editados/merged
+    - `projects_v2`: Projeto editado (força atualização dos campos no próximo sync)
 
     **Configuração no GitHub:**
     1. Vá em Settings → Webhooks → Add webhook
     2. Payload URL: `https://seu-dominio.com/api/github/webhooks`
     3. Content type: `application/json`
     4. Secret: Configure `TACTYO_WEBHOOK_SECRET`
-    5. Events: Selecione `Project cards`, `Issues`, `Pull requests`
+    5. Events: Selecione `Project cards`, `Projects`, `Issues`, `Pull requests`
 
     **Headers esperados:**
     - X-Hub-Signature-256: Assinatura HMAC-SHA256 do payload
@@ -93,7 +118,7 @@ async def receive_github_webhook(
     - X-GitHub-Delivery: ID único da entrega
 
     **Response:**
-    - 200: Webhook processado com sucesso
+    - 202: Webhook enfileirado (ou ignorado/duplicado)
     - 401: Assinatura inválida
     - 400: Evento não suportado ou payload inválido
     """
@@ -149,15 +174,12 @@ async def receive_github_webhook(
         logger.info(f"No handler for event type: {x_github_event}")
         return {"status": "ignored", "reason": f"Event type '{x_github_event}' not supported"}
 
-    # Processar evento
-    try:
-        event_action = payload.get("action", "unknown")
-        await handler(db, event_action, payload)
-
-        logger.info(f"Successfully processed {x_github_event} webhook")
-        return {"status": "processed", "event": x_github_event, "action": event_action}
+    # Enfileirar evento e processar em background
+    event_action = payload.get("action", "unknown")
+    delivery = await enqueue_webhook_delivery(db, x_github_delivery, x_github_event, payload)
+    if delivery is None:
+        logger.info(f"Duplicate webhook delivery {x_github_delivery}, ignoring")
+        return {"status": "duplicate", "event": x_github_event, "action": event_action}
 
-    except Exception as e:
-        logger.error(f"Error processing webhook: {e}", exc_info=True)
-        # Retornar 200 para evitar redelivery do GitHub
-        return {"status": "error", "message": str(e)}
+    background_tasks.add_task(process_webhook_inbox)
+    return {"status": "queued", "event": x_github_event, "action": event_action}
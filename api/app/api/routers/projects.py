@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 from collections import defaultdict
+from datetime import datetime
 from decimal import Decimal
 from typing import Any, Iterable
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Header
-from sqlalchemy import select, delete
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status, Response, Header
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy import Select, and_, func, literal_column, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
@@ -19,6 +25,7 @@ from app.models.project_repository import ProjectRepository
 from app.models.user import AppUser
 from app.services.email import send_project_invite_email
 from app.core.security import generate_verification_token
+from app.utils.status_category import STATUS_CATEGORY_DONE
 from app.schemas.github import (
     GithubProjectResponse,
     EpicDashboardResponse,
@@ -35,9 +42,13 @@ from app.schemas.github import (
     IterationOptionResponse,
     IterationSummaryResponse,
     ProjectItemAuthorResponse,
+    ProjectItemBulkUpdateRequest,
+    ProjectItemBulkUpdateResponse,
+    ProjectItemBulkUpdateResult,
     ProjectItemCommentResponse,
     ProjectItemDetailResponse,
     ProjectItemLabelResponse,
+    ProjectItemPartialResponse,
     ProjectItemResponse,
     ProjectItemUpdateRequest,
     StatusBreakdownEntry,
@@ -57,30 +68,31 @@ from app.schemas.repository import (
     ProjectRepositoryCreateRequest,
     ProjectRepositoryUpdateRequest,
 )
-from app.schemas.hierarchy import (
-    HierarchyResponse,
-    HierarchyEpicResponse,
-    HierarchyItemResponse,
-)
+from app.schemas.hierarchy import HierarchyResponse
 from app.services.github import (
+    EDITABLE_ITEM_FIELDS,
+    EpicOptionData,
     GithubGraphQLClient,
     apply_local_project_item_updates,
+    bulk_update_project_items,
     create_epic_issue,
     create_story_issue,
-    fetch_project_item_comments,
-    fetch_project_item_details,
+    fetch_project_item_details_batch,
     get_github_token,
     list_epic_options,
     list_iteration_options,
     parse_datetime,
+    recategorize_project_items,
     setup_project_fields,
-    update_item_iteration,
     # New label-based epic functions
     create_epic_label,
     update_epic_label,
     delete_epic_label,
     list_epic_labels,
 )
+from app.services.hierarchy import build_hierarchy, hierarchy_response, iter_hierarchy_ndjson, load_hierarchy_nodes
+from app.services.issue_content import get_issue_comments, get_issue_details
+from app.services.item_outbox import process_item_outbox
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -225,16 +237,100 @@ async def get_current_project(
     return GithubProjectResponse.model_validate(project)
 
 
-@router.get("/current/items", response_model=list[ProjectItemResponse])
+# Ordem da listagem de itens; o id desempata para a paginação por cursor
+ITEM_LIST_ORDER = (
+    (ProjectItem.start_date, "asc"),
+    (ProjectItem.end_date, "asc"),
+    (ProjectItem.updated_at, "desc"),
+    (ProjectItem.id, "asc"),
+)
+ITEM_LIST_DEFAULT_PAGE_SIZE = 200
+ITEM_LIST_MAX_PAGE_SIZE = 1000
+ITEM_LIST_FIELDS = tuple(ProjectItemResponse.model_fields)
+
+
+def _encode_items_cursor(values: Iterable[Any]) -> str:
+    raw = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(raw).encode("utf-8")).decode("ascii")
+
+
+def _decode_items_cursor(cursor: str) -> list[Any]:
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(raw, list) or len(raw) != len(ITEM_LIST_ORDER):
+            raise ValueError("tamanho inválido")
+        *dates, item_id = raw
+        return [datetime.fromisoformat(value) if value is not None else None for value in dates] + [int(item_id)]
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Cursor inválido") from exc
+
+
+def _items_after_cursor(values: list[Any]) -> Any:
+    """
+    Condição de keyset: linhas estritamente depois de `values` em `ITEM_LIST_ORDER`.
+
+    Com NULLS LAST, depois de um valor vêm os maiores (ou menores, em desc) e os
+    nulos; depois de um nulo só os empates, decididos pelas colunas seguintes.
+    """
+    conditions = []
+    equal_prefix = []
+    for (column, direction), value in zip(ITEM_LIST_ORDER, values):
+        if value is None:
+            equal_prefix.append(column.is_(None))
+            continue
+        after = column > value if direction == "asc" else column < value
+        conditions.append(and_(*equal_prefix, or_(after, column.is_(None))))
+        equal_prefix.append(column == value)
+    return or_(*conditions)
+
+
+def _item_list_columns(fields: str | None, include_field_values: bool) -> list[str]:
+    if fields is None:
+        selected = list(ITEM_LIST_FIELDS)
+    else:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in ITEM_LIST_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Campos desconhecidos: {', '.join(unknown)}",
+            )
+        selected = [name for name in ITEM_LIST_FIELDS if name == "id" or name in requested]
+    if not include_field_values:
+        selected = [name for name in selected if name != "field_values"]
+    return selected
+
+
+@router.get(
+    "/current/items",
+    response_model=None,
+    response_class=JSONResponse,
+    responses={
+        200: {
+            "model": list[ProjectItemPartialResponse],
+            "description": "Itens do projeto; com `fields` cada item traz só os campos pedidos (e `id`)",
+            "headers": {
+                "X-Next-Cursor": {
+                    "description": "Cursor da próxima página (ausente na última página ou sem paginação)",
+                    "schema": {"type": "string"},
+                }
+            },
+        }
+    },
+)
 async def list_current_project_items(
     status: str | None = None,
     iteration: str | None = None,
     epic: str | None = None,
     search: str | None = None,
+    limit: int | None = Query(None, ge=1, le=ITEM_LIST_MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+    include_field_values: bool = True,
     db: AsyncSession = Depends(deps.get_db),
     current_user: AppUser = Depends(deps.get_current_user),
     x_project_id: int | None = Header(None, alias="X-Project-Id"),
-) -> list[ProjectItemResponse]:
+) -> Response:
     """
     Lista itens do projeto atual com filtros opcionais.
 
@@ -243,11 +339,21 @@ async def list_current_project_items(
     - `iteration`: Filtrar por sprint/iteration
     - `epic`: Filtrar por epic
     - `search`: Buscar no título
+
+    **Paginação (opcional):** com `limit` e/ou `cursor` a resposta traz uma página
+    (padrão de 200 itens) e, se houver mais, o header `X-Next-Cursor` com o
+    cursor da próxima. Sem eles, todos os itens são retornados.
+
+    **Campos:** `fields=id,title,status` devolve só essas colunas (o `id` sempre
+    vem) e `include_field_values=false` omite o JSON `field_values`.
     """
     account = await _get_account_or_404(db, current_user)
     project = await _get_project_or_404(db, account, x_project_id)
 
-    stmt = select(ProjectItem).where(ProjectItem.project_id == project.id)
+    selected = _item_list_columns(fields, include_field_values)
+    order_names = [column.key for column, _ in ITEM_LIST_ORDER]
+    column_names = selected + [name for name in order_names if name not in selected]
+    stmt = select(*(getattr(ProjectItem, name) for name in column_names)).where(ProjectItem.project_id == project.id)
 
     # Aplicar filtros
     if status:
@@ -255,26 +361,99 @@ async def list_current_project_items(
     if iteration:
         stmt = stmt.where(ProjectItem.iteration == iteration)
     if epic:
-        stmt = stmt.where(ProjectItem.epic == epic)
+        stmt = stmt.where(ProjectItem.epic_name == epic)
     if search:
         stmt = stmt.where(ProjectItem.title.ilike(f"%{search}%"))
 
     # Ordenação
     stmt = stmt.order_by(
-        ProjectItem.start_date.asc().nulls_last(),
-        ProjectItem.end_date.asc().nulls_last(),
-        ProjectItem.updated_at.desc().nullslast(),
+        *(
+            (column.asc() if direction == "asc" else column.desc()).nulls_last()
+            for column, direction in ITEM_LIST_ORDER
+        )
     )
 
-    result = await db.execute(stmt)
-    items = result.scalars().all()
-    return [ProjectItemResponse.model_validate(item) for item in items]
+    page_size = limit or (ITEM_LIST_DEFAULT_PAGE_SIZE if cursor else None)
+    if cursor:
+        stmt = stmt.where(_items_after_cursor(_decode_items_cursor(cursor)))
+    if page_size:
+        stmt = stmt.limit(page_size + 1)
+
+    rows = (await db.execute(stmt)).all()
+    headers: dict[str, str] = {}
+    if page_size and len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]._mapping
+        headers["X-Next-Cursor"] = _encode_items_cursor(last[name] for name in order_names)
+
+    items = []
+    for row in rows:
+        mapping = row._mapping
+        item = {name: mapping[name] for name in selected}
+        if "estimate" in item and item["estimate"] is not None:
+            item["estimate"] = float(item["estimate"])
+        if "assignees" in item and item["assignees"] is None:
+            item["assignees"] = []
+        items.append(item)
+
+    return Response(content=to_json(items), media_type="application/json", headers=headers)
+
+
+@router.post("/current/items/bulk", response_model=ProjectItemBulkUpdateResponse)
+async def bulk_update_items(
+    payload: ProjectItemBulkUpdateRequest,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: AppUser = Depends(deps.require_roles("owner", "admin")),
+    x_project_id: int | None = Header(None, alias="X-Project-Id"),
+) -> ProjectItemBulkUpdateResponse:
+    """
+    Atualiza vários itens (sprint, status, épico, datas) de uma vez.
+
+    As alterações são validadas localmente, enviadas ao GitHub em poucos
+    documentos de mutations e gravadas numa única transação. Cada item tem seu
+    próprio resultado: falhas de um item não impedem os demais.
+    """
+    account = await _get_account_or_404(db, current_user)
+    project = await _get_project_or_404(db, account, x_project_id)
+
+    entries = [
+        (entry.id, entry.model_dump(exclude_unset=True, exclude={"id"}))
+        for entry in payload.items
+    ]
+    results = await bulk_update_project_items(db, account, project, entries, current_user.id)
+    await db.commit()
+
+    updated_ids = [result.item_id for result in results if result.item is not None]
+    refreshed: dict[int, ProjectItem] = {}
+    if updated_ids:
+        stmt = (
+            select(ProjectItem)
+            .where(ProjectItem.id.in_(updated_ids))
+            .execution_options(populate_existing=True)
+        )
+        refreshed = {item.id: item for item in (await db.execute(stmt)).scalars().all()}
+
+    responses = [
+        ProjectItemBulkUpdateResult(
+            id=result.item_id,
+            success=result.error is None,
+            error=result.error,
+            item=ProjectItemResponse.model_validate(refreshed[result.item_id]) if result.item is not None else None,
+        )
+        for result in results
+    ]
+    return ProjectItemBulkUpdateResponse(
+        updated=sum(1 for response in responses if response.success),
+        failed=sum(1 for response in responses if not response.success),
+        results=responses,
+    )
 
 
 @router.patch("/current/items/{item_id}", response_model=ProjectItemResponse)
 async def update_project_item(
     item_id: int,
     payload: ProjectItemUpdateRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(deps.get_db),
     current_user: AppUser = Depends(deps.require_roles("owner", "admin")),
     x_project_id: int | None = Header(None, alias="X-Project-Id"),
@@ -295,21 +474,7 @@ async def update_project_item(
             detail="O item foi atualizado no GitHub recentemente. Recarregue e tente novamente.",
         )
 
-    updates = {
-        key: value
-        for key, value in data.items()
-        if key
-        in {
-            "start_date",
-            "end_date",
-            "due_date",
-            "iteration_id",
-            "iteration_title",
-            "status",
-            "epic_option_id",
-            "epic_name",
-        }
-    }
+    updates = {key: value for key, value in data.items() if key in EDITABLE_ITEM_FIELDS}
 
     if not updates:
         raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Nenhuma alteração informada")
@@ -317,12 +482,16 @@ async def update_project_item(
     await apply_local_project_item_updates(db, account, project, item, updates, current_user.id)
     await db.commit()
     await db.refresh(item)
+    if item.remote_sync_status == "pending":
+        # Modo write-behind: envia o outbox logo após a resposta
+        background_tasks.add_task(process_item_outbox)
     return ProjectItemResponse.model_validate(item)
 
 
 @router.get("/current/items/{item_id}/comments", response_model=list[ProjectItemCommentResponse])
 async def list_project_item_comments(
     item_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(deps.get_db),
     current_user: AppUser = Depends(deps.get_current_user),
     x_project_id: int | None = Header(None, alias="X-Project-Id"),
@@ -339,8 +508,7 @@ async def list_project_item_comments(
 
     token = await get_github_token(db, account)
 
-    async with GithubGraphQLClient(token) as client:
-        raw_comments = await fetch_project_item_comments(client, item.content_node_id)
+    raw_comments = await get_issue_comments(db, token, item.content_node_id, background_tasks)
 
     comments: list[ProjectItemCommentResponse] = []
     for comment in raw_comments:
@@ -368,6 +536,7 @@ async def list_project_item_comments(
 @router.get("/current/items/{item_id}/details", response_model=ProjectItemDetailResponse)
 async def get_project_item_details(
     item_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(deps.get_db),
     current_user: AppUser = Depends(deps.get_current_user),
     x_project_id: int | None = Header(None, alias="X-Project-Id"),
@@ -384,8 +553,7 @@ async def get_project_item_details(
 
     token = await get_github_token(db, account)
 
-    async with GithubGraphQLClient(token) as client:
-        details_raw = await fetch_project_item_details(client, item.content_node_id)
+    details_raw = await get_issue_details(db, token, item.content_node_id, background_tasks)
 
     if not details_raw:
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Detalhes não encontrados no GitHub")
@@ -447,6 +615,7 @@ async def update_status_columns(
 
     cleaned.append("Done")
     project.status_columns = cleaned
+    await recategorize_project_items(db, project)
     await db.commit()
     await db.refresh(project)
     return cleaned
@@ -459,15 +628,6 @@ def _normalize_status(value: str | None) -> str | None:
     return normalized if normalized else None
 
 
-def _status_is_done(status: str | None, done_keywords: Iterable[str]) -> bool:
-    if not status:
-        return False
-    normalized = status.strip().lower()
-    if not normalized:
-        return False
-    return any(keyword in normalized for keyword in done_keywords)
-
-
 def _safe_float(value: Any) -> float:
     if value is None:
         return 0.0
@@ -481,6 +641,90 @@ def _safe_float(value: Any) -> float:
         return 0.0
 
 
+def _status_aggregate_query(project_id: int, group_column: Any, *extra_columns: Any) -> Select:
+    """
+    Contagem e soma de estimativas por (`group_column`, status normalizado, categoria).
+
+    O banco devolve só uma linha por grupo/status, então o custo no Python
+    depende do número de sprints/épicos e status, não do número de itens.
+    """
+    # Literal inline: com bind params o Postgres não reconhece a expressão do SELECT no GROUP BY
+    empty = literal_column("''")
+    group_key = func.nullif(group_column, empty)
+    status_label = func.nullif(func.trim(ProjectItem.status), empty)
+    return (
+        select(
+            group_key.label("group_key"),
+            status_label.label("status"),
+            ProjectItem.status_category,
+            func.count().label("item_count"),
+            func.coalesce(func.sum(ProjectItem.estimate), 0).label("total_estimate"),
+            *extra_columns,
+        )
+        .where(ProjectItem.project_id == project_id)
+        .group_by(group_key, status_label, ProjectItem.status_category)
+    )
+
+
+def _new_summary_bucket(group_key: str | None) -> dict[str, Any]:
+    return {
+        "group_key": group_key,
+        "name": None,
+        "start_date": None,
+        "end_date": None,
+        "item_count": 0,
+        "completed_count": 0,
+        "total_estimate": 0.0,
+        "completed_estimate": 0.0,
+        "status_breakdown": defaultdict(lambda: {"count": 0, "estimate": 0.0}),
+    }
+
+
+def _fold_status_rows(rows: Iterable[Any]) -> list[dict[str, Any]]:
+    """Junta as linhas (grupo, status) de `_status_aggregate_query` em um bucket por grupo."""
+    buckets: dict[str | None, dict[str, Any]] = {}
+    for row in rows:
+        bucket = buckets.get(row.group_key)
+        if bucket is None:
+            bucket = buckets[row.group_key] = _new_summary_bucket(row.group_key)
+
+        count = int(row.item_count or 0)
+        estimate_value = _safe_float(row.total_estimate)
+        bucket["item_count"] += count
+        bucket["total_estimate"] += estimate_value
+
+        status_bucket = bucket["status_breakdown"][row.status]
+        status_bucket["count"] += count
+        status_bucket["estimate"] += estimate_value
+
+        if row.status_category == STATUS_CATEGORY_DONE:
+            bucket["completed_count"] += count
+            bucket["completed_estimate"] += estimate_value
+
+        mapping = row._mapping
+        name = mapping.get("name")
+        if name and (bucket["name"] is None or name < bucket["name"]):
+            bucket["name"] = name
+        start_date = mapping.get("start_date")
+        if start_date and (bucket["start_date"] is None or start_date < bucket["start_date"]):
+            bucket["start_date"] = start_date
+        end_date = mapping.get("end_date")
+        if end_date and (bucket["end_date"] is None or end_date > bucket["end_date"]):
+            bucket["end_date"] = end_date
+    return list(buckets.values())
+
+
+def _status_breakdown_entries(bucket: dict[str, Any]) -> list[StatusBreakdownEntry]:
+    return [
+        StatusBreakdownEntry(
+            status=status,
+            count=entry["count"],
+            total_estimate=round(entry["estimate"], 2) if entry["estimate"] else 0.0,
+        )
+        for status, entry in sorted(bucket["status_breakdown"].items(), key=lambda pair: pair[0] or "zzzz")
+    ]
+
+
 @router.get("/current/setup/status")
 async def get_setup_status(
     db: AsyncSession = Depends(deps.get_db),
@@ -619,22 +863,10 @@ async def get_iteration_dashboard(
     account = await _get_account_or_404(db, current_user)
     project = await _get_project_or_404(db, account, x_project_id)
 
-    stmt = select(ProjectItem).where(ProjectItem.project_id == project.id)
-    result = await db.execute(stmt)
-    items = list(result.scalars().all())
+    rows = (await db.execute(_iteration_aggregate_query(project.id))).all()
 
     options = await list_iteration_options(db, project)
-    done_keywords = {
-        "done",
-        "concluído",
-        "concluido",
-        "finalizado",
-        "finished",
-        "completo",
-        "completed",
-    }
-
-    summaries = _build_iteration_summaries(items, done_keywords)
+    summaries = _build_iteration_summaries(rows)
 
     option_responses = [
         IterationOptionResponse(
@@ -649,160 +881,31 @@ async def get_iteration_dashboard(
     return IterationDashboardResponse(summaries=summaries, options=option_responses)
 
 
-@router.patch("/current/items/{item_id}", response_model=ProjectItemResponse)
-async def update_project_item(
-    item_id: int,
-    request_data: ProjectItemUpdateRequest,
-    db: AsyncSession = Depends(deps.get_db),
-    current_user: AppUser = Depends(deps.require_roles("pm", "admin", "owner")),
-) -> ProjectItemResponse:
-    """
-    Atualiza um item do projeto (issue/PR/draft).
-
-    **Permissão:** pm, admin, owner
-
-    **Campos atualizáveis:**
-    - `iteration_id`: ID da sprint/iteration (ou null para remover)
-    - `status`: Status do item
-    - `epic_option_id`: ID do epic
-    - `start_date`, `end_date`, `due_date`: Datas customizadas
-
-    **Exemplo de Request:**
-    ```json
-    {
-      "iteration_id": "PVTIF_lADOBz...",
-      "status": "In Progress"
-    }
-    ```
-    """
-    account = await _get_account_or_404(db, current_user)
-    project = await _get_project_or_404(db, account, x_project_id)
-
-    item = await db.get(ProjectItem, item_id)
-    if not item or item.project_id != project.id:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Item não encontrado")
-
-    # Atualizar iteration se fornecida
-    if hasattr(request_data, "iteration_id") and request_data.iteration_id is not None:
-        item = await update_item_iteration(
-            db,
-            account,
-            project,
-            item,
-            request_data.iteration_id if request_data.iteration_id else None,
-        )
-
-    # Aplicar outras atualizações (status, datas, etc)
-    updates = {}
-    if request_data.status is not None:
-        updates["status"] = request_data.status
-    if request_data.start_date is not None:
-        updates["start_date"] = request_data.start_date
-    if request_data.end_date is not None:
-        updates["end_date"] = request_data.end_date
-    if request_data.due_date is not None:
-        updates["due_date"] = request_data.due_date
-    if request_data.epic_option_id is not None:
-        updates["epic_option_id"] = request_data.epic_option_id
-    if request_data.epic_name is not None:
-        updates["epic_name"] = request_data.epic_name
-
-    if updates:
-        item = await apply_local_project_item_updates(
-            db,
-            account,
-            project,
-            item,
-            updates,
-            current_user.id,
-        )
-
-    await db.commit()
-    await db.refresh(item)
-
-    return ProjectItemResponse.model_validate(item)
-
-
-def _build_iteration_summaries(
-    items: list[ProjectItem],
-    done_keywords: Iterable[str],
-) -> list[IterationSummaryResponse]:
-    buckets: dict[str, dict[str, Any]] = {}
-
-    for item in items:
-        key = item.iteration_id or "__without_iteration__"
-        bucket = buckets.get(key)
-        if not bucket:
-            bucket = {
-                "iteration_id": item.iteration_id,
-                "name": _normalize_status(item.iteration) or None,
-                "start_date": item.iteration_start,
-                "end_date": item.iteration_end,
-                "item_count": 0,
-                "completed_count": 0,
-                "total_estimate": 0.0,
-                "completed_estimate": 0.0,
-                "status_breakdown": defaultdict(lambda: {"count": 0, "estimate": 0.0}),
-            }
-            buckets[key] = bucket
-
-        estimate_value = _safe_float(item.estimate)
-        bucket["item_count"] += 1
-        bucket["total_estimate"] += estimate_value
-
-        status_label = _normalize_status(item.status)
-        status_key = status_label if status_label is not None else None
-        status_bucket = bucket["status_breakdown"][status_key]
-        status_bucket["count"] += 1
-        status_bucket["estimate"] += estimate_value
+def _iteration_aggregate_query(project_id: int) -> Select:
+    return _status_aggregate_query(
+        project_id,
+        ProjectItem.iteration_id,
+        func.min(func.nullif(func.trim(ProjectItem.iteration), "")).label("name"),
+        func.min(ProjectItem.iteration_start).label("start_date"),
+        func.max(ProjectItem.iteration_end).label("end_date"),
+    )
 
-        if _status_is_done(status_label, done_keywords):
-            bucket["completed_count"] += 1
-            bucket["completed_estimate"] += estimate_value
 
-        if item.iteration_start and (
-            bucket["start_date"] is None or item.iteration_start < bucket["start_date"]
-        ):
-            bucket["start_date"] = item.iteration_start
-        if item.iteration_end and (
-            bucket["end_date"] is None or item.iteration_end > bucket["end_date"]
-        ):
-            bucket["end_date"] = item.iteration_end
-        if item.iteration and not bucket["name"]:
-            bucket["name"] = _normalize_status(item.iteration)
-
-    summaries: list[IterationSummaryResponse] = []
-    for key, bucket in buckets.items():
-        status_breakdown = [
-            StatusBreakdownEntry(
-                status=status,
-                count=entry["count"],
-                total_estimate=round(entry["estimate"], 2) if entry["estimate"] else 0.0,
-            )
-            for status, entry in sorted(
-                bucket["status_breakdown"].items(), key=lambda pair: pair[0] or "zzzz"
-            )
-        ]
-
-        name = bucket["name"]
-        if not name:
-            name = "Sem sprint"
-
-        summaries.append(
-            IterationSummaryResponse(
-                iteration_id=None if key == "__without_iteration__" else bucket["iteration_id"],
-                name=name,
-                start_date=bucket["start_date"],
-                end_date=bucket["end_date"],
-                item_count=bucket["item_count"],
-                completed_count=bucket["completed_count"],
-                total_estimate=round(bucket["total_estimate"], 2) if bucket["total_estimate"] else 0.0,
-                completed_estimate=round(bucket["completed_estimate"], 2)
-                if bucket["completed_estimate"]
-                else 0.0,
-                status_breakdown=status_breakdown,
-            )
+def _build_iteration_summaries(rows: Iterable[Any]) -> list[IterationSummaryResponse]:
+    summaries = [
+        IterationSummaryResponse(
+            iteration_id=bucket["group_key"],
+            name=bucket["name"] or "Sem sprint",
+            start_date=bucket["start_date"],
+            end_date=bucket["end_date"],
+            item_count=bucket["item_count"],
+            completed_count=bucket["completed_count"],
+            total_estimate=round(bucket["total_estimate"], 2) if bucket["total_estimate"] else 0.0,
+            completed_estimate=round(bucket["completed_estimate"], 2) if bucket["completed_estimate"] else 0.0,
+            status_breakdown=_status_breakdown_entries(bucket),
         )
+        for bucket in _fold_status_rows(rows)
+    ]
 
     summaries.sort(
         key=lambda summary: (
@@ -823,23 +926,11 @@ async def get_epic_dashboard(
     account = await _get_account_or_404(db, current_user)
     project = await _get_project_or_404(db, account, x_project_id)
 
-    stmt = select(ProjectItem).where(ProjectItem.project_id == project.id)
-    result = await db.execute(stmt)
-    items = list(result.scalars().all())
+    rows = (await db.execute(_epic_aggregate_query(project.id))).all()
 
     # Use list_epic_labels (from database) instead of list_epic_options (from GitHub)
     options = await list_epic_labels(db, project)
-    done_keywords = {
-        "done",
-        "concluído",
-        "concluido",
-        "finalizado",
-        "finished",
-        "completo",
-        "completed",
-    }
-
-    summaries = _build_epic_summaries(items, done_keywords)
+    summaries = _build_epic_summaries(rows)
 
     option_responses = [
         EpicOptionResponse(
@@ -854,68 +945,27 @@ async def get_epic_dashboard(
     return EpicDashboardResponse(summaries=summaries, options=option_responses)
 
 
-def _build_epic_summaries(items: list[ProjectItem], done_keywords: Iterable[str]) -> list[EpicSummaryResponse]:
-    buckets: dict[str, dict[str, Any]] = {}
-
-    for item in items:
-        key = item.epic_option_id or "__without_epic__"
-        bucket = buckets.get(key)
-        if not bucket:
-            bucket = {
-                "epic_option_id": item.epic_option_id,
-                "name": _normalize_status(item.epic_name) or None,
-                "item_count": 0,
-                "completed_count": 0,
-                "total_estimate": 0.0,
-                "completed_estimate": 0.0,
-                "status_breakdown": defaultdict(lambda: {"count": 0, "estimate": 0.0}),
-            }
-            buckets[key] = bucket
-
-        estimate_value = _safe_float(item.estimate)
-        bucket["item_count"] += 1
-        bucket["total_estimate"] += estimate_value
-
-        status_label = _normalize_status(item.status)
-        status_bucket = bucket["status_breakdown"][status_label if status_label is not None else None]
-        status_bucket["count"] += 1
-        status_bucket["estimate"] += estimate_value
-
-        if _status_is_done(status_label, done_keywords):
-            bucket["completed_count"] += 1
-            bucket["completed_estimate"] += estimate_value
+def _epic_aggregate_query(project_id: int) -> Select:
+    return _status_aggregate_query(
+        project_id,
+        ProjectItem.epic_option_id,
+        func.min(func.nullif(func.trim(ProjectItem.epic_name), "")).label("name"),
+    )
 
-        if item.epic_name and not bucket["name"]:
-            bucket["name"] = _normalize_status(item.epic_name)
 
-    summaries: list[EpicSummaryResponse] = []
-    for key, bucket in buckets.items():
-        status_breakdown = [
-            StatusBreakdownEntry(
-                status=status,
-                count=entry["count"],
-                total_estimate=round(entry["estimate"], 2) if entry["estimate"] else 0.0,
-            )
-            for status, entry in sorted(
-                bucket["status_breakdown"].items(), key=lambda pair: pair[0] or "zzzz"
-            )
-        ]
-
-        name = bucket["name"] or "Sem épico"
-
-        summaries.append(
-            EpicSummaryResponse(
-                epic_option_id=None if key == "__without_epic__" else bucket["epic_option_id"],
-                name=name,
-                item_count=bucket["item_count"],
-                completed_count=bucket["completed_count"],
-                total_estimate=round(bucket["total_estimate"], 2) if bucket["total_estimate"] else 0.0,
-                completed_estimate=round(bucket["completed_estimate"], 2)
-                if bucket["completed_estimate"]
-                else 0.0,
-                status_breakdown=status_breakdown,
-            )
+def _build_epic_summaries(rows: Iterable[Any]) -> list[EpicSummaryResponse]:
+    summaries = [
+        EpicSummaryResponse(
+            epic_option_id=bucket["group_key"],
+            name=bucket["name"] or "Sem épico",
+            item_count=bucket["item_count"],
+            completed_count=bucket["completed_count"],
+            total_estimate=round(bucket["total_estimate"], 2) if bucket["total_estimate"] else 0.0,
+            completed_estimate=round(bucket["completed_estimate"], 2) if bucket["completed_estimate"] else 0.0,
+            status_breakdown=_status_breakdown_entries(bucket),
         )
+        for bucket in _fold_status_rows(rows)
+    ]
 
     summaries.sort(key=lambda summary: summary.name)
     return summaries
@@ -939,18 +989,20 @@ async def list_epics(
     # Identificar quais são épicos (título contém "EPIC:" ou "epic:")
     epic_items = [item for item in all_items if item.title and "epic:" in item.title.lower()]
 
-    # Buscar detalhes de cada épico e calcular progresso
+    # Buscar detalhes de todos os épicos em lote (nodes(ids: [...])) e calcular progresso
     epics: list[EpicDetailResponse] = []
-    token = await get_github_token(db, account)
+    details_by_content: dict[str, dict[str, Any]] = {}
+    content_node_ids = [item.content_node_id for item in epic_items if item.content_node_id]
+    if content_node_ids:
+        token = await get_github_token(db, account)
+        async with GithubGraphQLClient(token) as client:
+            details_by_content = await fetch_project_item_details_batch(client, content_node_ids)
+
+    # Opções do campo Epic resolvidas uma única vez
+    options: list[EpicOptionData] | None = None
 
     for epic_item in epic_items:
-        # Buscar detalhes da issue épica
-        epic_details = None
-        if epic_item.content_node_id:
-            async with GithubGraphQLClient(token) as client:
-                details_raw = await fetch_project_item_details(client, epic_item.content_node_id)
-                if details_raw:
-                    epic_details = details_raw
+        epic_details = details_by_content.get(epic_item.content_node_id) if epic_item.content_node_id else None
 
         # Encontrar opção Epic que corresponde a este épico
         epic_option_id = epic_item.epic_option_id
@@ -961,7 +1013,8 @@ async def list_epics(
             # Extrair nome do épico do título (remove "EPIC:" e emoji)
             title_clean = epic_item.title.replace("EPIC:", "").replace("epic:", "").strip()
             # Buscar opção que tenha nome similar
-            options = await list_epic_options(db, project)
+            if options is None:
+                options = await list_epic_options(db, project)
             for option in options:
                 if option.name and option.name.lower() in title_clean.lower():
                     epic_option_id = option.id
@@ -974,11 +1027,7 @@ async def list_epics(
             if item.epic_option_id == epic_option_id and item.id != epic_item.id
         ] if epic_option_id else []
 
-        done_keywords = {"done", "concluído", "concluido", "finalizado", "finished", "completo", "completed"}
-        completed_issues = [
-            item for item in linked_issues
-            if item.status and any(kw in item.status.lower() for kw in done_keywords)
-        ]
+        completed_issues = [item for item in linked_issues if item.status_category == STATUS_CATEGORY_DONE]
 
         total_estimate = sum(_safe_float(item.estimate) for item in linked_issues)
         completed_estimate = sum(_safe_float(item.estimate) for item in completed_issues)
@@ -2070,7 +2119,8 @@ async def get_project_hierarchy(
     project_id: int,
     db: AsyncSession = Depends(deps.get_db),
     current_user: AppUser = Depends(deps.get_current_user),
-) -> HierarchyResponse:
+    accept: str | None = Header(None),
+) -> HierarchyResponse | StreamingResponse:
     """
     Retorna a hierarquia completa do projeto (épicos > histórias > tarefas).
 
@@ -2079,94 +2129,17 @@ async def get_project_hierarchy(
     - Relacionamentos pai-filho (campo parent_item_id)
     - Tipo de item (item_type derivado de labels)
 
-    Retorna items agrupados por épico, com estrutura aninhada de histórias e tarefas.
+    Retorna items agrupados por épico, com estrutura aninhada de histórias e tarefas
+    e os totais (itens, concluídos, estimativas) de cada subárvore e épico.
+
+    Com `Accept: application/x-ndjson` a resposta é transmitida em NDJSON, uma
+    linha por épico/item (ver `iter_hierarchy_ndjson`), para projetos grandes.
     """
     account = await _get_account_or_404(db, current_user)
     project = await _get_project_or_404(db, account, project_id)
 
-    # Load all project items
-    stmt = (
-        select(ProjectItem)
-        .where(ProjectItem.project_id == project.id)
-        .order_by(ProjectItem.title)
-    )
-    result = await db.execute(stmt)
-    all_items = result.scalars().all()
-
-    # Build item lookup map
-    items_by_id = {item.id: item for item in all_items}
-
-    # Helper function to build item tree recursively
-    def build_item_response(item: ProjectItem, visited: set[int]) -> HierarchyItemResponse:
-        """Build hierarchical item response with children."""
-        if item.id in visited:
-            # Prevent circular references
-            return HierarchyItemResponse(
-                id=item.id,
-                item_node_id=item.item_node_id,
-                title=item.title,
-                item_type=item.item_type,
-                status=item.status,
-                epic_name=item.epic_name,
-                parent_item_id=item.parent_item_id,
-                labels=item.labels,
-                children=[]
-            )
-
-        visited.add(item.id)
-
-        # Find children
-        children = [
-            build_item_response(child, visited)
-            for child in all_items
-            if child.parent_item_id == item.id
-        ]
-
-        return HierarchyItemResponse(
-            id=item.id,
-            item_node_id=item.item_node_id,
-            title=item.title,
-            item_type=item.item_type,
-            status=item.status,
-            epic_name=item.epic_name,
-            parent_item_id=item.parent_item_id,
-            labels=item.labels,
-            children=children
-        )
-
-    # Group items by epic
-    epics_map: dict[str | None, list[ProjectItem]] = defaultdict(list)
-    root_items = []  # Items with no parent
-
-    for item in all_items:
-        if item.parent_item_id is None:
-            root_items.append(item)
-
-    # Group root items by epic
-    for item in root_items:
-        epic_key = item.epic_option_id or item.epic_name
-        epics_map[epic_key].append(item)
-
-    # Build response
-    epics = []
-    orphans = []
-
-    for epic_key, items in epics_map.items():
-        visited: set[int] = set()
-        items_tree = [build_item_response(item, visited) for item in items]
-
-        if epic_key is None:
-            # Items without epic
-            orphans.extend(items_tree)
-        else:
-            # Items with epic
-            epic_name = items[0].epic_name if items else None
-            epics.append(
-                HierarchyEpicResponse(
-                    epic_option_id=epic_key,
-                    epic_name=epic_name,
-                    items=items_tree
-                )
-            )
+    groups = build_hierarchy(await load_hierarchy_nodes(db, project.id))
 
-    return HierarchyResponse(epics=epics, orphans=orphans)
+    if accept and "application/x-ndjson" in accept:
+        return StreamingResponse(iter_hierarchy_ndjson(groups), media_type="application/x-ndjson")
+    return hierarchy_response(groups)
@@ -94,6 +94,117 @@ class Settings(BaseSettings):
     # Frontend URL for email links
     frontend_url: str = Field(default="http://localhost:5173")
 
+    # GitHub sync
+    github_full_sync_interval_minutes: int = Field(
+        default=360,
+        description="Intervalo mínimo entre reconciliações completas de um projeto (demais syncs são incrementais)",
+    )
+    github_metadata_refresh_minutes: int = Field(
+        default=60,
+        description="Intervalo entre atualizações dos metadados de campos do projeto durante o sync",
+    )
+
+    github_sync_max_concurrency: int = Field(
+        default=8,
+        description="Máximo de projetos sincronizados em paralelo pelo scheduler",
+    )
+    github_sync_account_concurrency: int = Field(
+        default=2,
+        description="Máximo de projetos da mesma conta sincronizados em paralelo pelo scheduler",
+    )
+
+    github_item_query_max_nodes: int = Field(
+        default=5000,
+        description="Orçamento de nós por página da consulta de itens (define o tamanho inicial da página)",
+    )
+
+    github_field_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Validade do índice de campos do projeto em memória (refeito antes se o field_mappings_hash mudar)",
+    )
+    issue_content_ttl_seconds: int = Field(
+        default=300,
+        description="Tempo em que corpo e comentários guardados de uma issue são servidos sem atualização",
+    )
+
+    github_write_behind: bool = Field(
+        default=False,
+        description="Responder edições de itens sem esperar o GitHub (alterações enviadas por um outbox)",
+    )
+    github_outbox_max_attempts: int = Field(default=8, description="Tentativas de envio de uma alteração do outbox")
+    github_outbox_retry_base_seconds: int = Field(
+        default=15,
+        description="Base do backoff exponencial entre tentativas do outbox",
+    )
+    github_outbox_lease_seconds: int = Field(
+        default=300,
+        description="Validade da reserva de um lote do outbox; vencida, outro worker retoma as alterações",
+    )
+
+    github_token_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Tempo em que o token decifrado de uma conta fica em memória (0 = sempre ler do banco)",
+    )
+    github_token_cache_max_entries: int = Field(default=1024, description="Máximo de contas com token em memória")
+
+    # GitHub HTTP
+    github_http2: bool = Field(default=True, description="Usar HTTP/2 com o GitHub (requer o pacote h2)")
+    github_http_max_connections: int = Field(default=20, description="Máximo de conexões por token no pool")
+    github_http_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Tempo que uma conexão ociosa fica aberta para reuso",
+    )
+    github_client_idle_ttl_seconds: int = Field(
+        default=300,
+        description="Tempo sem uso após o qual o cliente HTTP de um token é fechado",
+    )
+
+    github_query_cache_ttl_seconds: float = Field(
+        default=0.0,
+        description="Tempo em que o resultado de uma consulta GraphQL é reaproveitado (0 = só coalesce chamadas simultâneas)",
+    )
+
+    # GitHub rate limit
+    github_rate_limit_headroom: int = Field(
+        default=500,
+        description="Pontos de rate limit reservados para requisições interativas (syncs em background não os usam)",
+    )
+    github_rate_limit_max_wait_seconds: int = Field(
+        default=900,
+        description="Espera máxima por orçamento de rate limit antes de abortar a chamada",
+    )
+    github_max_retries: int = Field(default=4, description="Tentativas extras em limites secundários do GitHub")
+    github_backoff_base_seconds: float = Field(default=2.0, description="Base do backoff exponencial")
+    github_backoff_max_seconds: float = Field(default=60.0, description="Teto do backoff exponencial")
+
+    # Webhooks
+    webhook_worker_concurrency: int = Field(
+        default=4,
+        description="Partições (projetos) da fila de webhooks processadas em paralelo",
+    )
+    webhook_max_attempts: int = Field(default=5, description="Tentativas antes de marcar a entrega como falha")
+    webhook_retry_base_seconds: int = Field(
+        default=30,
+        description="Base do backoff exponencial entre tentativas de uma entrega",
+    )
+    webhook_lease_seconds: int = Field(
+        default=600,
+        description="Validade da reserva de um lote de webhooks; vencida, outro worker retoma as entregas",
+    )
+    webhook_retention_days: int = Field(default=7, description="Dias que entregas processadas ficam na fila")
+    webhook_coalesce_window_seconds: int = Field(
+        default=5,
+        description="Silêncio, por projeto, antes de processar uma rajada de webhooks como um lote",
+    )
+    webhook_coalesce_max_delay_seconds: int = Field(
+        default=30,
+        description="Atraso máximo de um webhook aguardando o fim da rajada",
+    )
+    webhook_coalesce_max_items: int = Field(
+        default=50,
+        description="Acima desse número de itens tocados num lote, usar sync incremental do projeto",
+    )
+
     @property
     def cors_origins(self) -> List[str]:
         """Retorna CORS origins como lista de strings."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import secrets
+from functools import lru_cache
 from typing import Tuple
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -9,7 +10,12 @@ from app.core.config import settings
 
 
 def _get_aes_gcm() -> AESGCM:
-    return AESGCM(settings.encryption_key_bytes)
+    return _aes_gcm_for_key(settings.encryption_key_bytes)
+
+
+@lru_cache(maxsize=4)
+def _aes_gcm_for_key(key: bytes) -> AESGCM:
+    return AESGCM(key)
 
 
 def encrypt_secret(secret: str) -> Tuple[bytes, bytes]:
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.db.session import engine
+from app.services.github_pool import github_client_pool
 from app.services.scheduler import start_scheduler, stop_scheduler
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,13 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         except Exception as exc:
             logger.exception("Failed to stop scheduler", exc_info=exc)
 
+        # Fechar conexões HTTP com o GitHub
+        try:
+            await github_client_pool.aclose()
+            logger.info("GitHub HTTP clients closed")
+        except Exception as exc:
+            logger.exception("Failed to close GitHub HTTP clients", exc_info=exc)
+
         # Fechar conexão com banco
         await engine.dispose()
         logger.info("Database connection closed")
@@ -10,3 +10,6 @@ from .project_member import ProjectMember  # noqa: F401
 from .project_invite import ProjectInvite  # noqa: F401
 from .epic_option import EpicOption  # noqa: F401
 from .project_repository import ProjectRepository  # noqa: F401
+from .webhook_delivery import WebhookDelivery  # noqa: F401
+from .issue_content_cache import IssueContentCache  # noqa: F401
+from .item_mutation_outbox import ItemMutationOutbox  # noqa: F401
@@ -23,8 +23,15 @@ class GithubProject(Base):
     project_node_id: Mapped[str] = mapped_column(String(length=255), unique=True, nullable=False)
     name: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
     field_mappings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Cache de metadados: tipo do owner (organization/user), hash dos campos e último refresh
+    owner_type: Mapped[str | None] = mapped_column(String(length=20), nullable=True)
+    field_mappings_hash: Mapped[str | None] = mapped_column(String(length=64), nullable=True)
+    metadata_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     status_columns: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
     last_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Sync incremental: maior updatedAt (item ou conteúdo) já persistido e última reconciliação completa
+    items_high_water_mark: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_full_sync_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
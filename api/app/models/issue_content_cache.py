@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, LargeBinary, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class IssueContentCache(Base):
+    """
+    Conteúdo de issues/PRs (corpo e comentários) guardado localmente.
+
+    Os campos `details` e `comments` são JSON comprimido com zlib. Os
+    timestamps `*_fetched_at` controlam o TTL; webhooks zeram `details_fetched_at`
+    para forçar nova busca. `comments_watermark` é o `createdAt` do comentário
+    mais recente conhecido, usado para buscar apenas comentários novos.
+    """
+    __tablename__ = "issue_content_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    content_node_id: Mapped[str] = mapped_column(String(length=255), unique=True, nullable=False)
+
+    details: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    content_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    details_fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    comments: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    comments_watermark: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    comments_fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        {
+            "sqlite_autoincrement": True,
+        },
+    )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ItemMutationOutbox(Base):
+    """
+    Alteração de campo de um item aguardando envio ao GitHub (write-behind).
+
+    Gravada na mesma transação da edição local; um worker envia as pendentes
+    em ordem de `id` por item. `value` nulo limpa o campo no GitHub.
+    """
+    __tablename__ = "item_mutation_outbox"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("github_project.id", ondelete="CASCADE"), nullable=False
+    )
+    item_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("project_item.id", ondelete="CASCADE"), nullable=False
+    )
+    item_node_id: Mapped[str] = mapped_column(String(length=255), nullable=False)
+    field_id: Mapped[str] = mapped_column(String(length=255), nullable=False)
+    value: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
+    # Processamento
+    status: Mapped[str] = mapped_column(
+        String(length=20), nullable=False, default="pending"
+    )  # pending/processing/done/failed/superseded
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Reserva do worker que está enviando a alteração (status "processing")
+    lease_token: Mapped[str | None] = mapped_column(String(length=36), nullable=True)
+    lease_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_item_mutation_outbox_status_next_attempt", "status", "next_attempt_at"),
+        Index("ix_item_mutation_outbox_item", "item_id", "id"),
+        {
+            "sqlite_autoincrement": True,
+        },
+    )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String, JSON
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, JSON, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,6 +26,8 @@ class ProjectItem(Base):
     content_node_id: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
     title: Mapped[str | None] = mapped_column(String(length=500), nullable=True)
     status: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
+    # todo, in_progress ou done, derivado do status e das colunas do projeto (app.utils.status_category)
+    status_category: Mapped[str | None] = mapped_column(String(length=20), nullable=True)
     assignees: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
     iteration: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
     iteration_id: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
@@ -46,15 +48,22 @@ class ProjectItem(Base):
     parent_item_id: Mapped[int | None] = mapped_column(
         Integer, ForeignKey("project_item.id", ondelete="SET NULL"), nullable=True
     )
+    # Issue pai no GitHub (sub-issues); resolvido para parent_item_id ao fim de cada sync
+    parent_content_node_id: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
     labels: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
 
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # SHA-256 do payload remoto normalizado; usado para pular escritas de itens sem mudanças
+    content_hash: Mapped[str | None] = mapped_column(String(length=64), nullable=True)
     remote_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_local_edit_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_local_edit_by: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("app_user.id", ondelete="SET NULL"), nullable=True
     )
+    # Envio de edições locais ao GitHub no modo write-behind: None (em dia), pending ou failed
+    remote_sync_status: Mapped[str | None] = mapped_column(String(length=20), nullable=True)
+    remote_sync_error: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     account = relationship("Account")
     project = relationship("GithubProject", back_populates="items")
@@ -65,7 +74,20 @@ class ProjectItem(Base):
     children = relationship("ProjectItem", back_populates="parent", foreign_keys=[parent_item_id])
 
     __table_args__ = (
+        Index("ix_project_item_project_status_category", "project_id", "status_category"),
         {
             "sqlite_autoincrement": True,
         },
     )
+
+
+# Ordem da listagem de itens (start_date, end_date, updated_at desc, id), para a paginação por cursor.
+# Só no PostgreSQL: o SQLite não aceita NULLS LAST na definição de índices.
+Index(
+    "ix_project_item_list_order",
+    ProjectItem.project_id,
+    ProjectItem.start_date,
+    ProjectItem.end_date,
+    ProjectItem.updated_at.desc().nulls_last(),
+    ProjectItem.id,
+).ddl_if(dialect="postgresql")
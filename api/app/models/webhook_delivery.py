@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class WebhookDelivery(Base):
+    """
+    Entrega de webhook do GitHub recebida e ainda (ou já) processada.
+
+    O endpoint apenas grava a entrega e responde 202; o processamento acontece
+    em background, em ordem dentro de cada `partition_key` (projeto).
+    """
+    __tablename__ = "webhook_delivery"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    delivery_id: Mapped[str] = mapped_column(String(length=255), unique=True, nullable=False)  # X-GitHub-Delivery
+    event: Mapped[str] = mapped_column(String(length=100), nullable=False)  # X-GitHub-Event
+    action: Mapped[str | None] = mapped_column(String(length=100), nullable=True)
+    partition_key: Mapped[str] = mapped_column(String(length=255), nullable=False)  # node id do projeto/conteúdo
+    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
+    # Processamento
+    status: Mapped[str] = mapped_column(
+        String(length=20), nullable=False, default="pending"
+    )  # pending/processing/done/failed
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Reserva do worker que está processando a entrega (status "processing")
+    lease_token: Mapped[str | None] = mapped_column(String(length=36), nullable=True)
+    lease_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    received_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_webhook_delivery_status_next_attempt", "status", "next_attempt_at"),
+        Index("ix_webhook_delivery_partition", "partition_key", "id"),
+        {
+            "sqlite_autoincrement": True,
+        },
+    )
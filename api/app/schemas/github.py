@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 
 class GithubTokenRequest(BaseModel):
@@ -42,6 +42,7 @@ class ProjectItemResponse(BaseModel):
     content_type: str | None = None
     title: str | None = None
     status: str | None = None
+    status_category: str | None = None
     iteration: str | None = None
     iteration_id: str | None = None
     iteration_start: datetime | None = None
@@ -60,11 +61,26 @@ class ProjectItemResponse(BaseModel):
     field_values: dict | None = None
     epic_option_id: str | None = None
     epic_name: str | None = None
+    remote_sync_status: str | None = None
+    remote_sync_error: str | None = None
 
     class Config:
         from_attributes = True
 
 
+# Item da listagem com `fields`/`include_field_values`: só `id` é garantido,
+# os demais campos de ProjectItemResponse vêm apenas quando pedidos
+ProjectItemPartialResponse = create_model(
+    "ProjectItemPartialResponse",
+    id=(int, ...),
+    **{
+        name: (field.annotation | None, None)
+        for name, field in ProjectItemResponse.model_fields.items()
+        if name != "id"
+    },
+)
+
+
 class ProjectItemUpdateRequest(BaseModel):
     start_date: datetime | None = None
     end_date: datetime | None = None
@@ -77,6 +93,27 @@ class ProjectItemUpdateRequest(BaseModel):
     remote_updated_at: datetime | None = None
 
 
+class ProjectItemBulkUpdateEntry(ProjectItemUpdateRequest):
+    id: int
+
+
+class ProjectItemBulkUpdateRequest(BaseModel):
+    items: list[ProjectItemBulkUpdateEntry] = Field(min_length=1, max_length=200)
+
+
+class ProjectItemBulkUpdateResult(BaseModel):
+    id: int
+    success: bool
+    error: str | None = None
+    item: ProjectItemResponse | None = None
+
+
+class ProjectItemBulkUpdateResponse(BaseModel):
+    updated: int
+    failed: int
+    results: list[ProjectItemBulkUpdateResult]
+
+
 class ProjectItemCommentResponse(BaseModel):
     id: str
     author: str | None = None
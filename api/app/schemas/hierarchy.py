@@ -11,6 +11,12 @@ class HierarchyItemResponse(BaseModel):
     epic_name: str | None
     parent_item_id: int | None
     labels: list[str] | None
+    status_category: str | None = None
+    estimate: float | None = None
+    item_count: int = Field(1, description="Itens da subárvore, incluindo o próprio")
+    completed_count: int = Field(0, description="Itens concluídos da subárvore")
+    total_estimate: float = Field(0.0, description="Soma das estimativas da subárvore")
+    completed_estimate: float = Field(0.0, description="Soma das estimativas concluídas da subárvore")
     children: list["HierarchyItemResponse"] = Field(default_factory=list)
 
     class Config:
@@ -22,6 +28,10 @@ class HierarchyEpicResponse(BaseModel):
     epic_option_id: str | None
     epic_name: str | None
     items: list[HierarchyItemResponse]
+    item_count: int = 0
+    completed_count: int = 0
+    total_estimate: float = 0.0
+    completed_estimate: float = 0.0
 
 
 class HierarchyResponse(BaseModel):
@@ -229,28 +229,27 @@ async def approve_change_request(
             raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Conta não encontrada")
 
         token = await get_github_token(db, account)
-        client = GithubGraphQLClient(token)
-
-        # Buscar nome do criador
-        creator = await db.get(AppUser, request.created_by)
-        creator_name = creator.name or creator.email if creator else "Unknown"
-
-        # Criar Issue
-        issue_node_id, issue_number, issue_url = await create_issue_from_request(
-            client, request, project, creator_name
-        )
-
-        request.github_issue_node_id = issue_node_id
-        request.github_issue_number = issue_number
-        request.github_issue_url = issue_url
-
-        # 3. Adicionar ao Project (se solicitado)
-        if data.add_to_project:
-            await add_issue_to_project(client, project.project_node_id, issue_node_id)
-
-            # TODO: Aplicar fields sugeridos (epic, iteration, estimate)
-            # Isso requer buscar os field IDs do projeto e executar mutations
-            # para updateProjectV2ItemFieldValue
+        async with GithubGraphQLClient(token) as client:
+            # Buscar nome do criador
+            creator = await db.get(AppUser, request.created_by)
+            creator_name = creator.name or creator.email if creator else "Unknown"
+
+            # Criar Issue
+            issue_node_id, issue_number, issue_url = await create_issue_from_request(
+                client, request, project, creator_name
+            )
+
+            request.github_issue_node_id = issue_node_id
+            request.github_issue_number = issue_number
+            request.github_issue_url = issue_url
+
+            # 3. Adicionar ao Project (se solicitado)
+            if data.add_to_project:
+                await add_issue_to_project(client, project.project_node_id, issue_node_id)
+
+                # TODO: Aplicar fields sugeridos (epic, iteration, estimate)
+                # Isso requer buscar os field IDs do projeto e executar mutations
+                # para updateProjectV2ItemFieldValue
 
         request.status = "converted"
         request.converted_at = datetime.utcnow()
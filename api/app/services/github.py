@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
-from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Iterable, List, Optional
+from functools import cached_property
+from datetime import datetime, timezone, timedelta, UTC
+from typing import Any, Dict, List, Optional
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 
 import httpx
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import all_, and_, bindparam, delete, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.crypto import decrypt_secret, encrypt_secret
 from app.models.account import Account
 from app.models.account_github_credentials import AccountGithubCredentials
@@ -19,6 +29,18 @@ from app.models.project_item import ProjectItem
 from app.models.github_project_field import GithubProjectField
 from app.models.project_repository import ProjectRepository
 from app.models.epic_option import EpicOption
+from app.services.github_rate_limit import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RESOURCE_CORE,
+    RESOURCE_GRAPHQL,
+    github_rate_limit_governor,
+    governed_request,
+)
+from app.services.github_singleflight import github_singleflight, is_mutation, query_key
+from app.utils.status_category import derive_status_category
+
+logger = logging.getLogger("tactyo.github")
 
 GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
@@ -30,9 +52,10 @@ class ProjectMetadata:
     owner: str
     number: int
     field_mappings: Dict[str, Any]
+    owner_type: str | None = None  # organization | user
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectItemPayload:
     node_id: str
     content_node_id: Optional[str]
@@ -57,6 +80,15 @@ class ProjectItemPayload:
     # Campos hierárquicos
     labels: Optional[List[str]] = None
     relationship_ids: Optional[List[str]] = None  # IDs dos items relacionados (pai/filhos)
+    parent_content_node_id: str | None = None  # Issue pai (sub-issues do GitHub)
+
+
+@dataclass
+class ProjectSyncResult:
+    total: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    deleted: int = 0
 
 
 @dataclass
@@ -114,6 +146,40 @@ SINGLE_SELECT_ALLOWED_COLORS = {
 }
 
 
+# Tokens já decifrados, por conta: account_id -> (token, expira_em monotonic)
+_github_token_cache: OrderedDict[uuid.UUID, tuple[str, float]] = OrderedDict()
+
+
+def invalidate_github_token(account_id: uuid.UUID | None = None) -> None:
+    """Descarta o token em cache de uma conta (ou de todas, sem `account_id`)."""
+    if account_id is None:
+        _github_token_cache.clear()
+    else:
+        _github_token_cache.pop(account_id, None)
+
+
+def _cached_github_token(account_id: uuid.UUID) -> str | None:
+    entry = _github_token_cache.get(account_id)
+    if entry is None:
+        return None
+    token, expires_at = entry
+    if time.monotonic() >= expires_at:
+        del _github_token_cache[account_id]
+        return None
+    _github_token_cache.move_to_end(account_id)
+    return token
+
+
+def _remember_github_token(account_id: uuid.UUID, token: str) -> None:
+    ttl = settings.github_token_cache_ttl_seconds
+    if ttl <= 0:
+        return
+    _github_token_cache[account_id] = (token, time.monotonic() + ttl)
+    _github_token_cache.move_to_end(account_id)
+    while len(_github_token_cache) > settings.github_token_cache_max_entries:
+        _github_token_cache.popitem(last=False)
+
+
 async def store_github_token(db: AsyncSession, account: Account, token: str) -> None:
     nonce, ciphertext = encrypt_secret(token)
     credentials = await db.get(AccountGithubCredentials, account.id)
@@ -128,35 +194,61 @@ async def store_github_token(db: AsyncSession, account: Account, token: str) ->
         )
         db.add(credentials)
     await db.flush()
+    invalidate_github_token(account.id)
 
 
 async def get_github_token(db: AsyncSession, account: Account) -> str:
-    credentials = await db.get(AccountGithubCredentials, account.id)
-    if not credentials:
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Token do GitHub não configurado")
-    return decrypt_secret(credentials.pat_nonce, credentials.pat_ciphertext)
+    """
+    Token (PAT) da conta. Fica em memória por `github_token_cache_ttl_seconds`
+    para não consultar o banco e decifrar a cada chamada ao GitHub;
+    `store_github_token` descarta a cópia antiga.
+    """
+    token = _cached_github_token(account.id)
+    if token is None:
+        credentials = await db.get(AccountGithubCredentials, account.id)
+        if not credentials:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Token do GitHub não configurado")
+        token = decrypt_secret(credentials.pat_nonce, credentials.pat_ciphertext)
+        _remember_github_token(account.id, token)
+    github_rate_limit_governor.register_account(account.id, token)
+    return token
+
+
+def _is_graphql_rate_limited(data: dict[str, Any]) -> bool:
+    return any(error.get("type") == "RATE_LIMITED" for error in data.get("errors") or [])
 
 
 class GithubGraphQLClient:
-    def __init__(self, token: str):
-        self._client = httpx.AsyncClient(
-            headers={
-                "Authorization": f"Bearer {token}",
-                "User-Agent": "Tactyo/0.1",
-                "X-GitHub-Api-Version": "2022-11-28",
-                "GraphQL-Features": "projects_next_graphql",
-            },
-            timeout=httpx.Timeout(15.0, connect=10.0),
-        )
+    """
+    Cliente GraphQL do GitHub.
 
-    async def execute(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+    As conexões vêm do pool compartilhado (`github_client_pool`), então criar
+    várias instâncias para o mesmo token reaproveita o keep-alive. `priority`
+    define como o rate limit do token é consumido (ver `github_rate_limit`):
+    syncs agendados usam `PRIORITY_BACKGROUND` e deixam folga para os usuários.
+    """
+
+    def __init__(self, token: str, priority: str = PRIORITY_INTERACTIVE):
+        self.token = token
+        self.priority = priority
+
+    async def _post(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
         try:
-            response = await self._client.post(GITHUB_GRAPHQL_URL, json={"query": query, "variables": variables})
+            response = await governed_request(
+                self.token,
+                "POST",
+                GITHUB_GRAPHQL_URL,
+                resource=RESOURCE_GRAPHQL,
+                priority=self.priority,
+                json={"query": query, "variables": variables},
+                headers={"GraphQL-Features": "projects_next_graphql"},
+            )
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             detail = exc.response.text
             raise HTTPException(
-                status.HTTP_400_BAD_REQUEST,
+                # Erros 5xx (ex.: timeout de consulta pesada) são transitórios e podem ser repetidos
+                status.HTTP_502_BAD_GATEWAY if exc.response.status_code >= 500 else status.HTTP_400_BAD_REQUEST,
                 detail=f"GitHub API retornou status {exc.response.status_code}: {detail}",
             ) from exc
         except httpx.RequestError as exc:
@@ -164,9 +256,51 @@ class GithubGraphQLClient:
                 status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Não foi possível se comunicar com o GitHub",
             ) from exc
+        return response.json()
+
+    async def execute(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """
+        Executa a consulta; consultas idênticas e concorrentes do mesmo token
+        compartilham uma única requisição (ver `github_singleflight`).
+        """
+        if is_mutation(query):
+            github_singleflight.forget_token(self.token)
+            return await self._execute(query, variables)
+        return await github_singleflight.do(
+            query_key(self.token, query, variables),
+            lambda: self._execute(query, variables),
+            settings.github_query_cache_ttl_seconds,
+        )
+
+    async def execute_with_errors(
+        self,
+        query: str,
+        variables: dict[str, Any],
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """
+        Executa sem tratar erros GraphQL como fatais: retorna os dados (possivelmente
+        parciais) e a lista de erros. Usado em documentos com várias mutations com
+        alias, em que cada erro aponta (`path`) a mutation que falhou.
+        """
+        if is_mutation(query):
+            github_singleflight.forget_token(self.token)
+        data = await self._request(query, variables)
+        return data.get("data") or {}, data.get("errors") or []
+
+    async def _request(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        data = await self._post(query, variables)
+        if _is_graphql_rate_limited(data):
+            if self.priority != PRIORITY_BACKGROUND:
+                raise HTTPException(status.HTTP_429_TOO_MANY_REQUESTS, detail="Limite de requisições do GitHub esgotado")
+            # Em background o governor aguarda o reset da janela antes de repetir
+            data = await self._post(query, variables)
 
-        data = response.json()
         print(f"DEBUG: GitHub GraphQL response: {data}")
+        github_rate_limit_governor.update_from_graphql(self.token, (data.get("data") or {}).get("rateLimit"))
+        return data
+
+    async def _execute(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        data = await self._request(query, variables)
 
         # Check for fatal errors (not partial data errors)
         if errors := data.get("errors"):
@@ -175,6 +309,9 @@ class GithubGraphQLClient:
                 # Skip NOT_FOUND errors for specific paths (user/organization queries)
                 if error.get("type") == "NOT_FOUND" and error.get("path") in [["user"], ["organization"]]:
                     continue
+                # nodes(ids: [...]) devolve null + NOT_FOUND para ids removidos
+                if error.get("type") == "NOT_FOUND" and (error.get("path") or [None])[0] == "nodes":
+                    continue
                 fatal_errors.append(error)
 
             if fatal_errors:
@@ -185,7 +322,8 @@ class GithubGraphQLClient:
         return data["data"]
 
     async def close(self) -> None:
-        await self._client.aclose()
+        # Conexões pertencem ao pool; são fechadas por ociosidade ou no shutdown
+        return None
 
     async def __aenter__(self) -> "GithubGraphQLClient":
         return self
@@ -200,23 +338,23 @@ class GithubRestClient:
     Usado para operações que não estão disponíveis no GraphQL (ex: gerenciar labels).
     """
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, priority: str = PRIORITY_INTERACTIVE):
         self.token = token
-        self._client = httpx.AsyncClient(
-            base_url="https://api.github.com",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github+json",
-                "User-Agent": "Tactyo/0.1",
-                "X-GitHub-Api-Version": "2022-11-28",
-            },
-            timeout=httpx.Timeout(15.0, connect=10.0),
-        )
+        self.priority = priority
 
     async def _request(self, method: str, endpoint: str, **kwargs) -> dict[str, Any] | list[Any]:
         """Executa uma requisição REST e retorna o JSON."""
+        headers = {"Accept": "application/vnd.github+json", **kwargs.pop("headers", {})}
         try:
-            response = await self._client.request(method, endpoint, **kwargs)
+            response = await governed_request(
+                self.token,
+                method,
+                endpoint,
+                resource=RESOURCE_CORE,
+                priority=self.priority,
+                headers=headers,
+                **kwargs,
+            )
             response.raise_for_status()
 
             # DELETE pode retornar 204 No Content
@@ -327,7 +465,8 @@ class GithubRestClient:
         await self._request("DELETE", f"/repos/{owner}/{repo}/issues/{issue_number}/labels/{label}")
 
     async def close(self) -> None:
-        await self._client.aclose()
+        # Conexões pertencem ao pool; são fechadas por ociosidade ou no shutdown
+        return None
 
     async def __aenter__(self) -> "GithubRestClient":
         return self
@@ -336,24 +475,9 @@ class GithubRestClient:
         await self.close()
 
 
-async def fetch_project_metadata(client: GithubGraphQLClient, owner: str, number: int) -> ProjectMetadata:
-    query = """
-    query($owner: String!, $number: Int!) {
-      organization(login: $owner) {
-        projectV2(number: $number) {
-          id
-          title
-          fields(first: 50) {
-            nodes {
-              __typename
-              ... on ProjectV2FieldCommon { id name dataType }
-              ... on ProjectV2IterationField { id name configuration { iterations { id title startDate duration } } }
-              ... on ProjectV2SingleSelectField { id name options { id name color description } }
-            }
-          }
-        }
-      }
-      user(login: $owner) {
+OWNER_TYPES = ("organization", "user")
+
+PROJECT_METADATA_SELECTION = """
         projectV2(number: $number) {
           id
           title
@@ -366,12 +490,40 @@ async def fetch_project_metadata(client: GithubGraphQLClient, owner: str, number
             }
           }
         }
-      }
-    }
+"""
+
+
+async def fetch_project_metadata(
+    client: GithubGraphQLClient,
+    owner: str,
+    number: int,
+    owner_type: str | None = None,
+) -> ProjectMetadata:
+    """
+    Busca título e campos do projeto.
+
+    Com `owner_type` conhecido (salvo no projeto) consulta só essa raiz
+    (`organization` ou `user`); sem ele, ou se o projeto não for encontrado
+    ali, consulta as duas.
     """
+    roots = (owner_type,) if owner_type in OWNER_TYPES else OWNER_TYPES
+    query = (
+        "query($owner: String!, $number: Int!) {"
+        + "".join(f"\n      {root}(login: $owner) {{{PROJECT_METADATA_SELECTION}      }}" for root in roots)
+        + "\n    }"
+    )
     data = await client.execute(query, {"owner": owner, "number": number})
-    project = data.get("organization", {}).get("projectV2") or data.get("user", {}).get("projectV2")
+    project = None
+    found_owner_type = None
+    for root in roots:
+        project = (data.get(root) or {}).get("projectV2")
+        if project:
+            found_owner_type = root
+            break
     if not project:
+        if len(roots) == 1:
+            # Owner pode ter mudado de tipo (ex.: usuário convertido em organização)
+            return await fetch_project_metadata(client, owner, number)
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Projeto não encontrado no GitHub")
 
     fields = project.get("fields", {}).get("nodes", [])
@@ -397,6 +549,7 @@ async def fetch_project_metadata(client: GithubGraphQLClient, owner: str, number
         owner=owner,
         number=number,
         field_mappings=field_mappings,
+        owner_type=found_owner_type,
     )
 
 
@@ -454,9 +607,346 @@ async def list_projects(client: GithubGraphQLClient, owner: str) -> List[Project
     return summaries
 
 
+PROJECT_ITEM_FRAGMENT = """
+fragment ProjectItemFields on ProjectV2Item {
+  id
+  updatedAt
+  content {
+    __typename
+    ... on Issue {
+      id
+      title
+      url
+      updatedAt
+      assignees(first: 20) { nodes { login } }
+      labels(first: 20) { nodes { name } }
+      parent { id }
+    }
+    ... on PullRequest {
+      id
+      title
+      url
+      updatedAt
+      assignees(first: 20) { nodes { login } }
+      labels(first: 20) { nodes { name } }
+    }
+    ... on DraftIssue { id title }
+  }
+  fieldValues(first: 50) {
+    nodes {
+      __typename
+      ... on ProjectV2ItemFieldTextValue { field { ... on ProjectV2FieldCommon { name } } text }
+      ... on ProjectV2ItemFieldNumberValue { field { ... on ProjectV2FieldCommon { name } } number }
+      ... on ProjectV2ItemFieldSingleSelectValue { field { ... on ProjectV2FieldCommon { name } } name optionId }
+      ... on ProjectV2ItemFieldDateValue { field { ... on ProjectV2FieldCommon { name dataType } } date }
+      ... on ProjectV2ItemFieldIterationValue {
+        field { ... on ProjectV2FieldCommon { name } }
+        title
+        iterationId
+        startDate
+        duration
+      }
+      ... on ProjectV2ItemFieldRepositoryValue {
+        field { ... on ProjectV2FieldCommon { name } }
+        repository { id name }
+      }
+      ... on ProjectV2ItemFieldPullRequestValue {
+        field { ... on ProjectV2FieldCommon { name } }
+        pullRequests(first: 20) { nodes { id } }
+      }
+      ... on ProjectV2ItemFieldReviewerValue {
+        field { ... on ProjectV2FieldCommon { name } }
+        reviewers(first: 20) { nodes { __typename } }
+      }
+      ... on ProjectV2ItemFieldMilestoneValue {
+        field { ... on ProjectV2FieldCommon { name } }
+        milestone { id title }
+      }
+      ... on ProjectV2ItemFieldLabelValue {
+        field { ... on ProjectV2FieldCommon { name } }
+        labels(first: 20) { nodes { id name } }
+      }
+      ... on ProjectV2ItemFieldUserValue {
+        field { ... on ProjectV2FieldCommon { name } }
+        users(first: 20) { nodes { login } }
+      }
+    }
+  }
+}
+"""
+
+# Quantidade de ids por consulta nodes(ids: [...]) (limite do GitHub é 100)
+NODES_BATCH_SIZE = 50
+
+# Seleções de fieldValues por dataType do campo; só os tipos que o parser
+# (parse_field_details) realmente converte em colunas/field_values
+FIELD_VALUE_SELECTIONS = {
+    "TEXT": "... on ProjectV2ItemFieldTextValue { field { ... on ProjectV2FieldCommon { name } } text }",
+    "NUMBER": "... on ProjectV2ItemFieldNumberValue { field { ... on ProjectV2FieldCommon { name } } number }",
+    "SINGLE_SELECT": (
+        "... on ProjectV2ItemFieldSingleSelectValue { field { ... on ProjectV2FieldCommon { name } } name optionId }"
+    ),
+    "DATE": "... on ProjectV2ItemFieldDateValue { field { ... on ProjectV2FieldCommon { name dataType } } date }",
+    "ITERATION": (
+        "... on ProjectV2ItemFieldIterationValue { field { ... on ProjectV2FieldCommon { name } } "
+        "title iterationId startDate duration }"
+    ),
+    # Usado apenas para campos de relacionamento (ver extract_relationships)
+    "LABELS": "... on ProjectV2ItemFieldLabelValue { field { ... on ProjectV2FieldCommon { name } } labels(first: 20) { nodes { id name } } }",
+}
+# O campo Title (dataType TITLE) chega como ProjectV2ItemFieldTextValue
+FIELD_TYPE_ALIASES = {"TITLE": "TEXT"}
+RELATIONSHIP_FIELD_NAMES = ("relationships", "related", "parent", "children")
+
+# Limites de página para itens do projeto (o GitHub aceita até 100)
+ITEM_PAGE_SIZE_MIN = 10
+ITEM_PAGE_SIZE_MAX = 100
+
+
+@dataclass
+class ProjectItemQuery:
+    """Fragmento de item gerado para um projeto e o custo estimado (nós) por item."""
+    fragment: str
+    nodes_per_item: int
+
+    def page_size(self) -> int:
+        """Maior página cujo total estimado de nós cabe em `github_item_query_max_nodes`."""
+        size = settings.github_item_query_max_nodes // max(self.nodes_per_item, 1)
+        return max(ITEM_PAGE_SIZE_MIN, min(ITEM_PAGE_SIZE_MAX, size))
+
+
+def build_project_item_query(fields: Iterable[GithubProjectField] | None = None) -> ProjectItemQuery:
+    """
+    Monta o fragmento `ProjectItemFields` a partir dos campos salvos do projeto.
+
+    Só pede os tipos de fieldValues que o Tactyo persiste, e `fieldValues(first:)`
+    é limitado ao número de campos do projeto. Sem campos conhecidos (projeto
+    recém-configurado) usa o fragmento completo.
+    """
+    fields = list(fields or [])
+    if not fields:
+        return ProjectItemQuery(fragment=PROJECT_ITEM_FRAGMENT, nodes_per_item=2 + 40 + 50 * (1 + 4 * 20))
+
+    value_types: set[str] = {"TEXT"}
+    for field in fields:
+        field_type = FIELD_TYPE_ALIASES.get(field.field_type, field.field_type)
+        if field_type == "LABELS" and field.field_name.lower() not in RELATIONSHIP_FIELD_NAMES:
+            continue
+        if field_type in FIELD_VALUE_SELECTIONS:
+            value_types.add(field_type)
+
+    field_values_first = min(50, len(fields))
+    selections = "\n      ".join(FIELD_VALUE_SELECTIONS[value_type] for value_type in sorted(value_types))
+    fragment = f"""
+fragment ProjectItemFields on ProjectV2Item {{
+  id
+  updatedAt
+  content {{
+    __typename
+    ... on Issue {{
+      id
+      title
+      url
+      updatedAt
+      assignees(first: 20) {{ nodes {{ login }} }}
+      labels(first: 20) {{ nodes {{ name }} }}
+      parent {{ id }}
+    }}
+    ... on PullRequest {{
+      id
+      title
+      url
+      updatedAt
+      assignees(first: 20) {{ nodes {{ login }} }}
+      labels(first: 20) {{ nodes {{ name }} }}
+    }}
+    ... on DraftIssue {{ id title }}
+  }}
+  fieldValues(first: {field_values_first}) {{
+    nodes {{
+      __typename
+      {selections}
+    }}
+  }}
+}}
+"""
+    nested_per_value = 20 if "LABELS" in value_types else 0
+    nodes_per_item = 2 + 40 + field_values_first * (1 + nested_per_value)
+    return ProjectItemQuery(fragment=fragment, nodes_per_item=nodes_per_item)
+
+
+@dataclass(slots=True)
+class ProjectItemStamp:
+    node_id: str
+    updated_at: datetime | None
+
+
+def parse_project_item_node(element: dict[str, Any]) -> ProjectItemPayload:
+    content = element.get("content") or {}
+    typename = content.get("__typename")
+    field_nodes = element.get("fieldValues", {}).get("nodes", [])
+    field_values, field_details = parse_field_details(field_nodes)
+    assignees = extract_assignees(content)
+    labels = extract_labels(content)
+    relationship_ids = extract_relationships(field_nodes)
+    project_item_updated = parse_datetime(element.get("updatedAt"))
+    content_updated = parse_datetime(content.get("updatedAt"))
+    parent = content.get("parent") if isinstance(content.get("parent"), dict) else {}
+    return ProjectItemPayload(
+        node_id=element.get("id"),
+        content_node_id=content.get("id"),
+        content_type=typename,
+        title=content.get("title") or element.get("title"),
+        url=content.get("url"),
+        status=field_values.get("Status"),
+        iteration=field_details.iteration_title or field_values.get("Iteration"),
+        iteration_id=field_details.iteration_id,
+        iteration_start=field_details.iteration_start,
+        iteration_end=field_details.iteration_end,
+        estimate=safe_number(field_values.get("Estimate")),
+        assignees=assignees,
+        updated_at=content_updated or project_item_updated,
+        remote_updated_at=project_item_updated,
+        start_date=field_details.start_date,
+        end_date=field_details.end_date,
+        due_date=field_details.due_date,
+        field_values=field_values,
+        epic_option_id=field_details.epic_option_id,
+        epic_name=field_details.epic_value or field_values.get("Epic"),
+        labels=labels,
+        relationship_ids=relationship_ids,
+        parent_content_node_id=parent.get("id"),
+    )
+
+
+def payload_high_water_mark(payload: ProjectItemPayload) -> datetime | None:
+    """Maior updatedAt entre o item do Project e o conteúdo (issue/PR)."""
+    candidates = [value for value in (payload.updated_at, payload.remote_updated_at) if value]
+    return max(candidates) if candidates else None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def compute_field_mappings_hash(field_mappings: dict[str, Any]) -> str:
+    """Hash estável (SHA-256) dos metadados de campos, usado para evitar regravações."""
+    normalized = json.dumps(field_mappings, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def compute_payload_hash(payload: ProjectItemPayload) -> str:
+    """Hash estável (SHA-256) do payload normalizado, usado para detectar mudanças."""
+    normalized = json.dumps(asdict(payload), sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+async def _prefetch_pages(
+    fetch_page: Callable[[Any], Awaitable[tuple[list[Any], Any]]],
+    cursor: Any = None,
+) -> AsyncIterator[list[Any]]:
+    """
+    Itera páginas buscando a próxima em paralelo enquanto a atual é consumida.
+
+    `fetch_page(cursor)` devolve `(itens, próximo_cursor)`; um cursor `None`
+    encerra a iteração. Assim a gravação de uma página no banco se sobrepõe à
+    requisição da seguinte e só duas páginas ficam em memória ao mesmo tempo.
+    """
+    pending = asyncio.create_task(fetch_page(cursor))
+    try:
+        while pending is not None:
+            page, next_cursor = await pending
+            pending = asyncio.create_task(fetch_page(next_cursor)) if next_cursor is not None else None
+            if page:
+                yield page
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+def _is_transient_github_error(exc: HTTPException) -> bool:
+    return exc.status_code in (status.HTTP_502_BAD_GATEWAY, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+async def iter_project_item_pages(
+    client: GithubGraphQLClient,
+    project_node_id: str,
+    fields: Iterable[GithubProjectField] | None = None,
+) -> AsyncIterator[list[ProjectItemPayload]]:
+    """
+    Percorre todos os itens do projeto, uma página por vez.
+
+    A consulta é gerada a partir dos campos do projeto (`build_project_item_query`)
+    e o tamanho da página parte do custo estimado por item. Timeouts e 502 do
+    GitHub reduzem a página pela metade e repetem o mesmo cursor; páginas bem
+    sucedidas voltam a crescer até o tamanho inicial.
+    """
+    item_query = build_project_item_query(fields)
+    query = """
+    query($projectId: ID!, $first: Int!, $after: String) {
+      rateLimit { limit cost remaining resetAt }
+      node(id: $projectId) {
+        ... on ProjectV2 {
+          items(first: $first, after: $after) {
+            pageInfo { hasNextPage endCursor }
+            nodes { ...ProjectItemFields }
+          }
+        }
+      }
+    }
+    """ + item_query.fragment
+    max_page_size = item_query.page_size()
+    page_size = max_page_size
+
+    async def fetch_page(after: Any) -> tuple[list[ProjectItemPayload], str | None]:
+        nonlocal page_size
+        while True:
+            try:
+                # O primeiro cursor é "" para diferenciar do fim da paginação (None)
+                data = await client.execute(
+                    query, {"projectId": project_node_id, "first": page_size, "after": after or None}
+                )
+                break
+            except HTTPException as exc:
+                if not _is_transient_github_error(exc) or page_size <= ITEM_PAGE_SIZE_MIN:
+                    raise
+                page_size = max(ITEM_PAGE_SIZE_MIN, page_size // 2)
+                logger.warning(f"Página de itens reduzida para {page_size} após erro do GitHub: {exc.detail}")
+        if page_size < max_page_size:
+            page_size = min(max_page_size, page_size + max(1, page_size // 4))
+
+        node = data.get("node")
+        if not node:
+            return [], None
+        items_data = node.get("items", {})
+        page = [parse_project_item_node(element) for element in items_data.get("nodes", [])]
+        page_info = items_data.get("pageInfo", {})
+        next_cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+        return page, next_cursor
+
+    async for page in _prefetch_pages(fetch_page, ""):
+        yield page
+
+
 async def fetch_project_items(client: GithubGraphQLClient, project_node_id: str) -> List[ProjectItemPayload]:
+    items: list[ProjectItemPayload] = []
+    async for page in iter_project_item_pages(client, project_node_id):
+        items.extend(page)
+    return items
+
+
+async def fetch_project_item_stamps(client: GithubGraphQLClient, project_node_id: str) -> list[ProjectItemStamp]:
+    """
+    Lista apenas id e updatedAt (item e conteúdo) de todos os itens do projeto.
+
+    Consulta leve usada pelo sync incremental para descobrir o que mudou
+    sem trazer fieldValues, assignees e labels de cada item.
+    """
     query = """
     query($projectId: ID!, $first: Int!, $after: String) {
+      rateLimit { limit cost remaining resetAt }
       node(id: $projectId) {
         ... on ProjectV2 {
           items(first: $first, after: $after) {
@@ -465,64 +955,9 @@ async def fetch_project_items(client: GithubGraphQLClient, project_node_id: str)
               id
               updatedAt
               content {
-                __typename
-                ... on Issue {
-                  id
-                  title
-                  url
-                  updatedAt
-                  assignees(first: 20) { nodes { login } }
-                  labels(first: 20) { nodes { name } }
-                }
-                ... on PullRequest {
-                  id
-                  title
-                  url
-                  updatedAt
-                  assignees(first: 20) { nodes { login } }
-                  labels(first: 20) { nodes { name } }
-                }
-                ... on DraftIssue { id title }
-              }
-              fieldValues(first: 50) {
-                nodes {
-                  __typename
-                  ... on ProjectV2ItemFieldTextValue { field { ... on ProjectV2FieldCommon { name } } text }
-                  ... on ProjectV2ItemFieldNumberValue { field { ... on ProjectV2FieldCommon { name } } number }
-                  ... on ProjectV2ItemFieldSingleSelectValue { field { ... on ProjectV2FieldCommon { name } } name optionId }
-                  ... on ProjectV2ItemFieldDateValue { field { ... on ProjectV2FieldCommon { name dataType } } date }
-                  ... on ProjectV2ItemFieldIterationValue {
-                    field { ... on ProjectV2FieldCommon { name } }
-                    title
-                    iterationId
-                    startDate
-                    duration
-                  }
-                  ... on ProjectV2ItemFieldRepositoryValue {
-                    field { ... on ProjectV2FieldCommon { name } }
-                    repository { id name }
-                  }
-                  ... on ProjectV2ItemFieldPullRequestValue {
-                    field { ... on ProjectV2FieldCommon { name } }
-                    pullRequests(first: 20) { nodes { id } }
-                  }
-                  ... on ProjectV2ItemFieldReviewerValue {
-                    field { ... on ProjectV2FieldCommon { name } }
-                    reviewers(first: 20) { nodes { __typename } }
-                  }
-                  ... on ProjectV2ItemFieldMilestoneValue {
-                    field { ... on ProjectV2FieldCommon { name } }
-                    milestone { id title }
-                  }
-                  ... on ProjectV2ItemFieldLabelValue {
-                    field { ... on ProjectV2FieldCommon { name } }
-                    labels(first: 20) { nodes { id name } }
-                  }
-                  ... on ProjectV2ItemFieldUserValue {
-                    field { ... on ProjectV2FieldCommon { name } }
-                    users(first: 20) { nodes { login } }
-                  }
-                }
+                ... on Issue { updatedAt }
+                ... on PullRequest { updatedAt }
+                ... on DraftIssue { updatedAt }
               }
             }
           }
@@ -530,69 +965,76 @@ async def fetch_project_items(client: GithubGraphQLClient, project_node_id: str)
       }
     }
     """
-    items: List[ProjectItemPayload] = []
+    stamps: list[ProjectItemStamp] = []
     after: Optional[str] = None
     while True:
-        data = await client.execute(query, {"projectId": project_node_id, "first": 50, "after": after})
+        data = await client.execute(query, {"projectId": project_node_id, "first": 100, "after": after})
         node = data.get("node")
         if not node:
             break
         items_data = node.get("items", {})
         for element in items_data.get("nodes", []):
+            if not element or not element.get("id"):
+                continue
             content = element.get("content") or {}
-            typename = content.get("__typename")
-            field_nodes = element.get("fieldValues", {}).get("nodes", [])
-            field_values, field_details = parse_field_details(field_nodes)
-            assignees = extract_assignees(content)
-            labels = extract_labels(content)
-            relationship_ids = extract_relationships(field_nodes)
-            project_item_updated = parse_datetime(element.get("updatedAt"))
-            content_updated = parse_datetime(content.get("updatedAt"))
-            items.append(
-                ProjectItemPayload(
-                    node_id=element.get("id"),
-                    content_node_id=content.get("id"),
-                    content_type=typename,
-                    title=content.get("title") or element.get("title"),
-                    url=content.get("url"),
-                    status=field_values.get("Status"),
-                    iteration=field_details.iteration_title or field_values.get("Iteration"),
-                    iteration_id=field_details.iteration_id,
-                    iteration_start=field_details.iteration_start,
-                    iteration_end=field_details.iteration_end,
-                    estimate=safe_number(field_values.get("Estimate")),
-                    assignees=assignees,
-                    updated_at=content_updated or project_item_updated,
-                    remote_updated_at=project_item_updated,
-                    start_date=field_details.start_date,
-                    end_date=field_details.end_date,
-                    due_date=field_details.due_date,
-                    field_values=field_values,
-                    epic_option_id=field_details.epic_option_id,
-                    epic_name=field_details.epic_value or field_values.get("Epic"),
-                    labels=labels,
-                    relationship_ids=relationship_ids,
-                )
-            )
+            candidates = [
+                value
+                for value in (parse_datetime(element.get("updatedAt")), parse_datetime(content.get("updatedAt")))
+                if value
+            ]
+            stamps.append(ProjectItemStamp(node_id=element["id"], updated_at=max(candidates) if candidates else None))
         page_info = items_data.get("pageInfo", {})
         if not page_info.get("hasNextPage"):
             break
         after = page_info.get("endCursor")
-    return items
+    return stamps
 
 
-async def fetch_project_item_comments(
+async def iter_project_items_by_ids(
     client: GithubGraphQLClient,
-    content_node_id: str,
-    limit: int = 30,
-) -> List[dict[str, Any]]:
+    item_node_ids: Iterable[str],
+    fields: Iterable[GithubProjectField] | None = None,
+) -> AsyncIterator[list[ProjectItemPayload]]:
+    """Busca itens específicos do projeto via nodes(ids: [...]), um lote por página."""
     query = """
-    query($id: ID!, $limit: Int!) {
-      node(id: $id) {
-        __typename
-        ... on Issue {
-          comments(last: $limit) {
-            nodes {
+    query($ids: [ID!]!) {
+      rateLimit { limit cost remaining resetAt }
+      nodes(ids: $ids) {
+        ... on ProjectV2Item { ...ProjectItemFields }
+      }
+    }
+    """ + build_project_item_query(fields).fragment
+    ids = list(dict.fromkeys(node_id for node_id in item_node_ids if node_id))
+    if not ids:
+        return
+
+    async def fetch_page(start: Any) -> tuple[list[ProjectItemPayload], int | None]:
+        data = await client.execute(query, {"ids": ids[start:start + NODES_BATCH_SIZE]})
+        # Itens removidos do projeto voltam como null
+        page = [
+            parse_project_item_node(element)
+            for element in data.get("nodes") or []
+            if element and element.get("id")
+        ]
+        next_start = start + NODES_BATCH_SIZE
+        return page, next_start if next_start < len(ids) else None
+
+    async for page in _prefetch_pages(fetch_page, 0):
+        yield page
+
+
+async def fetch_project_items_by_ids(
+    client: GithubGraphQLClient,
+    item_node_ids: Iterable[str],
+    fields: Iterable[GithubProjectField] | None = None,
+) -> list[ProjectItemPayload]:
+    items: list[ProjectItemPayload] = []
+    async for page in iter_project_items_by_ids(client, item_node_ids, fields):
+        items.extend(page)
+    return items
+
+
+COMMENT_SELECTION = """
               id
               body
               createdAt
@@ -603,67 +1045,92 @@ async def fetch_project_item_comments(
                 url
                 avatarUrl
               }
-            }
+"""
+
+
+def _parse_comment(comment: dict[str, Any]) -> dict[str, Any]:
+    author = comment.get("author") or {}
+    return {
+        "id": comment.get("id"),
+        "body": comment.get("body") or "",
+        "created_at": comment.get("createdAt"),
+        "updated_at": comment.get("updatedAt"),
+        "url": comment.get("url"),
+        "author_login": author.get("login"),
+        "author_url": author.get("url"),
+        "author_avatar_url": author.get("avatarUrl"),
+    }
+
+
+async def fetch_project_item_comments(
+    client: GithubGraphQLClient,
+    content_node_id: str,
+    limit: int = 30,
+) -> list[dict[str, Any]]:
+    return await fetch_project_item_comments_since(client, content_node_id, None, limit)
+
+
+async def fetch_project_item_comments_since(
+    client: GithubGraphQLClient,
+    content_node_id: str,
+    since: datetime | None,
+    limit: int = 30,
+) -> list[dict[str, Any]]:
+    """
+    Busca os comentários mais recentes da issue/PR criados depois de `since`.
+
+    O GraphQL não filtra comentários por data; a busca anda para trás
+    (`last`/`before`) e para ao alcançar um comentário já conhecido, de modo
+    que uma atualização incremental normalmente custa uma única página pequena.
+    Sem `since`, retorna os últimos `limit` comentários.
+    """
+    query = """
+    query($id: ID!, $limit: Int!, $before: String) {
+      node(id: $id) {
+        __typename
+        ... on Issue {
+          comments(last: $limit, before: $before) {
+            pageInfo { hasPreviousPage startCursor }
+            nodes {""" + COMMENT_SELECTION + """            }
           }
         }
         ... on PullRequest {
-          comments(last: $limit) {
-            nodes {
-              id
-              body
-              createdAt
-              updatedAt
-              url
-              author {
-                login
-                url
-                avatarUrl
-              }
-            }
+          comments(last: $limit, before: $before) {
+            pageInfo { hasPreviousPage startCursor }
+            nodes {""" + COMMENT_SELECTION + """            }
           }
         }
       }
     }
     """
 
-    data = await client.execute(query, {"id": content_node_id, "limit": limit})
-    node = data.get("node") or {}
-    if not node:
-        return []
-
-    raw_comments: List[dict[str, Any]] = []
-    typename = node.get("__typename")
-    if typename == "Issue":
-        raw_comments = node.get("comments", {}).get("nodes", []) or []
-    elif typename == "PullRequest":
-        raw_comments = node.get("comments", {}).get("nodes", []) or []
-
+    page_size = min(limit, 10) if since else limit
     comments: List[dict[str, Any]] = []
-    for comment in raw_comments:
-        author = comment.get("author") or {}
-        comments.append(
-            {
-                "id": comment.get("id"),
-                "body": comment.get("body") or "",
-                "created_at": comment.get("createdAt"),
-                "updated_at": comment.get("updatedAt"),
-                "url": comment.get("url"),
-                "author_login": author.get("login"),
-                "author_url": author.get("url"),
-                "author_avatar_url": author.get("avatarUrl"),
-            }
-        )
+    before: str | None = None
+    while len(comments) < limit:
+        data = await client.execute(query, {"id": content_node_id, "limit": page_size, "before": before})
+        node = data.get("node") or {}
+        if node.get("__typename") not in ("Issue", "PullRequest"):
+            break
 
-    return comments
+        connection = node.get("comments") or {}
+        page = [_parse_comment(comment) for comment in connection.get("nodes") or []]
+        reached_known = False
+        if since is not None:
+            newer = [comment for comment in page if (parse_datetime(comment["created_at"]) or since) > since]
+            reached_known = len(newer) < len(page)
+            page = newer
+        comments[:0] = page
+
+        page_info = connection.get("pageInfo") or {}
+        if reached_known or since is None or not page_info.get("hasPreviousPage"):
+            break
+        before = page_info.get("startCursor")
 
+    return comments[-limit:]
 
-async def fetch_project_item_details(
-    client: GithubGraphQLClient,
-    content_node_id: str,
-) -> dict[str, Any]:
-    query = """
-    query($id: ID!) {
-      node(id: $id) {
+
+CONTENT_DETAILS_SELECTION = """
         __typename
         ... on Issue {
           id
@@ -710,12 +1177,10 @@ async def fetch_project_item_details(
             }
           }
         }
-      }
-    }
-    """
+"""
 
-    data = await client.execute(query, {"id": content_node_id})
-    node = data.get("node") or {}
+
+def _parse_content_details(node: dict[str, Any] | None) -> dict[str, Any]:
     if not node:
         return {}
 
@@ -741,6 +1206,48 @@ async def fetch_project_item_details(
     }
 
 
+async def fetch_project_item_details(
+    client: GithubGraphQLClient,
+    content_node_id: str,
+) -> dict[str, Any]:
+    query = """
+    query($id: ID!) {
+      node(id: $id) {""" + CONTENT_DETAILS_SELECTION + """      }
+    }
+    """
+
+    data = await client.execute(query, {"id": content_node_id})
+    return _parse_content_details(data.get("node"))
+
+
+async def fetch_project_item_details_batch(
+    client: GithubGraphQLClient,
+    content_node_ids: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """
+    Busca detalhes de várias issues/PRs via nodes(ids: [...]).
+
+    Os ids são divididos em lotes de NODES_BATCH_SIZE consultados em paralelo.
+    Retorna content_node_id -> detalhes; ids removidos no GitHub ficam de fora.
+    """
+    query = """
+    query($ids: [ID!]!) {
+      nodes(ids: $ids) {""" + CONTENT_DETAILS_SELECTION + """      }
+    }
+    """
+    ids = list(dict.fromkeys(node_id for node_id in content_node_ids if node_id))
+    chunks = [ids[offset:offset + NODES_BATCH_SIZE] for offset in range(0, len(ids), NODES_BATCH_SIZE)]
+    responses = await asyncio.gather(*(client.execute(query, {"ids": chunk}) for chunk in chunks))
+
+    details: dict[str, dict[str, Any]] = {}
+    for data in responses:
+        for node in data.get("nodes") or []:
+            parsed = _parse_content_details(node)
+            if parsed.get("id"):
+                details[parsed["id"]] = parsed
+    return details
+
+
 def parse_field_details(nodes: List[dict[str, Any]]) -> tuple[Dict[str, Any], ParsedFieldDetails]:
     values: Dict[str, Any] = {}
     details = ParsedFieldDetails()
@@ -901,9 +1408,10 @@ async def upsert_github_project(
         project.project_number = metadata.number
         project.project_node_id = metadata.node_id
         project.name = metadata.title
-        project.field_mappings = metadata.field_mappings
         if metadata.field_mappings and not project.status_columns:
             project.status_columns = extract_status_columns(metadata.field_mappings)
+            if project.status_columns:
+                await recategorize_project_items(db, project)
     else:
         project = GithubProject(
             account_id=account.id,
@@ -911,133 +1419,457 @@ async def upsert_github_project(
             project_number=metadata.number,
             project_node_id=metadata.node_id,
             name=metadata.title,
-            field_mappings=metadata.field_mappings,
             status_columns=extract_status_columns(metadata.field_mappings) if metadata.field_mappings else None,
         )
         db.add(project)
     await db.flush()
+    await apply_project_metadata(db, project, metadata)
+    return project
+
+
+def _needs_metadata_refresh(project: GithubProject, now: datetime) -> bool:
+    synced_at = ensure_timezone(project.metadata_synced_at)
+    if synced_at is None or not project.field_mappings_hash:
+        return True
+    return now - synced_at >= timedelta(minutes=settings.github_metadata_refresh_minutes)
+
+
+async def apply_project_metadata(
+    db: AsyncSession,
+    project: GithubProject,
+    metadata: ProjectMetadata,
+) -> bool:
+    """
+    Grava os metadados buscados no projeto.
+
+    `field_mappings` e `GithubProjectField` só são reescritos quando o hash dos
+    campos mudou. Retorna True se houve mudança nos campos.
+    """
+    project.owner_type = metadata.owner_type or project.owner_type
+    project.metadata_synced_at = datetime.now(UTC)
+
+    field_mappings_hash = compute_field_mappings_hash(metadata.field_mappings)
+    if field_mappings_hash == project.field_mappings_hash:
+        return False
+
+    project.field_mappings = metadata.field_mappings
+    project.field_mappings_hash = field_mappings_hash
     if metadata.field_mappings:
         await sync_project_fields(db, project, metadata.field_mappings)
-        await db.flush()
-    return project
+    await db.flush()
+    return True
 
 
-async def upsert_project_items(
+async def refresh_project_metadata(
+    client: GithubGraphQLClient,
     db: AsyncSession,
+    project: GithubProject,
+) -> bool:
+    """Busca os metadados consultando só a raiz conhecida do owner e aplica se mudaram."""
+    metadata = await fetch_project_metadata(
+        client, project.owner_login, project.project_number, owner_type=project.owner_type
+    )
+    return await apply_project_metadata(db, project, metadata)
+
+
+# Linhas por INSERT ... ON CONFLICT (~25 colunas/linha, abaixo do limite de 32767 parâmetros do asyncpg)
+UPSERT_BATCH_SIZE = 500
+
+# Colunas sobrescritas pelo sync quando o item já existe
+SYNCED_ITEM_COLUMNS = (
+    "content_node_id",
+    "parent_content_node_id",
+    "content_type",
+    "title",
+    "url",
+    "status",
+    "status_category",
+    "iteration",
+    "iteration_id",
+    "iteration_start",
+    "iteration_end",
+    "estimate",
+    "assignees",
+    "start_date",
+    "end_date",
+    "due_date",
+    "field_values",
+    "epic_option_id",
+    "epic_name",
+    "labels",
+    "item_type",
+    "updated_at",
+    "remote_updated_at",
+    "last_synced_at",
+    "content_hash",
+)
+
+
+def _is_postgres(db: AsyncSession) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _project_item_row(
     account: Account,
     project: GithubProject,
-    items: List[ProjectItemPayload],
-) -> int:
+    payload: ProjectItemPayload,
+    synced_at: datetime,
+) -> dict[str, Any]:
     from app.utils.hierarchy import derive_item_type_from_labels
 
-    # Carregar itens existentes no banco para este projeto
-    stmt = select(ProjectItem).where(ProjectItem.project_id == project.id)
+    return {
+        "account_id": account.id,
+        "project_id": project.id,
+        "item_node_id": payload.node_id,
+        "content_node_id": payload.content_node_id,
+        "parent_content_node_id": payload.parent_content_node_id,
+        "content_type": payload.content_type,
+        "title": payload.title,
+        "url": payload.url,
+        "status": payload.status,
+        "status_category": derive_status_category(payload.status, project.status_columns),
+        "iteration": payload.iteration,
+        "iteration_id": payload.iteration_id,
+        "iteration_start": payload.iteration_start,
+        "iteration_end": payload.iteration_end,
+        "estimate": payload.estimate,
+        "assignees": payload.assignees,
+        "start_date": payload.start_date,
+        "end_date": payload.end_date,
+        "due_date": payload.due_date,
+        "field_values": payload.field_values,
+        "epic_option_id": payload.epic_option_id,
+        "epic_name": payload.epic_name,
+        "labels": payload.labels,
+        # Derive item_type from labels
+        "item_type": derive_item_type_from_labels(payload.labels, payload.title),
+        "updated_at": payload.updated_at,
+        "remote_updated_at": payload.remote_updated_at,
+        "last_synced_at": synced_at,
+        "content_hash": compute_payload_hash(payload),
+    }
+
+
+async def _bulk_upsert_project_items(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """INSERT ... ON CONFLICT (item_node_id) DO UPDATE em lotes (PostgreSQL)."""
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        stmt = pg_insert(ProjectItem).values(rows[start:start + UPSERT_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProjectItem.item_node_id],
+            set_={column: stmt.excluded[column] for column in SYNCED_ITEM_COLUMNS},
+            # Proteção extra caso outra escrita tenha gravado o mesmo conteúdo no meio tempo;
+            # itens com edição local ainda no outbox não são sobrescritos pelo valor antigo
+            where=and_(
+                ProjectItem.content_hash.is_distinct_from(stmt.excluded.content_hash),
+                ProjectItem.remote_sync_status.is_distinct_from("pending"),
+            ),
+        )
+        await db.execute(stmt)
+
+
+async def _bulk_delete_orphan_items(db: AsyncSession, project: GithubProject, seen_node_ids: set[str]) -> int:
+    """DELETE ... WHERE project_id = :p AND item_node_id <> ALL(:seen) (PostgreSQL)."""
+    seen = bindparam("seen_node_ids", value=list(seen_node_ids), type_=ARRAY(ProjectItem.item_node_id.type))
+    stmt = (
+        delete(ProjectItem)
+        .where(ProjectItem.project_id == project.id, ProjectItem.item_node_id != all_(seen))
+        .execution_options(synchronize_session=False)
+    )
     result = await db.execute(stmt)
-    existing_items = list(result.scalars().all())
-    existing_by_node_id = {item.item_node_id: item for item in existing_items}
+    return result.rowcount or 0
 
-    # Rastrear quais itens foram vistos na sincronização
-    seen_node_ids: set[str] = set()
 
-    count = 0
-    for payload in items:
-        # Derive item_type from labels
-        item_type = derive_item_type_from_labels(payload.labels, payload.title)
+async def _orm_upsert_project_items(
+    db: AsyncSession,
+    project: GithubProject,
+    rows: list[dict[str, Any]],
+) -> None:
+    """Caminho via ORM para bancos sem ON CONFLICT (SQLite nos testes)."""
+    stmt = select(ProjectItem).where(
+        ProjectItem.project_id == project.id,
+        ProjectItem.item_node_id.in_([row["item_node_id"] for row in rows]),
+    )
+    result = await db.execute(stmt)
+    existing_by_node_id = {item.item_node_id: item for item in result.scalars().all()}
 
-        item = existing_by_node_id.get(payload.node_id)
+    for row in rows:
+        item = existing_by_node_id.get(row["item_node_id"])
+        if item and item.remote_sync_status == "pending":
+            continue
         if item:
-            # Atualizar item existente
-            item.content_node_id = payload.content_node_id
-            item.content_type = payload.content_type
-            item.title = payload.title
-            item.url = payload.url
-            item.status = payload.status
-            item.iteration = payload.iteration
-            item.iteration_id = payload.iteration_id
-            item.iteration_start = payload.iteration_start
-            item.iteration_end = payload.iteration_end
-            item.estimate = payload.estimate
-            item.assignees = payload.assignees
-            item.start_date = payload.start_date
-            item.end_date = payload.end_date
-            item.due_date = payload.due_date
-            item.field_values = payload.field_values
-            item.epic_option_id = payload.epic_option_id
-            item.epic_name = payload.epic_name
-            item.labels = payload.labels
-            item.item_type = item_type
-            item.updated_at = payload.updated_at
-            item.last_synced_at = datetime.now(timezone.utc)
-            item.remote_updated_at = payload.remote_updated_at
+            for column in SYNCED_ITEM_COLUMNS:
+                setattr(item, column, row[column])
         else:
-            # Criar novo item
-            item = ProjectItem(
-                account_id=account.id,
-                project_id=project.id,
-                item_node_id=payload.node_id,
-                content_node_id=payload.content_node_id,
-                content_type=payload.content_type,
-                title=payload.title,
-                url=payload.url,
-                status=payload.status,
-                iteration=payload.iteration,
-                iteration_id=payload.iteration_id,
-                iteration_start=payload.iteration_start,
-                iteration_end=payload.iteration_end,
-                estimate=payload.estimate,
-                assignees=payload.assignees,
-                start_date=payload.start_date,
-                end_date=payload.end_date,
-                due_date=payload.due_date,
-                field_values=payload.field_values,
-                epic_option_id=payload.epic_option_id,
-                epic_name=payload.epic_name,
-                labels=payload.labels,
-                item_type=item_type,
-                updated_at=payload.updated_at,
-                remote_updated_at=payload.remote_updated_at,
-                last_synced_at=datetime.now(timezone.utc),
-            )
-            db.add(item)
+            db.add(ProjectItem(**row))
 
-        seen_node_ids.add(payload.node_id)
-        count += 1
 
-    # Deletar itens que não existem mais no GitHub (órfãos)
+async def _orm_delete_orphan_items(db: AsyncSession, project: GithubProject, seen_node_ids: set[str]) -> int:
+    """Caminho via ORM para bancos sem ALL(array) (SQLite nos testes)."""
+    stmt = select(ProjectItem).where(
+        ProjectItem.project_id == project.id,
+        ProjectItem.item_node_id.not_in(seen_node_ids),
+    )
+    result = await db.execute(stmt)
     deleted_count = 0
-    for item in existing_items:
-        if item.item_node_id not in seen_node_ids:
-            print(f"🗑️  [SYNC] Deletando item órfão: {item.id} - {item.title} (não existe mais no GitHub)")
-            await db.delete(item)
-            deleted_count += 1
+    for item in result.scalars().all():
+        await db.delete(item)
+        deleted_count += 1
+    return deleted_count
+
+
+async def _load_item_hashes(
+    db: AsyncSession,
+    project: GithubProject,
+    item_node_ids: Iterable[str] | None = None,
+) -> dict[str, str | None]:
+    stmt = select(ProjectItem.item_node_id, ProjectItem.content_hash).where(ProjectItem.project_id == project.id)
+    if item_node_ids is not None:
+        stmt = stmt.where(ProjectItem.item_node_id.in_(list(item_node_ids)))
+    result = await db.execute(stmt)
+    return {node_id: content_hash for node_id, content_hash in result.all()}
+
+
+async def _write_project_item_page(
+    db: AsyncSession,
+    account: Account,
+    project: GithubProject,
+    items: list[ProjectItemPayload],
+    existing_hashes: dict[str, str | None],
+    synced_at: datetime,
+    result: ProjectSyncResult,
+) -> None:
+    """
+    Grava uma página de itens, pulando os que têm o mesmo hash de conteúdo.
+
+    `existing_hashes` é atualizado com os hashes gravados para que o mesmo item
+    repetido em páginas seguintes não seja escrito de novo.
+    """
+    # Um mesmo item não pode aparecer duas vezes no mesmo INSERT ... ON CONFLICT
+    rows_by_node_id = {
+        payload.node_id: _project_item_row(account, project, payload, synced_at) for payload in items
+    }
+    changed_rows = [
+        row
+        for node_id, row in rows_by_node_id.items()
+        if node_id not in existing_hashes or existing_hashes[node_id] != row["content_hash"]
+    ]
+
+    if changed_rows:
+        if _is_postgres(db):
+            await _bulk_upsert_project_items(db, changed_rows)
+        else:
+            await _orm_upsert_project_items(db, project, changed_rows)
+        await db.flush()
+        for row in changed_rows:
+            existing_hashes[row["item_node_id"]] = row["content_hash"]
+
+    result.total += len(rows_by_node_id)
+    result.changed += len(changed_rows)
+    result.unchanged += len(rows_by_node_id) - len(changed_rows)
+
+
+async def _prune_project_items(
+    db: AsyncSession,
+    project: GithubProject,
+    seen_node_ids: set[str],
+    synced_at: datetime,
+    result: ProjectSyncResult,
+) -> None:
+    """Remove os itens que não existem mais no GitHub e marca o projeto como sincronizado."""
+    if _is_postgres(db):
+        result.deleted = await _bulk_delete_orphan_items(db, project, seen_node_ids)
+    else:
+        result.deleted = await _orm_delete_orphan_items(db, project, seen_node_ids)
 
-    if deleted_count > 0:
-        print(f"🗑️  [SYNC] Total de {deleted_count} itens órfãos deletados do projeto {project.id}")
+    if result.deleted > 0:
+        logger.info(f"Total de {result.deleted} itens órfãos deletados do projeto {project.id}")
 
-    project.last_synced_at = datetime.now(timezone.utc)
+    project.last_synced_at = synced_at
     await db.flush()
-    return count
 
 
-async def sync_github_project(
+async def link_project_item_parents(db: AsyncSession, project: GithubProject) -> int:
+    """
+    Resolve `parent_content_node_id` (issue pai no GitHub) para `parent_item_id`.
+
+    Lê só as colunas de ligação do projeto, monta o mapa content_node_id -> id em
+    memória e grava as diferenças num único UPDATE em lote (executemany pela PK).
+    Pais fora do projeto ficam como None.
+    """
+    stmt = select(
+        ProjectItem.id,
+        ProjectItem.content_node_id,
+        ProjectItem.parent_content_node_id,
+        ProjectItem.parent_item_id,
+    ).where(ProjectItem.project_id == project.id)
+    rows = (await db.execute(stmt)).all()
+
+    id_by_content_node = {row.content_node_id: row.id for row in rows if row.content_node_id}
+    changes: list[dict[str, Any]] = []
+    for row in rows:
+        parent_id = id_by_content_node.get(row.parent_content_node_id) if row.parent_content_node_id else None
+        if parent_id == row.id:
+            parent_id = None
+        if parent_id != row.parent_item_id:
+            changes.append({"id": row.id, "parent_item_id": parent_id})
+
+    if changes:
+        await db.execute(update(ProjectItem), changes)
+    return len(changes)
+
+
+async def upsert_project_items(
+    db: AsyncSession,
+    account: Account,
+    project: GithubProject,
+    items: list[ProjectItemPayload],
+    seen_node_ids: set[str] | None = None,
+) -> ProjectSyncResult:
+    """
+    Grava os itens recebidos e remove os órfãos do projeto.
+
+    `seen_node_ids` é o conjunto completo de itens existentes no GitHub. Quando
+    omitido, considera-se que `items` contém o projeto inteiro (sync completo);
+    no sync incremental `items` traz apenas os itens alterados.
+
+    Só são escritas as linhas cujo hash de conteúdo mudou; para as demais
+    apenas o `last_synced_at` do projeto avança. No PostgreSQL a escrita é feita
+    por conjunto (INSERT ... ON CONFLICT em lotes e um único DELETE para os
+    órfãos), sem carregar a tabela na sessão.
+    """
+    if seen_node_ids is None:
+        seen_node_ids = {payload.node_id for payload in items}
+
+    synced_at = datetime.now(UTC)
+    result = ProjectSyncResult()
+    existing_hashes = await _load_item_hashes(db, project)
+    await _write_project_item_page(db, account, project, items, existing_hashes, synced_at, result)
+    await _prune_project_items(db, project, seen_node_ids, synced_at, result)
+    if result.changed or result.deleted:
+        await link_project_item_parents(db, project)
+    return result
+
+
+def _needs_full_sync(project: GithubProject, now: datetime) -> bool:
+    if not project.items_high_water_mark or not project.last_full_sync_at:
+        return True
+    interval = timedelta(minutes=settings.github_full_sync_interval_minutes)
+    return now - ensure_timezone(project.last_full_sync_at) >= interval
+
+
+async def sync_github_project(
+    db: AsyncSession,
+    account: Account,
+    project: GithubProject,
+    token: str,
+    full: bool | None = None,
+    priority: str = PRIORITY_INTERACTIVE,
+) -> ProjectSyncResult:
+    """
+    Sincroniza os itens do projeto com o GitHub.
+
+    Por padrão roda em modo incremental: lista apenas id/updatedAt de cada item,
+    busca os dados completos somente dos itens alterados desde o último
+    high-water mark e remove os que saíram do projeto. A reconciliação completa
+    (todos os itens) acontece no primeiro sync, a cada
+    `github_full_sync_interval_minutes` ou quando `full=True`.
+
+    Os itens são processados em streaming: cada página é gravada enquanto a
+    próxima já está sendo buscada, e os órfãos são removidos ao final.
+
+    Syncs disparados pelo scheduler ou por webhooks usam
+    `priority=PRIORITY_BACKGROUND` para não consumir a folga de rate limit
+    reservada às requisições dos usuários.
+    """
+    now = datetime.now(UTC)
+    if full is None:
+        full = _needs_full_sync(project, now)
+
+    synced_at = now
+    result = ProjectSyncResult()
+    high_water_mark: datetime | None = None
+
+    async with GithubGraphQLClient(token, priority=priority) as client:
+        # Metadados (campos e opções) mudam pouco: atualizados em cadência própria,
+        # em todo sync completo ou após um webhook projects_v2
+        if full or _needs_metadata_refresh(project, now):
+            await refresh_project_metadata(client, db, project)
+
+        # Apenas node_id -> hash fica em memória; os payloads são gravados página a página
+        existing_hashes = await _load_item_hashes(db, project)
+        fields = await _load_project_fields(db, project.id)
+
+        if full:
+            seen_node_ids: set[str] = set()
+            pages = iter_project_item_pages(client, project.project_node_id, fields)
+        else:
+            stamps = await fetch_project_item_stamps(client, project.project_node_id)
+            seen_node_ids = {stamp.node_id for stamp in stamps}
+            previous_mark = ensure_timezone(project.items_high_water_mark)
+            # >= para não perder itens alterados no mesmo segundo do último sync
+            changed_ids = [
+                stamp.node_id
+                for stamp in stamps
+                if stamp.node_id not in existing_hashes
+                or stamp.updated_at is None
+                or stamp.updated_at >= previous_mark
+            ]
+            high_water_mark = max((stamp.updated_at for stamp in stamps if stamp.updated_at), default=None)
+            pages = iter_project_items_by_ids(client, changed_ids, fields)
+
+        # A próxima página já está sendo buscada enquanto a atual é gravada
+        async for page in pages:
+            await _write_project_item_page(db, account, project, page, existing_hashes, synced_at, result)
+            if full:
+                seen_node_ids.update(payload.node_id for payload in page)
+                for payload in page:
+                    mark = payload_high_water_mark(payload)
+                    if mark and (high_water_mark is None or mark > high_water_mark):
+                        high_water_mark = mark
+
+    await _prune_project_items(db, project, seen_node_ids, synced_at, result)
+    if result.changed or result.deleted:
+        await link_project_item_parents(db, project)
+
+    if high_water_mark:
+        project.items_high_water_mark = high_water_mark
+    if full:
+        project.last_full_sync_at = now
+    await db.commit()
+    return result
+
+
+async def refresh_project_items(
     db: AsyncSession,
     account: Account,
     project: GithubProject,
     token: str,
-) -> int:
-    async with GithubGraphQLClient(token) as client:
-        # Buscar metadados atualizados do projeto (campos e opções)
-        metadata = await fetch_project_metadata(client, project.owner_login, project.project_number)
-        project.field_mappings = metadata.field_mappings
-        await sync_project_fields(db, project, metadata.field_mappings)
-        await db.flush()
+    item_node_ids: Iterable[str],
+    priority: str = PRIORITY_INTERACTIVE,
+) -> ProjectSyncResult:
+    """
+    Atualiza apenas os itens informados, sem percorrer o projeto inteiro.
+
+    Usado pelos webhooks: busca os itens via nodes(ids: [...]) com o mesmo
+    parser do sync e grava somente essas linhas. Não remove órfãos nem move o
+    high-water mark do projeto; isso continua a cargo do sync completo/incremental.
+    """
+    ids = list(dict.fromkeys(node_id for node_id in item_node_ids if node_id))
+    result = ProjectSyncResult()
+    if not ids:
+        return result
 
-        # Buscar itens do projeto
-        items = await fetch_project_items(client, project.project_node_id)
+    synced_at = datetime.now(UTC)
+    existing_hashes = await _load_item_hashes(db, project, ids)
+    fields = await _load_project_fields(db, project.id)
+    async with GithubGraphQLClient(token, priority=priority) as client:
+        async for page in iter_project_items_by_ids(client, ids, fields):
+            await _write_project_item_page(db, account, project, page, existing_hashes, synced_at, result)
 
-    count = await upsert_project_items(db, account, project, items)
+    if result.changed:
+        await link_project_item_parents(db, project)
     await db.commit()
-    return count
+    return result
 
 
 async def _load_project_fields(db: AsyncSession, project_id: int) -> list[GithubProjectField]:
@@ -1046,6 +1878,120 @@ async def _load_project_fields(db: AsyncSession, project_id: int) -> list[Github
     return list(result.scalars().all())
 
 
+def _option_entries(options_raw: Any) -> list[dict[str, Any]]:
+    if isinstance(options_raw, dict):
+        options_raw = options_raw.get("iterations") or options_raw.get("options") or []
+    if isinstance(options_raw, list):
+        return [option for option in options_raw if isinstance(option, dict)]
+    return []
+
+
+@dataclass(frozen=True)
+class ProjectFieldInfo:
+    """Cópia somente leitura de um GithubProjectField, com as opções indexadas por id e por nome."""
+    field_id: str
+    field_name: str
+    field_type: str
+    options: Any
+    options_by_id: dict[str, dict[str, Any]]
+    options_by_name: dict[str, dict[str, Any]]
+
+    @classmethod
+    def from_model(cls, field: GithubProjectField) -> ProjectFieldInfo:
+        by_id: dict[str, dict[str, Any]] = {}
+        by_name: dict[str, dict[str, Any]] = {}
+        options = copy.deepcopy(field.options)
+        for option in _option_entries(options):
+            option_id = option.get("id")
+            if isinstance(option_id, str) and option_id:
+                by_id.setdefault(option_id, option)
+            name = option.get("name") or option.get("title")
+            if isinstance(name, str) and name.strip():
+                by_name.setdefault(name.strip().lower(), option)
+        return cls(
+            field_id=field.field_id,
+            field_name=field.field_name,
+            field_type=field.field_type,
+            options=options,
+            options_by_id=by_id,
+            options_by_name=by_name,
+        )
+
+    def option(self, option_id: str | None) -> dict[str, Any] | None:
+        return self.options_by_id.get(option_id) if option_id else None
+
+    def option_by_name(self, name: str | None) -> dict[str, Any] | None:
+        return self.options_by_name.get(name.strip().lower()) if isinstance(name, str) else None
+
+
+@dataclass
+class ProjectFieldIndex:
+    """
+    Campos de um projeto prontos para consulta: por id, por nome e os campos
+    usados nas edições (Status, Iteration, Epic), resolvidos uma única vez.
+    """
+    fields: tuple[ProjectFieldInfo, ...]
+    by_id: dict[str, ProjectFieldInfo]
+    by_name: dict[str, ProjectFieldInfo]
+    status: ProjectFieldInfo | None
+    iteration: ProjectFieldInfo | None
+    epic: ProjectFieldInfo | None
+    fields_hash: str | None
+    built_at: float
+
+    @classmethod
+    def build(cls, models: Iterable[GithubProjectField], fields_hash: str | None = None) -> ProjectFieldIndex:
+        fields = tuple(ProjectFieldInfo.from_model(model) for model in models)
+        return cls(
+            fields=fields,
+            by_id={field.field_id: field for field in fields},
+            by_name={(field.field_name or "").lower(): field for field in fields},
+            status=_status_field_from_collection(fields),
+            iteration=_resolve_iteration_field_from_collection(fields),
+            epic=_resolve_epic_field_from_collection(fields),
+            fields_hash=fields_hash,
+            built_at=time.monotonic(),
+        )
+
+    @cached_property
+    def iteration_options(self) -> list[IterationOptionData]:
+        return _extract_iteration_options(self.iteration)
+
+    @cached_property
+    def epic_options(self) -> list[EpicOptionData]:
+        return _extract_epic_options(self.epic)
+
+
+# Índices de campos por projeto (em memória, por processo)
+_project_field_indexes: dict[int, ProjectFieldIndex] = {}
+
+
+async def get_project_field_index(db: AsyncSession, project: GithubProject) -> ProjectFieldIndex:
+    """
+    Índice dos campos do projeto, reconstruído a partir do banco só quando o
+    `field_mappings_hash` do projeto não é mais o do índice (campos alterados
+    por este ou por outro processo) ou após `github_field_cache_ttl_seconds`.
+    """
+    index = _project_field_indexes.get(project.id)
+    if (
+        index is not None
+        and index.fields_hash == project.field_mappings_hash
+        and time.monotonic() - index.built_at < settings.github_field_cache_ttl_seconds
+    ):
+        return index
+    index = ProjectFieldIndex.build(await _load_project_fields(db, project.id), project.field_mappings_hash)
+    _project_field_indexes[project.id] = index
+    return index
+
+
+def invalidate_project_field_index(project_id: int | None = None) -> None:
+    """Descarta o índice de um projeto (ou de todos, sem `project_id`)."""
+    if project_id is None:
+        _project_field_indexes.clear()
+    else:
+        _project_field_indexes.pop(project_id, None)
+
+
 async def sync_project_fields(
     db: AsyncSession,
     project: GithubProject,
@@ -1110,9 +2056,8 @@ def ensure_timezone(value: Optional[datetime]) -> Optional[datetime]:
 async def resolve_iteration_field(
     db: AsyncSession,
     project: GithubProject,
-) -> Optional[GithubProjectField]:
-    fields = await _load_project_fields(db, project.id)
-    return _resolve_iteration_field_from_collection(fields)
+) -> ProjectFieldInfo | None:
+    return (await get_project_field_index(db, project)).iteration
 
 
 def _resolve_iteration_field_from_collection(
@@ -1129,9 +2074,8 @@ def _resolve_iteration_field_from_collection(
 async def resolve_epic_field(
     db: AsyncSession,
     project: GithubProject,
-) -> Optional[GithubProjectField]:
-    fields = await _load_project_fields(db, project.id)
-    return _resolve_epic_field_from_collection(fields)
+) -> ProjectFieldInfo | None:
+    return (await get_project_field_index(db, project)).epic
 
 
 def _resolve_epic_field_from_collection(
@@ -1160,11 +2104,10 @@ def _resolve_epic_field_from_collection(
 
 
 async def list_iteration_options(db: AsyncSession, project: GithubProject) -> list[IterationOptionData]:
-    field = await resolve_iteration_field(db, project)
-    return _extract_iteration_options(field)
+    return list((await get_project_field_index(db, project)).iteration_options)
 
 
-def _extract_iteration_options(iteration_field: Optional[GithubProjectField]) -> list[IterationOptionData]:
+def _extract_iteration_options(iteration_field: ProjectFieldInfo | None) -> list[IterationOptionData]:
     print(f"DEBUG _extract_iteration_options: field={iteration_field}")
     if not iteration_field:
         print("DEBUG: iteration_field is None")
@@ -1203,11 +2146,10 @@ def _extract_iteration_options(iteration_field: Optional[GithubProjectField]) ->
 
 
 async def list_epic_options(db: AsyncSession, project: GithubProject) -> list[EpicOptionData]:
-    field = await resolve_epic_field(db, project)
-    return _extract_epic_options(field)
+    return list((await get_project_field_index(db, project)).epic_options)
 
 
-def _extract_epic_options(epic_field: Optional[GithubProjectField]) -> list[EpicOptionData]:
+def _extract_epic_options(epic_field: ProjectFieldInfo | None) -> list[EpicOptionData]:
     if not epic_field or not epic_field.options:
         print(f"DEBUG: _extract_epic_options - epic_field={epic_field}, options={epic_field.options if epic_field else None}")
         return []
@@ -1239,44 +2181,25 @@ def _extract_epic_options(epic_field: Optional[GithubProjectField]) -> list[Epic
 
 
 def resolve_iteration_option(
-    iteration_field: Optional[GithubProjectField],
+    iteration_field: ProjectFieldInfo | None,
     iteration_id: Optional[str],
 ) -> tuple[Optional[str], Optional[datetime], Optional[datetime]]:
-    if not iteration_field or not iteration_id:
+    option = iteration_field.option(iteration_id) if iteration_field else None
+    if not option:
         return None, None, None
-    options = iteration_field.options or {}
-    iterations = []
-    if isinstance(options, dict):
-        iterations = options.get("iterations") or []
-    elif isinstance(options, list):
-        iterations = options
-    for option in iterations or []:
-        if option.get("id") == iteration_id:
-            title = option.get("title")
-            start = parse_date_value(option.get("startDate"))
-            end = compute_iteration_end(start, option.get("duration"))
-            return title, start, end
-    return None, None, None
+    start = parse_date_value(option.get("startDate"))
+    end = compute_iteration_end(start, option.get("duration"))
+    return option.get("title"), start, end
 
 
 def resolve_epic_option(
-    epic_field: Optional[GithubProjectField],
+    epic_field: ProjectFieldInfo | None,
     epic_option_id: Optional[str],
 ) -> Optional[str]:
-    if not epic_field or not epic_option_id:
+    option = epic_field.option(epic_option_id) if epic_field else None
+    if not option:
         return None
-
-    options_raw = epic_field.options
-    entries: list[dict[str, Any]] = []
-    if isinstance(options_raw, dict):
-        entries = options_raw.get("options") or []
-    elif isinstance(options_raw, list):
-        entries = options_raw
-
-    for option in entries or []:
-        if option.get("id") == epic_option_id:
-            return option.get("name") or option.get("title")
-    return None
+    return option.get("name") or option.get("title")
 
 
 def _normalize_single_select_color(raw: Optional[str]) -> Optional[str]:
@@ -1293,7 +2216,7 @@ def _normalize_single_select_color(raw: Optional[str]) -> Optional[str]:
     return normalized
 
 
-async def _require_epic_field(db: AsyncSession, project: GithubProject) -> GithubProjectField:
+async def _require_epic_field(db: AsyncSession, project: GithubProject) -> ProjectFieldInfo:
     field = await resolve_epic_field(db, project)
     if not field:
         raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Campo de épico não configurado")
@@ -1307,9 +2230,7 @@ async def _refresh_epic_field_cache(
     db: AsyncSession,
     project: GithubProject,
 ) -> None:
-    metadata = await fetch_project_metadata(client, project.owner_login, project.project_number)
-    await sync_project_fields(db, project, metadata.field_mappings)
-    await db.flush()
+    await refresh_project_metadata(client, db, project)
 
 
 async def _upsert_single_select_option(
@@ -1974,177 +2895,136 @@ async def setup_project_fields(
 
         # Atualizar cache de campos
         if report["iteration"]["created"] or report["epic"]["created"] or report["estimate"]["created"]:
-            metadata = await fetch_project_metadata(client, project.owner_login, project.project_number)
-            await sync_project_fields(db, project, metadata.field_mappings)
-            await db.flush()
+            await refresh_project_metadata(client, db, project)
 
     return report
 
 
-async def _update_remote_iteration(
-    client: GithubGraphQLClient,
-    project_node_id: str,
-    item_node_id: str,
-    field_id: str,
-    iteration_id: str,
-) -> None:
-    """
-    Atualiza o campo Iteration de um item do projeto.
-
-    Args:
-        client: Cliente GraphQL autenticado
-        project_node_id: ID do projeto
-        item_node_id: ID do item (issue/PR)
-        field_id: ID do campo Iteration
-        iteration_id: ID da iteration para atribuir
-    """
-    mutation = """
-    mutation($input: UpdateProjectV2ItemFieldValueInput!) {
-      updateProjectV2ItemFieldValue(input: $input) {
-        projectV2Item {
-          id
-        }
-      }
-    }
-    """
-    variables = {
-        "input": {
-            "projectId": project_node_id,
-            "itemId": item_node_id,
-            "fieldId": field_id,
-            "value": {
-                "iterationId": iteration_id,
-            },
-        }
-    }
-    await client.execute(mutation, variables)
-
-
-async def update_item_iteration(
-    db: AsyncSession,
-    account: Account,
-    project: GithubProject,
-    item: ProjectItem,
-    iteration_id: Optional[str],
-) -> ProjectItem:
-    """
-    Atualiza a sprint/iteration de um item do projeto.
-
-    Args:
-        db: Sessão do banco de dados
-        account: Conta do usuário
-        project: Projeto do GitHub
-        item: Item a ser atualizado
-        iteration_id: ID da iteration (ou None para remover)
+# Campos do item editáveis pela API (PATCH e atualização em lote)
+EDITABLE_ITEM_FIELDS = {
+    "start_date",
+    "end_date",
+    "due_date",
+    "iteration_id",
+    "iteration_title",
+    "status",
+    "epic_option_id",
+    "epic_name",
+}
 
-    Returns:
-        Item atualizado
-    """
-    iteration_field = await resolve_iteration_field(db, project)
-    if not iteration_field:
-        raise HTTPException(
-            status.HTTP_404_NOT_FOUND,
-            detail="Campo Iteration não encontrado no projeto"
-        )
+# Mutations com alias por documento GraphQL na atualização em lote
+ITEM_MUTATIONS_PER_DOCUMENT = 25
 
-    token = await get_github_token(db, account)
 
-    async with GithubGraphQLClient(token) as client:
-        if iteration_id:
-            # Atualizar para nova iteration
-            await _update_remote_iteration(
-                client,
-                project.project_node_id,
-                item.item_node_id,
-                iteration_field.field_id,
-                iteration_id,
-            )
+@dataclass
+class ItemFieldMutation:
+    """Alteração de um campo de um item no GitHub (`value=None` limpa o campo)."""
+    item_node_id: str
+    field_id: str
+    value: dict[str, Any] | None = None
 
-            # Resolver dados da iteration
-            iteration_title, iteration_start, iteration_end = resolve_iteration_option(
-                iteration_field,
-                iteration_id,
-            )
 
-            item.iteration = iteration_title
-            item.iteration_id = iteration_id
-            item.iteration_start = iteration_start
-            item.iteration_end = iteration_end
-        else:
-            # Remover iteration
-            await _clear_remote_status(
-                client,
-                project.project_node_id,
-                item.item_node_id,
-                iteration_field.field_id,
-            )
-            item.iteration = None
-            item.iteration_id = None
-            item.iteration_start = None
-            item.iteration_end = None
+@dataclass
+class BulkItemUpdateResult:
+    item_id: int
+    item: ProjectItem | None = None
+    error: str | None = None
 
-    await db.flush()
-    await db.refresh(item)
-    return item
 
+def _normalize_status(raw_status: Any) -> str | None:
+    if isinstance(raw_status, str):
+        stripped_status = raw_status.strip()
+        return stripped_status if stripped_status else None
+    return None
 
-async def apply_local_project_item_updates(
-    db: AsyncSession,
-    account: Account,
-    project: GithubProject,
-    item: ProjectItem,
-    updates: dict[str, Any],
-    editor_id: Optional[uuid.UUID],
-) -> ProjectItem:
-    if not updates:
-        return item
 
+def _validate_item_updates(project: GithubProject, updates: dict[str, Any]) -> None:
     start_date = ensure_timezone(updates.get("start_date")) if "start_date" in updates else None
     end_date = ensure_timezone(updates.get("end_date")) if "end_date" in updates else None
-    due_date = ensure_timezone(updates.get("due_date")) if "due_date" in updates else None
 
     if start_date and end_date and end_date < start_date:
         raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail="end_date deve ser maior ou igual a start_date")
 
-    has_changes = False
-
     if "status" in updates:
-        raw_status = updates.get("status")
-        if isinstance(raw_status, str):
-            stripped_status = raw_status.strip()
-            new_status = stripped_status if stripped_status else None
-        else:
-            new_status = None
-
+        new_status = _normalize_status(updates.get("status"))
         if new_status and project.status_columns:
             allowed_statuses = [column for column in project.status_columns if column]
             if new_status not in allowed_statuses:
                 raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Status inválido para este projeto")
 
+
+def plan_project_item_update(
+    project: GithubProject,
+    item: ProjectItem,
+    updates: dict[str, Any],
+    fields: ProjectFieldIndex,
+) -> list[ItemFieldMutation]:
+    """
+    Valida as alterações localmente e retorna as mutations de campos a enviar ao GitHub.
+
+    Apenas campos que mudaram geram mutation. Datas, nomes e o épico são só
+    locais: os épicos do Tactyo são labels (`EpicOption`), não uma opção de um
+    campo single-select do GitHub. Levanta HTTPException (422/404/400) quando a alteração é inválida.
+    """
+    _validate_item_updates(project, updates)
+    mutations: list[ItemFieldMutation] = []
+
+    if "status" in updates:
+        new_status = _normalize_status(updates.get("status"))
         current_normalized = item.status.strip() if isinstance(item.status, str) else None
         if new_status != current_normalized:
-            await _sync_remote_status(db, account, project, item, new_status)
-
-        item.status = new_status
-        has_changes = True
+            if not fields.status:
+                raise HTTPException(
+                    status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Campo Status não está configurado no projeto"
+                )
+            value = None
+            if new_status is not None:
+                option_id = (fields.status.option_by_name(new_status) or {}).get("id")
+                if not option_id:
+                    raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Status indisponível no GitHub")
+                value = {"singleSelectOptionId": option_id}
+            mutations.append(ItemFieldMutation(item.item_node_id, fields.status.field_id, value))
 
-    if "start_date" in updates:
-        item.start_date = start_date
-        has_changes = True
+    if "iteration_id" in updates:
+        iteration_id = updates.get("iteration_id") or None
+        if iteration_id != item.iteration_id:
+            if not fields.iteration:
+                raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Campo Iteration não encontrado no projeto")
+            value = {"iterationId": iteration_id} if iteration_id else None
+            mutations.append(ItemFieldMutation(item.item_node_id, fields.iteration.field_id, value))
+
+    if mutations:
+        if not project.project_node_id:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Projeto sem identificador do GitHub")
+        if not item.item_node_id:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Item sem identificador do Project")
+    return mutations
+
+
+def _apply_item_updates_locally(
+    project: GithubProject,
+    item: ProjectItem,
+    updates: dict[str, Any],
+    fields: ProjectFieldIndex,
+    editor_id: uuid.UUID | None,
+) -> bool:
+    """Aplica as alterações (já validadas) nas colunas locais do item."""
+    has_changes = False
 
-    if "end_date" in updates:
-        item.end_date = end_date
+    if "status" in updates:
+        item.status = _normalize_status(updates.get("status"))
+        item.status_category = derive_status_category(item.status, project.status_columns)
         has_changes = True
 
-    if "due_date" in updates:
-        item.due_date = due_date
-        has_changes = True
+    for key in ("start_date", "end_date", "due_date"):
+        if key in updates:
+            setattr(item, key, ensure_timezone(updates.get(key)))
+            has_changes = True
 
     if "iteration_id" in updates:
-        iteration_field = await resolve_iteration_field(db, project)
         iteration_id = updates.get("iteration_id")
         if iteration_id:
-            title_from_options, iteration_start, iteration_end = resolve_iteration_option(iteration_field, iteration_id)
+            title_from_options, iteration_start, iteration_end = resolve_iteration_option(fields.iteration, iteration_id)
             item.iteration_id = iteration_id
             item.iteration = updates.get("iteration_title") or title_from_options or item.iteration
             item.iteration_start = iteration_start
@@ -2157,10 +3037,9 @@ async def apply_local_project_item_updates(
         has_changes = True
 
     if "epic_option_id" in updates or "epic_name" in updates:
-        epic_field = await resolve_epic_field(db, project)
         epic_option_id = updates.get("epic_option_id")
         if epic_option_id:
-            resolved_name = updates.get("epic_name") or resolve_epic_option(epic_field, epic_option_id) or item.epic_name
+            resolved_name = updates.get("epic_name") or resolve_epic_option(fields.epic, epic_option_id) or item.epic_name
             item.epic_option_id = epic_option_id
             item.epic_name = resolved_name
         else:
@@ -2173,133 +3052,203 @@ async def apply_local_project_item_updates(
     if has_changes:
         item.last_local_edit_at = datetime.now(timezone.utc)
         item.last_local_edit_by = editor_id
-        await db.flush()
-
-    return item
+        # Cópia local divergiu do último payload remoto: força regravação no próximo sync
+        item.content_hash = None
+    return has_changes
 
 
-async def _sync_remote_status(
+async def apply_local_project_item_updates(
     db: AsyncSession,
     account: Account,
     project: GithubProject,
     item: ProjectItem,
-    new_status: Optional[str],
-) -> None:
-    if not project.project_node_id:
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Projeto sem identificador do GitHub")
-    if not item.item_node_id:
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Item sem identificador do Project")
-
-    status_field = await _resolve_status_field(db, project)
-    if not status_field:
-        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Campo Status não está configurado no projeto")
+    updates: dict[str, Any],
+    editor_id: uuid.UUID | None,
+) -> ProjectItem:
+    """
+    Aplica a edição de um item.
 
-    token = await get_github_token(db, account)
+    Campos e opções são resolvidos uma única vez (`plan_project_item_update`) e
+    as alterações de campos do GitHub (status, sprint) vão num só documento de
+    mutations; o item local só é alterado se o GitHub aceitar. Datas e épico
+    são só locais.
 
-    async with GithubGraphQLClient(token) as client:
-        if new_status is None:
-            await _clear_remote_status(
-                client,
-                project.project_node_id,
-                item.item_node_id,
-                status_field.field_id,
-            )
-            return
+    Com `github_write_behind`, as alterações vão para o outbox na mesma
+    transação da edição local e são enviadas depois (ver `item_outbox`).
+    """
+    if not updates:
+        return item
 
-        option_id = _match_status_option(status_field.options, new_status)
-        if not option_id:
-            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Status indisponível no GitHub")
+    fields = await get_project_field_index(db, project)
+    mutations = plan_project_item_update(project, item, updates, fields)
 
-        await _update_remote_single_select(
-            client,
-            project.project_node_id,
-            item.item_node_id,
-            status_field.field_id,
-            option_id,
-        )
+    if mutations and settings.github_write_behind:
+        from app.services.item_outbox import enqueue_item_mutations
 
+        await enqueue_item_mutations(db, project, item, mutations)
+    elif mutations:
+        token = await get_github_token(db, account)
+        document, variables = build_item_field_mutation_document(project.project_node_id, mutations)
+        async with GithubGraphQLClient(token) as client:
+            _, errors = await client.execute_with_errors(document, variables)
+        if errors:
+            message = ", ".join(dict.fromkeys(error.get("message", "Erro desconhecido") for error in errors))
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=message)
 
-async def _resolve_status_field(db: AsyncSession, project: GithubProject) -> Optional[GithubProjectField]:
-    fields = await _load_project_fields(db, project.id)
-    for field in fields:
-        if (field.field_name or "").lower() == "status":
-            return field
-    return None
+    if _apply_item_updates_locally(project, item, updates, fields, editor_id):
+        await db.flush()
 
+    return item
 
-def _match_status_option(options: Any, status_name: str) -> Optional[str]:
-    normalized = status_name.strip().lower()
 
-    if isinstance(options, list):
-        iterable = options
-    elif isinstance(options, dict):
-        iterable = options.get("options") or options.get("values") or []
-    else:
-        iterable = []
+def build_item_field_mutation_document(
+    project_node_id: str,
+    mutations: list[ItemFieldMutation],
+) -> tuple[str, dict[str, Any]]:
+    """Monta um único documento GraphQL com uma mutation com alias (`m0`, `m1`...) por alteração."""
+    definitions: list[str] = []
+    selections: list[str] = []
+    variables: dict[str, Any] = {}
+    for index, mutation in enumerate(mutations):
+        field_input: dict[str, Any] = {
+            "projectId": project_node_id,
+            "itemId": mutation.item_node_id,
+            "fieldId": mutation.field_id,
+        }
+        if mutation.value is None:
+            definitions.append(f"$input{index}: ClearProjectV2ItemFieldValueInput!")
+            selections.append(
+                f"m{index}: clearProjectV2ItemFieldValue(input: $input{index}) {{ projectV2Item {{ id }} }}"
+            )
+        else:
+            definitions.append(f"$input{index}: UpdateProjectV2ItemFieldValueInput!")
+            selections.append(
+                f"m{index}: updateProjectV2ItemFieldValue(input: $input{index}) {{ projectV2Item {{ id }} }}"
+            )
+            field_input["value"] = mutation.value
+        variables[f"input{index}"] = field_input
 
-    for option in iterable:
-        if not isinstance(option, dict):
-            continue
-        name = option.get("name") or option.get("title")
-        if isinstance(name, str) and name.strip().lower() == normalized:
-            option_id = option.get("id")
-            if isinstance(option_id, str) and option_id:
-                return option_id
-    return None
+    document = "mutation(" + ", ".join(definitions) + ") {\n  " + "\n  ".join(selections) + "\n}"
+    return document, variables
 
 
-async def _update_remote_single_select(
+async def apply_item_field_mutations(
     client: GithubGraphQLClient,
     project_node_id: str,
-    item_node_id: str,
-    field_id: str,
-    option_id: str,
-) -> None:
-    mutation = """
-    mutation($input: UpdateProjectV2ItemFieldValueInput!) {
-      updateProjectV2ItemFieldValue(input: $input) {
-        projectV2Item {
-          id
-        }
-      }
-    }
+    mutations: list[ItemFieldMutation],
+) -> list[str | None]:
     """
-    variables = {
-        "input": {
-            "projectId": project_node_id,
-            "itemId": item_node_id,
-            "fieldId": field_id,
-            "value": {
-                "singleSelectOptionId": option_id,
-            },
-        }
-    }
-    await client.execute(mutation, variables)
+    Envia as alterações em documentos de até ITEM_MUTATIONS_PER_DOCUMENT mutations.
 
+    Os documentos vão em sequência (o GitHub recomenda mutations em série).
+    Retorna, para cada alteração, None em caso de sucesso ou a mensagem de erro.
+    """
+    errors: list[str | None] = [None] * len(mutations)
+    for offset in range(0, len(mutations), ITEM_MUTATIONS_PER_DOCUMENT):
+        chunk = mutations[offset:offset + ITEM_MUTATIONS_PER_DOCUMENT]
+        document, variables = build_item_field_mutation_document(project_node_id, chunk)
+        try:
+            _, graphql_errors = await client.execute_with_errors(document, variables)
+        except HTTPException as exc:
+            for index in range(len(chunk)):
+                errors[offset + index] = str(exc.detail)
+            continue
 
-async def _clear_remote_status(
-    client: GithubGraphQLClient,
-    project_node_id: str,
-    item_node_id: str,
-    field_id: str,
-) -> None:
-    mutation = """
-    mutation($input: ClearProjectV2ItemFieldValueInput!) {
-      clearProjectV2ItemFieldValue(input: $input) {
-        projectV2Item {
-          id
-        }
-      }
-    }
+        for error in graphql_errors:
+            alias = (error.get("path") or [None])[0]
+            message = error.get("message", "Erro desconhecido")
+            if isinstance(alias, str) and alias.startswith("m") and alias[1:].isdigit():
+                errors[offset + int(alias[1:])] = message
+            else:
+                # Erro sem alias (ex.: documento inválido) invalida o lote inteiro
+                for index in range(len(chunk)):
+                    errors[offset + index] = errors[offset + index] or message
+    return errors
+
+
+async def bulk_update_project_items(
+    db: AsyncSession,
+    account: Account,
+    project: GithubProject,
+    entries: list[tuple[int, dict[str, Any]]],
+    editor_id: uuid.UUID | None,
+) -> list[BulkItemUpdateResult]:
     """
-    variables = {
-        "input": {
-            "projectId": project_node_id,
-            "itemId": item_node_id,
-            "fieldId": field_id,
-        }
-    }
-    await client.execute(mutation, variables)
+    Atualiza vários itens de uma vez.
+
+    Todas as alterações são validadas localmente antes de qualquer chamada ao
+    GitHub; as válidas são enviadas em poucos documentos de mutations com alias
+    e só os itens cujas mutations deram certo são alterados no banco. O commit
+    fica com o chamador, numa única transação. Retorna um resultado por entrada.
+    """
+    item_ids = [item_id for item_id, _ in entries]
+    stmt = select(ProjectItem).where(
+        ProjectItem.id.in_(item_ids),
+        ProjectItem.project_id == project.id,
+        ProjectItem.account_id == account.id,
+    )
+    items_by_id = {item.id: item for item in (await db.execute(stmt)).scalars().all()}
+    fields = await get_project_field_index(db, project)
+
+    results: list[BulkItemUpdateResult] = []
+    planned: list[tuple[BulkItemUpdateResult, ProjectItem, dict[str, Any], list[ItemFieldMutation]]] = []
+    seen_ids: set[int] = set()
+    for item_id, data in entries:
+        result = BulkItemUpdateResult(item_id=item_id)
+        results.append(result)
+        if item_id in seen_ids:
+            result.error = "Item repetido na requisição"
+            continue
+        seen_ids.add(item_id)
+
+        item = items_by_id.get(item_id)
+        if not item:
+            result.error = "Item não encontrado"
+            continue
+
+        remote_timestamp = ensure_timezone(data.get("remote_updated_at"))
+        if remote_timestamp and item.remote_updated_at and remote_timestamp < ensure_timezone(item.remote_updated_at):
+            result.error = "O item foi atualizado no GitHub recentemente. Recarregue e tente novamente."
+            continue
+
+        updates = {key: value for key, value in data.items() if key in EDITABLE_ITEM_FIELDS}
+        if not updates:
+            result.error = "Nenhuma alteração informada"
+            continue
+
+        try:
+            mutations = plan_project_item_update(project, item, updates, fields)
+        except HTTPException as exc:
+            result.error = str(exc.detail)
+            continue
+        planned.append((result, item, updates, mutations))
+
+    all_mutations = [mutation for *_, mutations in planned for mutation in mutations]
+    mutation_errors: list[str | None] = []
+    if all_mutations:
+        token = await get_github_token(db, account)
+        async with GithubGraphQLClient(token) as client:
+            mutation_errors = await apply_item_field_mutations(client, project.project_node_id, all_mutations)
+
+    offset = 0
+    for result, item, updates, mutations in planned:
+        item_errors = [error for error in mutation_errors[offset:offset + len(mutations)] if error]
+        offset += len(mutations)
+        if item_errors:
+            result.error = "; ".join(dict.fromkeys(item_errors))
+            continue
+        _apply_item_updates_locally(project, item, updates, fields, editor_id)
+        result.item = item
+
+    await db.flush()
+    return results
+
+
+def _status_field_from_collection(fields: Iterable[GithubProjectField]) -> GithubProjectField | None:
+    for field in fields:
+        if (field.field_name or "").lower() == "status":
+            return field
+    return None
 
 
 def extract_status_columns(field_mappings: dict[str, Any]) -> list[str] | None:
@@ -2319,6 +3268,32 @@ def extract_status_columns(field_mappings: dict[str, Any]) -> list[str] | None:
     return unique
 
 
+async def recategorize_project_items(db: AsyncSession, project: GithubProject) -> int:
+    """
+    Recalcula `status_category` dos itens após mudança nas colunas do projeto.
+
+    Um UPDATE por status distinto do projeto, só nas linhas cuja categoria muda.
+    """
+    stmt = select(ProjectItem.status).where(ProjectItem.project_id == project.id).distinct()
+    statuses = (await db.execute(stmt)).scalars().all()
+    updated = 0
+    for status_value in statuses:
+        category = derive_status_category(status_value, project.status_columns)
+        status_filter = ProjectItem.status.is_(None) if status_value is None else ProjectItem.status == status_value
+        result = await db.execute(
+            update(ProjectItem)
+            .where(
+                ProjectItem.project_id == project.id,
+                status_filter,
+                ProjectItem.status_category.is_distinct_from(category),
+            )
+            .values(status_category=category)
+            .execution_options(synchronize_session="fetch")
+        )
+        updated += result.rowcount or 0
+    return updated
+
+
 async def create_epic_issue(
     client: GithubGraphQLClient,
     owner: str,
@@ -0,0 +1,136 @@
+"""
+Pool de conexões HTTP compartilhado para as APIs do GitHub.
+
+Mantém um `httpx.AsyncClient` por token (identificado pelo hash), reaproveitado
+por `GithubGraphQLClient` e `GithubRestClient`:
+- keep-alive entre chamadas consecutivas (sem novo handshake TLS por operação)
+- HTTP/2 opcional, quando o pacote `h2` está instalado
+- remoção de clientes ociosos após `github_client_idle_ttl_seconds`
+- fechamento de todas as conexões no shutdown da aplicação
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger("tactyo.github_pool")
+
+GITHUB_API_URL = "https://api.github.com"
+
+
+def token_key(token: str) -> str:
+    """Identificador estável do token sem mantê-lo em texto puro como chave."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def http2_enabled() -> bool:
+    return settings.github_http2 and importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+    last_used: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+
+
+class GithubClientPool:
+    def __init__(self) -> None:
+        self._clients: dict[str, _PooledClient] = {}
+        self._lock = asyncio.Lock()
+
+    def _build_client(self, token: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "User-Agent": "Tactyo/0.1",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            timeout=httpx.Timeout(15.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=settings.github_http_max_connections,
+                max_keepalive_connections=settings.github_http_max_connections,
+                keepalive_expiry=settings.github_http_keepalive_expiry_seconds,
+            ),
+            http2=http2_enabled(),
+        )
+
+    async def _get_entry(self, token: str) -> _PooledClient:
+        key = token_key(token)
+        async with self._lock:
+            await self._evict_idle_locked()
+            entry = self._clients.get(key)
+            loop = asyncio.get_running_loop()
+            # Conexões ficam presas ao event loop em que foram abertas
+            if entry is None or entry.client.is_closed or entry.loop is not loop:
+                entry = _PooledClient(client=self._build_client(token), loop=loop)
+                self._clients[key] = entry
+            return entry
+
+    @asynccontextmanager
+    async def lease(self, token: str) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Empresta o cliente do token durante uma requisição.
+
+        O contador de requisições em andamento impede que um cliente em uso seja
+        removido por ociosidade; não é preciso devolver nada explicitamente.
+        """
+        entry = await self._get_entry(token)
+        entry.in_flight += 1
+        try:
+            yield entry.client
+        finally:
+            entry.in_flight -= 1
+            entry.last_used = time.monotonic()
+
+    @staticmethod
+    async def _close_entry(entry: _PooledClient) -> None:
+        try:
+            await entry.client.aclose()
+        except Exception as exc:  # pragma: no cover - conexão já encerrada pelo servidor
+            logger.warning(f"Erro ao fechar cliente GitHub: {exc}")
+
+    async def _evict_idle_locked(self) -> None:
+        now = time.monotonic()
+        ttl = settings.github_client_idle_ttl_seconds
+        expired = [
+            key
+            for key, entry in self._clients.items()
+            if entry.in_flight == 0 and now - entry.last_used > ttl
+        ]
+        for key in expired:
+            entry = self._clients.pop(key)
+            await self._close_entry(entry)
+        if expired:
+            logger.debug(f"{len(expired)} clientes GitHub ociosos fechados")
+
+    async def evict_idle(self) -> None:
+        async with self._lock:
+            await self._evict_idle_locked()
+
+    async def aclose(self) -> None:
+        async with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for entry in clients:
+            await self._close_entry(entry)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+# Pool global da aplicação
+github_client_pool = GithubClientPool()
@@ -0,0 +1,246 @@
+"""
+Controle de rate limit das APIs do GitHub por token.
+
+Acompanha o orçamento informado pelo GitHub (headers `X-RateLimit-*` e o campo
+GraphQL `rateLimit`) e decide quanto cada chamada precisa esperar:
+- chamadas interativas (requisições de usuários) só esperam durante um
+  cooldown de limite secundário e falham rápido quando o orçamento acabou
+- chamadas em background (sync agendado) deixam `github_rate_limit_headroom`
+  pontos livres para as interativas, são espaçadas quando o orçamento fica
+  baixo e aguardam o reset da janela quando ele se esgota
+- limites secundários (403/429) viram cooldown com backoff exponencial e jitter
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.services.github_pool import github_client_pool, token_key
+
+logger = logging.getLogger("tactyo.github_rate_limit")
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+RESOURCE_GRAPHQL = "graphql"
+RESOURCE_CORE = "core"
+
+
+@dataclass
+class RateLimitBudget:
+    resource: str
+    limit: int | None = None
+    remaining: int | None = None
+    used: int | None = None
+    reset_at: datetime | None = None
+    last_cost: int | None = None
+    updated_at: datetime | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "used": self.used,
+            "reset_at": self.reset_at.isoformat() if self.reset_at else None,
+            "last_cost": self.last_cost,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+def _parse_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Backoff exponencial com jitter para a tentativa `attempt` (0, 1, 2...)."""
+    ceiling = min(settings.github_backoff_max_seconds, settings.github_backoff_base_seconds * (2 ** attempt))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def is_primary_limit(status_code: int, headers: Mapping[str, str]) -> bool:
+    return status_code in (403, 429) and headers.get("x-ratelimit-remaining") == "0"
+
+
+def is_secondary_limit(status_code: int, headers: Mapping[str, str], body: str) -> bool:
+    if is_primary_limit(status_code, headers):
+        return False
+    if status_code == 429:
+        return True
+    return status_code == 403 and ("retry-after" in headers or "secondary rate limit" in body.lower())
+
+
+class GithubRateLimitGovernor:
+    def __init__(self) -> None:
+        self._budgets: dict[tuple[str, str], RateLimitBudget] = {}
+        self._cooldown_until: dict[str, datetime] = {}
+        self._account_tokens: dict[str, str] = {}
+
+    def register_account(self, account_id: uuid.UUID | str, token: str) -> None:
+        """Associa a conta ao token para que o orçamento apareça no status do scheduler."""
+        self._account_tokens[str(account_id)] = token_key(token)
+
+    def _budget(self, token: str, resource: str) -> RateLimitBudget:
+        key = (token_key(token), resource)
+        budget = self._budgets.get(key)
+        if budget is None:
+            budget = RateLimitBudget(resource=resource)
+            self._budgets[key] = budget
+        return budget
+
+    def update_from_headers(self, token: str, headers: Mapping[str, str], default_resource: str) -> None:
+        remaining = _parse_int(headers.get("x-ratelimit-remaining"))
+        if remaining is None:
+            return
+        budget = self._budget(token, headers.get("x-ratelimit-resource") or default_resource)
+        budget.remaining = remaining
+        budget.limit = _parse_int(headers.get("x-ratelimit-limit"))
+        budget.used = _parse_int(headers.get("x-ratelimit-used"))
+        reset = _parse_int(headers.get("x-ratelimit-reset"))
+        if reset is not None:
+            budget.reset_at = datetime.fromtimestamp(reset, tz=UTC)
+        budget.updated_at = datetime.now(UTC)
+
+    def update_from_graphql(self, token: str, rate_limit: Mapping[str, Any] | None) -> None:
+        """Atualiza com o campo `rateLimit { limit cost remaining resetAt }` quando a consulta o pede."""
+        if not rate_limit:
+            return
+        budget = self._budget(token, RESOURCE_GRAPHQL)
+        budget.remaining = _parse_int(rate_limit.get("remaining"))
+        budget.limit = _parse_int(rate_limit.get("limit")) or budget.limit
+        budget.last_cost = _parse_int(rate_limit.get("cost"))
+        reset_at = rate_limit.get("resetAt")
+        if reset_at:
+            budget.reset_at = datetime.fromisoformat(reset_at.replace("Z", "+00:00"))
+        budget.updated_at = datetime.now(UTC)
+
+    def start_cooldown(self, token: str, seconds: float) -> None:
+        """Bloqueia todas as chamadas do token por `seconds` (limite secundário)."""
+        key = token_key(token)
+        until = datetime.now(UTC).timestamp() + seconds
+        current = self._cooldown_until.get(key)
+        if current is None or current.timestamp() < until:
+            self._cooldown_until[key] = datetime.fromtimestamp(until, tz=UTC)
+        logger.warning(f"Limite secundário do GitHub: pausando token por {seconds:.1f}s")
+
+    def _delay_for(self, token: str, resource: str, priority: str) -> float:
+        now = datetime.now(UTC)
+        delay = 0.0
+
+        cooldown = self._cooldown_until.get(token_key(token))
+        if cooldown and cooldown > now:
+            delay = (cooldown - now).total_seconds()
+
+        budget = self._budgets.get((token_key(token), resource))
+        if budget is None or budget.remaining is None or budget.reset_at is None or budget.reset_at <= now:
+            return delay
+
+        until_reset = (budget.reset_at - now).total_seconds()
+        reserved = settings.github_rate_limit_headroom if priority == PRIORITY_BACKGROUND else 0
+        available = budget.remaining - reserved
+
+        if available <= 0:
+            if priority == PRIORITY_INTERACTIVE:
+                raise HTTPException(
+                    status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=f"Limite de requisições do GitHub esgotado até {budget.reset_at.isoformat()}",
+                )
+            return max(delay, until_reset)
+
+        if priority == PRIORITY_BACKGROUND and available < settings.github_rate_limit_headroom:
+            # Faixa de alerta: espalha o que sobra do orçamento até o reset
+            delay = max(delay, until_reset / available)
+        return delay
+
+    async def acquire(self, token: str, resource: str, priority: str) -> None:
+        """Aguarda até que a chamada possa ser feita segundo o orçamento atual."""
+        delay = self._delay_for(token, resource, priority)
+        if delay <= 0:
+            return
+        if delay > settings.github_rate_limit_max_wait_seconds:
+            raise HTTPException(
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Limite de requisições do GitHub: nova tentativa possível em {int(delay)}s",
+            )
+        logger.info(f"Aguardando {delay:.1f}s pelo rate limit do GitHub ({resource}, {priority})")
+        await asyncio.sleep(delay)
+
+    def snapshot(self, token: str) -> dict[str, Any]:
+        key = token_key(token)
+        return self._snapshot_key(key)
+
+    def _snapshot_key(self, key: str) -> dict[str, Any]:
+        cooldown = self._cooldown_until.get(key)
+        now = datetime.now(UTC)
+        return {
+            "resources": {
+                resource: budget.as_dict()
+                for (budget_key, resource), budget in self._budgets.items()
+                if budget_key == key
+            },
+            "cooldown_until": cooldown.isoformat() if cooldown and cooldown > now else None,
+        }
+
+    def snapshot_by_account(self) -> dict[str, dict[str, Any]]:
+        return {account_id: self._snapshot_key(key) for account_id, key in self._account_tokens.items()}
+
+
+# Governor global da aplicação
+github_rate_limit_governor = GithubRateLimitGovernor()
+
+
+async def governed_request(
+    token: str,
+    method: str,
+    url: str,
+    *,
+    resource: str,
+    priority: str = PRIORITY_INTERACTIVE,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Executa a requisição pelo pool respeitando o orçamento do token.
+
+    Limites secundários são repetidos até `github_max_retries` vezes (Retry-After
+    ou backoff com jitter). Com o limite primário esgotado, chamadas interativas
+    falham com 429 e chamadas em background aguardam o reset da janela.
+    Demais respostas são devolvidas para o chamador tratar.
+    """
+    governor = github_rate_limit_governor
+    attempt = 0
+    while True:
+        await governor.acquire(token, resource, priority)
+        async with github_client_pool.lease(token) as http_client:
+            response = await http_client.request(method, url, **kwargs)
+        governor.update_from_headers(token, response.headers, resource)
+
+        if is_primary_limit(response.status_code, response.headers):
+            if priority == PRIORITY_INTERACTIVE or attempt >= settings.github_max_retries:
+                raise HTTPException(
+                    status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Limite de requisições do GitHub esgotado",
+                )
+        elif is_secondary_limit(response.status_code, response.headers, response.text):
+            if attempt >= settings.github_max_retries:
+                raise HTTPException(
+                    status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Limite secundário de requisições do GitHub atingido",
+                )
+            retry_after = _parse_int(response.headers.get("retry-after"))
+            governor.start_cooldown(token, retry_after if retry_after is not None else backoff_delay(attempt))
+        else:
+            return response
+        attempt += 1
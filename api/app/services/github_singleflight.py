@@ -0,0 +1,73 @@
+"""
+Coalescência (singleflight) de consultas GraphQL idênticas ao GitHub.
+
+Consultas concorrentes com o mesmo token, documento e variáveis compartilham
+uma única requisição e o seu resultado (ou erro). Opcionalmente, o resultado
+fica disponível por `github_query_cache_ttl_seconds` para chamadas logo em
+seguida. Mutations nunca são coalescidas e descartam os resultados guardados
+do token, para que leituras após uma escrita não vejam dados antigos.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any, TypeVar
+
+from app.services.github_pool import token_key
+
+T = TypeVar("T")
+
+
+def is_mutation(query: str) -> bool:
+    return query.lstrip().startswith("mutation")
+
+
+def query_key(token: str, query: str, variables: dict[str, Any] | None) -> tuple[str, str, str]:
+    return token_key(token), query, json.dumps(variables or {}, sort_keys=True, default=str)
+
+
+class GithubSingleflight:
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]], ttl: float = 0) -> T:
+        """Executa `call` uma única vez para todas as chamadas concorrentes com a mesma chave."""
+        cached = self._results.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._finish, key, ttl))
+        # shield: o cancelamento de uma requisição não derruba as demais que aguardam
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, ttl: float, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        now = time.monotonic()
+        for expired in [cache_key for cache_key, (expires_at, _) in self._results.items() if expires_at <= now]:
+            del self._results[expired]
+        if ttl > 0 and not task.cancelled() and task.exception() is None:
+            self._results[key] = (now + ttl, task.result())
+
+    def forget_token(self, token: str) -> None:
+        """Descarta os resultados guardados de um token (após uma mutation)."""
+        key = token_key(token)
+        for cache_key in [cache_key for cache_key in self._results if cache_key[0] == key]:
+            del self._results[cache_key]
+
+
+# Singleflight global da aplicação
+github_singleflight = GithubSingleflight()
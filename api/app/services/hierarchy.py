@@ -0,0 +1,238 @@
+"""
+Montagem da hierarquia de itens do projeto (épico > história > tarefa).
+
+A árvore é montada em tempo linear: as colunas necessárias são lidas numa
+única consulta, os filhos são indexados por pai numa passada e as somas de
+cada subárvore (itens, concluídos, estimativas) são calculadas no mesmo
+percurso pós-ordem, sem recursão.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project_item import ProjectItem
+from app.schemas.hierarchy import HierarchyEpicResponse, HierarchyItemResponse, HierarchyResponse
+from app.utils.status_category import STATUS_CATEGORY_DONE
+
+HIERARCHY_COLUMNS = (
+    ProjectItem.id,
+    ProjectItem.item_node_id,
+    ProjectItem.title,
+    ProjectItem.item_type,
+    ProjectItem.status,
+    ProjectItem.status_category,
+    ProjectItem.epic_option_id,
+    ProjectItem.epic_name,
+    ProjectItem.parent_item_id,
+    ProjectItem.labels,
+    ProjectItem.estimate,
+)
+
+
+@dataclass
+class HierarchyNode:
+    id: int
+    item_node_id: str
+    title: str | None
+    item_type: str | None
+    status: str | None
+    status_category: str | None
+    epic_option_id: str | None
+    epic_name: str | None
+    parent_item_id: int | None
+    labels: list[str] | None
+    estimate: float | None
+    children: list[HierarchyNode] = field(default_factory=list)
+    # Somas da subárvore (incluindo o próprio item)
+    item_count: int = 0
+    completed_count: int = 0
+    total_estimate: float = 0.0
+    completed_estimate: float = 0.0
+
+    def item_fields(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "item_node_id": self.item_node_id,
+            "title": self.title,
+            "item_type": self.item_type,
+            "status": self.status,
+            "status_category": self.status_category,
+            "epic_name": self.epic_name,
+            "parent_item_id": self.parent_item_id,
+            "labels": self.labels,
+            "estimate": self.estimate,
+            "item_count": self.item_count,
+            "completed_count": self.completed_count,
+            "total_estimate": round(self.total_estimate, 2),
+            "completed_estimate": round(self.completed_estimate, 2),
+        }
+
+
+@dataclass
+class HierarchyGroup:
+    """Raízes de um mesmo épico (`epic_key` None para os itens sem épico)."""
+    epic_key: str | None
+    epic_name: str | None
+    items: list[HierarchyNode] = field(default_factory=list)
+
+    def rollup_fields(self) -> dict[str, Any]:
+        return {
+            "item_count": sum(node.item_count for node in self.items),
+            "completed_count": sum(node.completed_count for node in self.items),
+            "total_estimate": round(sum(node.total_estimate for node in self.items), 2),
+            "completed_estimate": round(sum(node.completed_estimate for node in self.items), 2),
+        }
+
+
+async def load_hierarchy_nodes(db: AsyncSession, project_id: int) -> list[HierarchyNode]:
+    stmt = select(*HIERARCHY_COLUMNS).where(ProjectItem.project_id == project_id).order_by(ProjectItem.title)
+    result = await db.execute(stmt)
+    return [
+        HierarchyNode(
+            id=row.id,
+            item_node_id=row.item_node_id,
+            title=row.title,
+            item_type=row.item_type,
+            status=row.status,
+            status_category=row.status_category,
+            epic_option_id=row.epic_option_id,
+            epic_name=row.epic_name,
+            parent_item_id=row.parent_item_id,
+            labels=row.labels,
+            estimate=float(row.estimate) if row.estimate is not None else None,
+        )
+        for row in result.all()
+    ]
+
+
+def _roll_up(root: HierarchyNode, visited: set[int]) -> None:
+    """Percorre a subárvore em pós-ordem (pilha explícita) somando os filhos no pai."""
+    stack: list[tuple[HierarchyNode, bool]] = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            estimate = node.estimate or 0.0
+            done = node.status_category == STATUS_CATEGORY_DONE
+            node.item_count = 1
+            node.completed_count = 1 if done else 0
+            node.total_estimate = estimate
+            node.completed_estimate = estimate if done else 0.0
+            for child in node.children:
+                node.item_count += child.item_count
+                node.completed_count += child.completed_count
+                node.total_estimate += child.total_estimate
+                node.completed_estimate += child.completed_estimate
+            continue
+        visited.add(node.id)
+        stack.append((node, True))
+        stack.extend((child, False) for child in reversed(node.children))
+
+
+def build_hierarchy(nodes: list[HierarchyNode]) -> list[HierarchyGroup]:
+    """
+    Liga cada item ao pai e agrupa as raízes por épico, na ordem de `nodes`.
+
+    São raízes os itens sem pai ou cujo pai não está no projeto. Cada ciclo de
+    `parent_item_id` é cortado em um item, que é desligado do pai e vira raiz
+    para o ciclo não sumir da árvore; o restante do ciclo e os itens abaixo dele
+    ficam sob esse item.
+    """
+    by_id = {node.id: node for node in nodes}
+    roots: list[HierarchyNode] = []
+    for node in nodes:
+        parent = by_id.get(node.parent_item_id) if node.parent_item_id is not None else None
+        if parent is None:
+            roots.append(node)
+        else:
+            parent.children.append(node)
+
+    visited: set[int] = set()
+    for root in roots:
+        _roll_up(root, visited)
+    if len(visited) < len(nodes):
+        for node in nodes:
+            if node.id in visited:
+                continue
+            # Sobe pelos pais até repetir um item: ele está no ciclo e só ele é desligado,
+            # os itens pendurados abaixo do ciclo continuam sob os seus pais
+            seen: set[int] = set()
+            cycle_node = node
+            while cycle_node.id not in seen:
+                seen.add(cycle_node.id)
+                cycle_node = by_id[cycle_node.parent_item_id]
+            by_id[cycle_node.parent_item_id].children.remove(cycle_node)
+            roots.append(cycle_node)
+            _roll_up(cycle_node, visited)
+
+    groups: dict[str | None, HierarchyGroup] = {}
+    for root in roots:
+        epic_key = root.epic_option_id or root.epic_name
+        group = groups.get(epic_key)
+        if group is None:
+            group = groups[epic_key] = HierarchyGroup(epic_key=epic_key, epic_name=root.epic_name)
+        group.items.append(root)
+    return list(groups.values())
+
+
+def _item_response(root: HierarchyNode) -> HierarchyItemResponse:
+    # Pós-ordem iterativa: cada resposta é criada depois das dos filhos
+    built: dict[int, HierarchyItemResponse] = {}
+    stack: list[tuple[HierarchyNode, bool]] = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            built[node.id] = HierarchyItemResponse(
+                **node.item_fields(),
+                children=[built.pop(child.id) for child in node.children],
+            )
+            continue
+        stack.append((node, True))
+        stack.extend((child, False) for child in node.children)
+    return built[root.id]
+
+
+def hierarchy_response(groups: list[HierarchyGroup]) -> HierarchyResponse:
+    epics: list[HierarchyEpicResponse] = []
+    orphans: list[HierarchyItemResponse] = []
+    for group in groups:
+        items = [_item_response(root) for root in group.items]
+        if group.epic_key is None:
+            orphans.extend(items)
+        else:
+            epics.append(
+                HierarchyEpicResponse(
+                    epic_option_id=group.epic_key,
+                    epic_name=group.epic_name,
+                    items=items,
+                    **group.rollup_fields(),
+                )
+            )
+    return HierarchyResponse(epics=epics, orphans=orphans)
+
+
+def iter_hierarchy_ndjson(groups: list[HierarchyGroup]) -> Iterator[str]:
+    """
+    A mesma hierarquia em NDJSON, uma linha por registro, sem montar a árvore aninhada.
+
+    Para cada grupo sai uma linha `{"kind": "epic", ...}` (`epic_option_id` nulo
+    para os itens sem épico) seguida dos itens em pré-ordem, cada um como
+    `{"kind": "item", "depth": n, ...}`; a árvore é refeita por `parent_item_id`.
+    """
+    for group in groups:
+        header = {"kind": "epic", "epic_option_id": group.epic_key, "epic_name": group.epic_name}
+        header.update(group.rollup_fields())
+        yield json.dumps(header, ensure_ascii=False) + "\n"
+
+        stack: list[tuple[HierarchyNode, int]] = [(root, 0) for root in reversed(group.items)]
+        while stack:
+            node, depth = stack.pop()
+            line = {"kind": "item", "depth": depth, "epic_option_id": group.epic_key, **node.item_fields()}
+            yield json.dumps(line, ensure_ascii=False) + "\n"
+            stack.extend((child, depth + 1) for child in reversed(node.children))
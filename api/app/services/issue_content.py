@@ -0,0 +1,256 @@
+"""
+Armazenamento local do conteúdo de issues/PRs (corpo e comentários).
+
+As telas de detalhe e comentários de um item leem daqui em vez de consultar o
+GitHub a cada clique:
+- entradas dentro de `issue_content_ttl_seconds` são servidas direto
+- entradas vencidas são servidas e atualizadas em background
+- entradas inexistentes ou invalidadas por webhook são buscadas na hora
+- comentários são atualizados de forma incremental (apenas os criados depois
+  de `comments_watermark`); webhooks `issue_comment` aplicam o próprio payload
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import zlib
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from fastapi import BackgroundTasks
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.issue_content_cache import IssueContentCache
+from app.services.github import (
+    GithubGraphQLClient,
+    fetch_project_item_comments_since,
+    fetch_project_item_details,
+    parse_datetime,
+)
+from app.services.github_rate_limit import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
+logger = logging.getLogger("tactyo.issue_content")
+
+# Quantidade de comentários mantidos por issue (os mais recentes)
+ISSUE_COMMENTS_LIMIT = 30
+
+KIND_DETAILS = "details"
+KIND_COMMENTS = "comments"
+
+# Atualizações em background em andamento, para não repetir a mesma busca
+_refreshing: set[tuple[str, str]] = set()
+
+
+def _pack(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, default=str).encode("utf-8"))
+
+
+def _unpack(data: bytes) -> Any:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _is_fresh(fetched_at: datetime | None, now: datetime) -> bool:
+    if fetched_at is None:
+        return False
+    return _as_utc(fetched_at) + timedelta(seconds=settings.issue_content_ttl_seconds) > now
+
+
+async def _get_entry(db: AsyncSession, content_node_id: str) -> IssueContentCache | None:
+    stmt = select(IssueContentCache).where(IssueContentCache.content_node_id == content_node_id)
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def _get_or_create_entry(db: AsyncSession, content_node_id: str) -> IssueContentCache:
+    entry = await _get_entry(db, content_node_id)
+    if entry is not None:
+        return entry
+    try:
+        async with db.begin_nested():
+            entry = IssueContentCache(content_node_id=content_node_id)
+            db.add(entry)
+    except IntegrityError:
+        # Outra requisição criou a entrada ao mesmo tempo; usa a dela
+        entry = await _get_entry(db, content_node_id)
+    return entry
+
+
+def _schedule_refresh(
+    background_tasks: BackgroundTasks | None,
+    kind: str,
+    token: str,
+    content_node_id: str,
+) -> None:
+    key = (kind, content_node_id)
+    if background_tasks is None or key in _refreshing:
+        return
+    _refreshing.add(key)
+    background_tasks.add_task(refresh_issue_content_in_background, kind, token, content_node_id)
+
+
+async def refresh_issue_details(
+    db: AsyncSession,
+    token: str,
+    content_node_id: str,
+    priority: str = PRIORITY_INTERACTIVE,
+) -> dict[str, Any]:
+    """Busca o corpo da issue/PR no GitHub e grava no armazenamento local."""
+    async with GithubGraphQLClient(token, priority=priority) as client:
+        details = await fetch_project_item_details(client, content_node_id)
+
+    entry = await _get_or_create_entry(db, content_node_id)
+    entry.details = _pack(details) if details else None
+    entry.content_updated_at = parse_datetime(details.get("updated_at")) if details else None
+    entry.details_fetched_at = datetime.now(UTC)
+    await db.commit()
+    return details
+
+
+def _merge_comments(known: list[dict[str, Any]], fetched: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    by_id = {comment["id"]: comment for comment in known if comment.get("id")}
+    for comment in fetched:
+        if comment.get("id"):
+            by_id[comment["id"]] = comment
+    merged = sorted(by_id.values(), key=lambda comment: comment.get("created_at") or "")
+    return merged[-ISSUE_COMMENTS_LIMIT:]
+
+
+def _store_comments(entry: IssueContentCache, comments: list[dict[str, Any]]) -> None:
+    entry.comments = _pack(comments)
+    created = [parse_datetime(comment.get("created_at")) for comment in comments]
+    created = [value for value in created if value is not None]
+    entry.comments_watermark = max(created) if created else None
+
+
+async def refresh_issue_comments(
+    db: AsyncSession,
+    token: str,
+    content_node_id: str,
+    priority: str = PRIORITY_INTERACTIVE,
+) -> list[dict[str, Any]]:
+    """
+    Atualiza os comentários guardados, buscando apenas os criados depois do watermark.
+
+    Sem thread guardada (ou sem watermark), busca os últimos `ISSUE_COMMENTS_LIMIT`.
+    """
+    entry = await _get_or_create_entry(db, content_node_id)
+    known: list[dict[str, Any]] = _unpack(entry.comments) if entry.comments is not None else []
+    since = _as_utc(entry.comments_watermark) if entry.comments is not None and entry.comments_watermark else None
+
+    async with GithubGraphQLClient(token, priority=priority) as client:
+        fetched = await fetch_project_item_comments_since(client, content_node_id, since, ISSUE_COMMENTS_LIMIT)
+
+    comments = _merge_comments(known, fetched)
+    _store_comments(entry, comments)
+    entry.comments_fetched_at = datetime.now(UTC)
+    await db.commit()
+    return comments
+
+
+async def get_issue_details(
+    db: AsyncSession,
+    token: str,
+    content_node_id: str,
+    background_tasks: BackgroundTasks | None = None,
+) -> dict[str, Any]:
+    """Detalhes da issue/PR, servidos do armazenamento local sempre que possível."""
+    entry = await _get_entry(db, content_node_id)
+    if entry is None or entry.details is None or entry.details_fetched_at is None:
+        return await refresh_issue_details(db, token, content_node_id)
+
+    if not _is_fresh(entry.details_fetched_at, datetime.now(UTC)):
+        _schedule_refresh(background_tasks, KIND_DETAILS, token, content_node_id)
+    return _unpack(entry.details)
+
+
+async def get_issue_comments(
+    db: AsyncSession,
+    token: str,
+    content_node_id: str,
+    background_tasks: BackgroundTasks | None = None,
+) -> list[dict[str, Any]]:
+    """Comentários da issue/PR, servidos do armazenamento local sempre que possível."""
+    entry = await _get_entry(db, content_node_id)
+    if entry is None or entry.comments is None or entry.comments_fetched_at is None:
+        return await refresh_issue_comments(db, token, content_node_id)
+
+    if not _is_fresh(entry.comments_fetched_at, datetime.now(UTC)):
+        _schedule_refresh(background_tasks, KIND_COMMENTS, token, content_node_id)
+    return _unpack(entry.comments)
+
+
+async def refresh_issue_content_in_background(
+    kind: str,
+    token: str,
+    content_node_id: str,
+    session_factory: Callable[[], AsyncSession] = SessionLocal,
+) -> None:
+    """Atualiza uma entrada vencida fora da requisição, em sessão própria."""
+    try:
+        async with session_factory() as db:
+            if kind == KIND_DETAILS:
+                await refresh_issue_details(db, token, content_node_id, priority=PRIORITY_BACKGROUND)
+            else:
+                await refresh_issue_comments(db, token, content_node_id, priority=PRIORITY_BACKGROUND)
+    except Exception as exc:
+        logger.warning(f"Failed to refresh {kind} of {content_node_id}: {exc}")
+    finally:
+        _refreshing.discard((kind, content_node_id))
+
+
+async def invalidate_issue_details(db: AsyncSession, content_node_id: str) -> None:
+    """Marca o corpo guardado como desatualizado (webhooks `issues`/`pull_request`)."""
+    await db.execute(
+        update(IssueContentCache)
+        .where(IssueContentCache.content_node_id == content_node_id)
+        .values(details_fetched_at=None)
+    )
+    await db.commit()
+
+
+def _comment_from_webhook(comment: dict[str, Any]) -> dict[str, Any]:
+    user = comment.get("user") or {}
+    return {
+        "id": comment.get("node_id"),
+        "body": comment.get("body") or "",
+        "created_at": comment.get("created_at"),
+        "updated_at": comment.get("updated_at"),
+        "url": comment.get("html_url"),
+        "author_login": user.get("login"),
+        "author_url": user.get("html_url"),
+        "author_avatar_url": user.get("avatar_url"),
+    }
+
+
+async def apply_issue_comment_event(db: AsyncSession, action: str, payload: dict[str, Any]) -> bool:
+    """
+    Aplica um webhook `issue_comment` à thread guardada, sem consultar o GitHub.
+
+    Retorna False quando a issue não tem thread guardada (nada a fazer).
+    """
+    content_node_id = (payload.get("issue") or {}).get("node_id")
+    comment = payload.get("comment") or {}
+    if not content_node_id or not comment.get("node_id"):
+        return False
+
+    entry = await _get_entry(db, content_node_id)
+    if entry is None or entry.comments is None:
+        return False
+
+    known: list[dict[str, Any]] = _unpack(entry.comments)
+    if action == "deleted":
+        comments = [item for item in known if item.get("id") != comment["node_id"]]
+    else:
+        comments = _merge_comments(known, [_comment_from_webhook(comment)])
+    _store_comments(entry, comments)
+    await db.commit()
+    return True
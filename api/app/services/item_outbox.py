@@ -0,0 +1,325 @@
+"""
+Outbox (write-behind) das edições de itens enviadas ao GitHub.
+
+Com `github_write_behind` ligado, a edição de um item grava a alteração local
+e os registros do outbox na mesma transação e responde sem esperar o GitHub.
+Este worker envia as alterações pendentes:
+- em ordem de `id` por item; uma alteração aguardando retentativa bloqueia as
+  seguintes do mesmo item
+- uma nova edição do mesmo campo substitui (`superseded`) a pendente anterior,
+  então só o valor mais recente é enviado
+- as mutations definem o valor do campo, portanto repetir um envio já aplicado
+  (ex.: queda do worker antes de marcar `done`) não tem efeito colateral
+- falhas são repetidas com backoff exponencial até `github_outbox_max_attempts`
+- o estado fica visível no item (`remote_sync_status`/`remote_sync_error`)
+- cada lote é reservado no banco (`processing` + `lease_token`/`lease_until`)
+  antes do envio, então vários workers/processos podem drenar o outbox; uma
+  reserva vencida (worker que caiu) é retomada por outro worker
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import and_, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.github_project import GithubProject
+from app.models.item_mutation_outbox import ItemMutationOutbox
+from app.models.project_item import ProjectItem
+
+logger = logging.getLogger("tactyo.item_outbox")
+
+STATUS_PENDING = "pending"
+STATUS_PROCESSING = "processing"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_SUPERSEDED = "superseded"
+
+# Máximo de registros carregados por rodada do worker
+OUTBOX_BATCH_SIZE = 200
+
+_processing_lock = asyncio.Lock()
+
+
+async def enqueue_item_mutations(
+    db: AsyncSession,
+    project: GithubProject,
+    item: ProjectItem,
+    mutations: list,
+) -> None:
+    """
+    Grava as alterações de campos do item no outbox (sem commit).
+
+    Recebe a lista de `ItemFieldMutation` do planner; o commit fica com o
+    chamador, junto com a alteração local.
+    """
+    if not mutations:
+        return
+
+    await db.execute(
+        update(ItemMutationOutbox)
+        .where(
+            ItemMutationOutbox.item_id == item.id,
+            ItemMutationOutbox.field_id.in_([mutation.field_id for mutation in mutations]),
+            ItemMutationOutbox.status == STATUS_PENDING,
+        )
+        .values(status=STATUS_SUPERSEDED)
+        .execution_options(synchronize_session=False)
+    )
+    for mutation in mutations:
+        db.add(
+            ItemMutationOutbox(
+                project_id=project.id,
+                item_id=item.id,
+                item_node_id=mutation.item_node_id,
+                field_id=mutation.field_id,
+                value=mutation.value,
+                status=STATUS_PENDING,
+                attempts=0,
+            )
+        )
+    item.remote_sync_status = STATUS_PENDING
+    item.remote_sync_error = None
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    seconds = settings.github_outbox_retry_base_seconds * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, 3600))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _ready_records(records: list[ItemMutationOutbox], now: datetime) -> list[ItemMutationOutbox]:
+    """Registros prontos para envio, respeitando a ordem por item."""
+    blocked_items: set[int] = set()
+    ready: list[ItemMutationOutbox] = []
+    for record in records:
+        if record.item_id in blocked_items:
+            continue
+        if record.next_attempt_at is not None and _as_utc(record.next_attempt_at) > now:
+            blocked_items.add(record.item_id)
+            continue
+        ready.append(record)
+    return ready
+
+
+def _claimable(now: datetime):
+    """Registros que podem ser reservados: pendentes ou com reserva vencida."""
+    return or_(
+        ItemMutationOutbox.status == STATUS_PENDING,
+        and_(ItemMutationOutbox.status == STATUS_PROCESSING, ItemMutationOutbox.lease_until < now),
+    )
+
+
+async def _claim_records(db: AsyncSession, record_ids: list[int]) -> str:
+    """
+    Reserva os registros para este worker e retorna o token da reserva (com commit).
+
+    Registros de itens com outra alteração reservada com lease válido ficam de
+    fora, mantendo a ordem por item entre workers. No Postgres um advisory lock
+    serializa as reservas concorrentes.
+    """
+    token = uuid.uuid4().hex
+    now = datetime.now(UTC)
+    busy = aliased(ItemMutationOutbox)
+    if db.get_bind().dialect.name == "postgresql":
+        await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(ItemMutationOutbox.__tablename__))))
+    await db.execute(
+        update(ItemMutationOutbox)
+        .where(
+            ItemMutationOutbox.id.in_(record_ids),
+            _claimable(now),
+            ~exists().where(
+                busy.item_id == ItemMutationOutbox.item_id,
+                busy.status == STATUS_PROCESSING,
+                busy.lease_until >= now,
+            ),
+        )
+        .values(
+            status=STATUS_PROCESSING,
+            lease_token=token,
+            lease_until=now + timedelta(seconds=settings.github_outbox_lease_seconds),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return token
+
+
+async def _push_project(db: AsyncSession, project: GithubProject, records: list[ItemMutationOutbox]) -> int:
+    """
+    Envia os registros reservados de um projeto e atualiza registros e itens com o resultado.
+
+    Retorna quantos registros foram aplicados com sucesso.
+    """
+    from app.services.github import (
+        GithubGraphQLClient,
+        ItemFieldMutation,
+        apply_item_field_mutations,
+        get_github_token,
+    )
+    from app.services.github_rate_limit import PRIORITY_BACKGROUND
+
+    mutations = [ItemFieldMutation(record.item_node_id, record.field_id, record.value) for record in records]
+    try:
+        token = await get_github_token(db, project.account)
+        async with GithubGraphQLClient(token, priority=PRIORITY_BACKGROUND) as client:
+            errors = await apply_item_field_mutations(client, project.project_node_id, mutations)
+    except Exception as exc:
+        errors = [str(getattr(exc, "detail", None) or exc)] * len(records)
+
+    now = datetime.now(UTC)
+    pushed = 0
+    for record, error in zip(records, errors):
+        values = {"attempts": record.attempts + 1, "lease_token": None, "lease_until": None}
+        if error is None:
+            values.update(status=STATUS_DONE, processed_at=now, last_error=None)
+        elif record.attempts + 1 >= settings.github_outbox_max_attempts:
+            values.update(status=STATUS_FAILED, last_error=error)
+        else:
+            values.update(
+                status=STATUS_PENDING,
+                next_attempt_at=now + _retry_delay(record.attempts + 1),
+                last_error=error,
+            )
+        # Só finaliza o que ainda é nosso: com a reserva vencida outro worker pode ter retomado o registro
+        result = await db.execute(
+            update(ItemMutationOutbox)
+            .where(ItemMutationOutbox.id == record.id, ItemMutationOutbox.lease_token == record.lease_token)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            continue
+        if error is None:
+            pushed += 1
+        elif values["status"] == STATUS_FAILED:
+            logger.warning(f"Outbox {record.id} (item {record.item_id}) failed after {values['attempts']} attempts")
+
+    await _refresh_item_sync_status(db, {record.item_id for record in records})
+    return pushed
+
+
+async def _refresh_item_sync_status(db: AsyncSession, item_ids: set[int]) -> None:
+    """Recalcula `remote_sync_status` dos itens a partir dos registros do outbox."""
+    stmt = (
+        select(ItemMutationOutbox.item_id, ItemMutationOutbox.status, ItemMutationOutbox.last_error)
+        .where(
+            ItemMutationOutbox.item_id.in_(item_ids),
+            ItemMutationOutbox.status.in_([STATUS_PENDING, STATUS_PROCESSING, STATUS_FAILED]),
+        )
+        .order_by(ItemMutationOutbox.id)
+    )
+    open_records: dict[int, list[tuple[str, str | None]]] = {}
+    for item_id, status, last_error in (await db.execute(stmt)).all():
+        open_records.setdefault(item_id, []).append((status, last_error))
+
+    items = (await db.execute(select(ProjectItem).where(ProjectItem.id.in_(item_ids)))).scalars().all()
+    for item in items:
+        records = open_records.get(item.id, [])
+        failed = [last_error for status, last_error in records if status == STATUS_FAILED]
+        pending = [last_error for status, last_error in records if status != STATUS_FAILED]
+        if failed:
+            item.remote_sync_status = STATUS_FAILED
+            item.remote_sync_error = failed[-1]
+        elif pending:
+            item.remote_sync_status = STATUS_PENDING
+            # Mantém visível o erro da última tentativa enquanto houver retentativa
+            item.remote_sync_error = next((error for error in reversed(pending) if error), None)
+        else:
+            item.remote_sync_status = None
+            item.remote_sync_error = None
+
+
+async def _drain_outbox(session_factory: Callable[[], AsyncSession]) -> int:
+    """Envia rodadas do outbox até não sobrar registro pronto que este worker consiga reservar."""
+    total = 0
+    while True:
+        async with session_factory() as db:
+            now = datetime.now(UTC)
+            stmt = (
+                select(ItemMutationOutbox)
+                .where(_claimable(now))
+                .order_by(ItemMutationOutbox.id)
+                .limit(OUTBOX_BATCH_SIZE)
+            )
+            records = list((await db.execute(stmt)).scalars().all())
+            ready = _ready_records(records, now)
+            if not ready:
+                break
+
+            token = await _claim_records(db, [record.id for record in ready])
+            claimed_stmt = (
+                select(ItemMutationOutbox)
+                .where(ItemMutationOutbox.lease_token == token)
+                .order_by(ItemMutationOutbox.id)
+                .execution_options(populate_existing=True)
+            )
+            claimed = list((await db.execute(claimed_stmt)).scalars().all())
+            if not claimed:
+                break
+
+            by_project: dict[int, list[ItemMutationOutbox]] = {}
+            for record in claimed:
+                by_project.setdefault(record.project_id, []).append(record)
+
+            projects_stmt = (
+                select(GithubProject)
+                .options(joinedload(GithubProject.account))
+                .where(GithubProject.id.in_(by_project))
+            )
+            projects = {project.id: project for project in (await db.execute(projects_stmt)).scalars().all()}
+            pushed = 0
+            for project_id, project_records in by_project.items():
+                project = projects.get(project_id)
+                if project is None or project.account is None:
+                    # Sem conta para autenticar: devolve os registros à fila
+                    await db.execute(
+                        update(ItemMutationOutbox)
+                        .where(ItemMutationOutbox.project_id == project_id, ItemMutationOutbox.lease_token == token)
+                        .values(status=STATUS_PENDING, lease_token=None, lease_until=None)
+                        .execution_options(synchronize_session=False)
+                    )
+                    continue
+                pushed += await _push_project(db, project, project_records)
+                total += len(project_records)
+            await db.commit()
+
+        # Sem nada enviado com sucesso não adianta repetir a rodada agora
+        if not pushed:
+            break
+    return total
+
+
+async def process_item_outbox(session_factory: Callable[[], AsyncSession] = SessionLocal) -> int:
+    """
+    Envia ao GitHub as alterações pendentes do outbox.
+
+    Chamado após cada edição em modo write-behind e periodicamente pelo
+    scheduler (para as retentativas e reservas vencidas). Apenas uma execução
+    por processo roda por vez; entre processos, a reserva de cada lote no banco
+    evita envio duplo. Retorna a quantidade de registros enviados (com sucesso
+    ou não).
+    """
+    if _processing_lock.locked():
+        return 0
+
+    async with _processing_lock:
+        return await _drain_outbox(session_factory)
+
+
+async def run_item_outbox_job() -> None:
+    """Job do scheduler: retentativas do outbox de edições."""
+    processed = await process_item_outbox()
+    if processed:
+        logger.info(f"Outbox de edições: {processed} alterações enviadas ao GitHub")
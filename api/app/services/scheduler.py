@@ -3,20 +3,30 @@ Serviço de agendamento de tarefas usando APScheduler.
 
 Gerencia jobs periódicos como:
 - Sincronização automática de Projects do GitHub
+- Processamento da fila de webhooks
+- Envio do outbox de edições de itens (modo write-behind)
 """
 
+import asyncio
 import logging
+import uuid
 from datetime import datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.models.account import Account
 from app.models.github_project import GithubProject
 from app.services.github import get_github_token, sync_github_project
+from app.services.github_rate_limit import PRIORITY_BACKGROUND, github_rate_limit_governor
+from app.services.item_outbox import run_item_outbox_job
+from app.services.webhook_inbox import run_webhook_inbox_job
 
 logger = logging.getLogger("tactyo.scheduler")
 
@@ -24,49 +34,78 @@ logger = logging.getLogger("tactyo.scheduler")
 scheduler: AsyncIOScheduler | None = None
 
 
-async def sync_all_projects():
+async def _sync_scheduled_project(
+    project_id: int,
+    global_limit: asyncio.Semaphore,
+    account_limit: asyncio.Semaphore,
+) -> bool:
     """
-    Job agendado que sincroniza todos os projetos ativos.
+    Sincroniza um projeto em sessão própria, respeitando os limites de concorrência.
 
-    Percorre todas as contas com projetos configurados e executa sync.
+    O limite da conta vem antes do global: um projeto esperando a vez da sua
+    conta não segura uma vaga global que outra conta poderia usar.
     """
-    logger.info("Iniciando sincronização automática de todos os projetos")
-
-    async with SessionLocal() as db:
-        # Buscar todos os projetos ativos
-        stmt = select(GithubProject).join(Account)
-        result = await db.execute(stmt)
-        projects = result.scalars().all()
-
-        synced_count = 0
-        error_count = 0
+    async with account_limit, global_limit:
+        try:
+            async with SessionLocal() as db:
+                stmt = (
+                    select(GithubProject)
+                    .options(joinedload(GithubProject.account))
+                    .where(GithubProject.id == project_id)
+                )
+                project = (await db.execute(stmt)).scalar_one_or_none()
+                if not project or not project.account:
+                    logger.warning(f"Projeto {project_id} ou sua account não encontrados")
+                    return False
 
-        for project in projects:
-            try:
                 logger.info(f"Sincronizando projeto {project.id} ({project.name})")
+                token = await get_github_token(db, project.account)
+                result = await sync_github_project(
+                    db, project.account, project, token, priority=PRIORITY_BACKGROUND
+                )
 
-                # Buscar account
-                account = await db.get(Account, project.account_id)
-                if not account:
-                    logger.warning(f"Account {project.account_id} não encontrada para projeto {project.id}")
-                    error_count += 1
-                    continue
+                logger.info(
+                    f"Projeto {project.id} sincronizado: {result.total} itens "
+                    f"({result.changed} alterados, {result.unchanged} sem mudanças, {result.deleted} removidos)"
+                )
+                return True
+        except Exception as e:
+            logger.error(f"Erro ao sincronizar projeto {project_id}: {e}", exc_info=True)
+            return False
 
-                # Obter token e sincronizar
-                token = await get_github_token(db, account)
-                count = await sync_github_project(db, account, project, token)
 
-                logger.info(f"Projeto {project.id} sincronizado: {count} itens")
-                synced_count += 1
+async def sync_all_projects():
+    """
+    Job agendado que sincroniza todos os projetos ativos.
 
-            except Exception as e:
-                logger.error(f"Erro ao sincronizar projeto {project.id}: {e}", exc_info=True)
-                error_count += 1
+    Os projetos são sincronizados em paralelo, até `github_sync_max_concurrency`
+    ao mesmo tempo e `github_sync_account_concurrency` por conta (mesmo token e
+    mesmo rate limit). Cada sync usa uma sessão curta própria, então o tempo do
+    ciclo acompanha o tenant mais lento e não a soma de todos.
+    """
+    logger.info("Iniciando sincronização automática de todos os projetos")
 
-        logger.info(
-            f"Sincronização automática concluída: {synced_count} projetos sincronizados, "
-            f"{error_count} erros"
-        )
+    async with SessionLocal() as db:
+        # Buscar todos os projetos ativos (apenas ids)
+        stmt = select(GithubProject.id, GithubProject.account_id).join(Account)
+        rows = (await db.execute(stmt)).all()
+
+    global_limit = asyncio.Semaphore(max(1, settings.github_sync_max_concurrency))
+    account_limits: dict[uuid.UUID, asyncio.Semaphore] = {}
+    tasks = []
+    for project_id, account_id in rows:
+        if account_id not in account_limits:
+            account_limits[account_id] = asyncio.Semaphore(max(1, settings.github_sync_account_concurrency))
+        tasks.append(_sync_scheduled_project(project_id, global_limit, account_limits[account_id]))
+
+    results = await asyncio.gather(*tasks)
+    synced_count = sum(1 for ok in results if ok)
+    error_count = len(results) - synced_count
+
+    logger.info(
+        f"Sincronização automática concluída: {synced_count} projetos sincronizados, "
+        f"{error_count} erros"
+    )
 
 
 def start_scheduler():
@@ -75,6 +114,8 @@ def start_scheduler():
 
     Configuração padrão:
     - Sync de projetos: a cada 15 minutos
+    - Fila de webhooks: a cada 30 segundos
+    - Outbox de edições: a cada 15 segundos
     """
     global scheduler
 
@@ -94,6 +135,30 @@ def start_scheduler():
         name="Sincronização automática de projetos GitHub",
         replace_existing=True,
         misfire_grace_time=300,  # 5 minutos de tolerância
+        max_instances=1,  # Nunca sobrepor dois ciclos de sync
+        coalesce=True,
+    )
+
+    # Job: Fila de webhooks (retentativas e limpeza)
+    scheduler.add_job(
+        run_webhook_inbox_job,
+        trigger=IntervalTrigger(seconds=30),
+        id="process_webhook_inbox",
+        name="Processamento da fila de webhooks do GitHub",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    # Job: Outbox de edições de itens (write-behind e retentativas)
+    scheduler.add_job(
+        run_item_outbox_job,
+        trigger=IntervalTrigger(seconds=15),
+        id="process_item_outbox",
+        name="Envio de edições de itens ao GitHub",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
     )
 
     scheduler.start()
@@ -115,10 +180,12 @@ def stop_scheduler():
     logger.info("Scheduler parado com sucesso")
 
 
-def get_scheduler_status() -> dict:
+def get_scheduler_status(account_id: uuid.UUID | None = None) -> dict:
     """
     Retorna status do scheduler e jobs agendados.
 
+    Com `account_id`, o orçamento de rate limit é filtrado para essa conta.
+
     Returns:
         dict: {
             "running": bool,
@@ -127,11 +194,20 @@ def get_scheduler_status() -> dict:
                 "name": str,
                 "next_run_time": str | None,
                 "trigger": str
-            }]
+            }],
+            "rate_limits": {
+                account_id: {
+                    "resources": {resource: {"limit", "remaining", "reset_at", ...}},
+                    "cooldown_until": str | None
+                }
+            }
         }
     """
+    rate_limits = github_rate_limit_governor.snapshot_by_account()
+    if account_id is not None:
+        rate_limits = {key: value for key, value in rate_limits.items() if key == str(account_id)}
     if scheduler is None:
-        return {"running": False, "jobs": []}
+        return {"running": False, "jobs": [], "rate_limits": rate_limits}
 
     jobs = []
     for job in scheduler.get_jobs():
@@ -145,4 +221,5 @@ def get_scheduler_status() -> dict:
     return {
         "running": scheduler.running,
         "jobs": jobs,
+        "rate_limits": rate_limits,
     }
@@ -2,9 +2,17 @@
 Serviço para processar webhooks do GitHub.
 
 Valida assinaturas HMAC e processa eventos:
-- project_v2_item: sincroniza itens do projeto
-- issues: sincroniza issues
-- pull_request: sincroniza PRs
+- project_v2_item: atualiza o item do projeto
+- issues: atualiza os itens ligados à issue
+- pull_request: atualiza os itens ligados ao PR
+- projects_v2: marca os metadados (campos) do projeto para atualização
+- issue_comment: atualiza a thread de comentários guardada da issue/PR
+
+Eventos de issue/PR também invalidam o conteúdo guardado (ver issue_content).
+
+As atualizações buscam apenas os itens afetados; o sync do projeto só é usado
+como fallback quando a atualização pontual falha. A fila de webhooks agrupa
+rajadas de eventos de um mesmo projeto em `handle_webhook_batch`.
 """
 
 import hashlib
@@ -13,13 +21,14 @@ import logging
 from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.account import Account
 from app.models.github_project import GithubProject
 from app.models.project_item import ProjectItem
 from app.core.config import settings
+from app.services.issue_content import apply_issue_comment_event, invalidate_issue_details
 
 logger = logging.getLogger("tactyo.webhook")
 
@@ -67,6 +76,76 @@ def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> boo
     return True
 
 
+async def _refresh_project_items(
+    db: AsyncSession,
+    project: GithubProject,
+    item_node_ids: list[str],
+    reason: str,
+) -> None:
+    """Atualiza apenas os itens informados; em caso de falha, sincroniza o projeto."""
+    from app.services.github import get_github_token, refresh_project_items
+    from app.services.github_rate_limit import PRIORITY_BACKGROUND
+
+    account = await db.get(Account, project.account_id)
+    if not account:
+        return
+
+    project_id = project.id
+    token = await get_github_token(db, account)
+    try:
+        result = await refresh_project_items(
+            db, account, project, token, item_node_ids, priority=PRIORITY_BACKGROUND
+        )
+        logger.info(
+            f"Refreshed {result.total} items of project {project.id} due to {reason} "
+            f"({result.changed} changed)"
+        )
+    except Exception as e:
+        logger.warning(f"Targeted refresh failed for project {project_id}, falling back to sync: {e}")
+        # O rollback expira os objetos da sessão; o projeto é recarregado antes do sync
+        await db.rollback()
+        project = await db.get(GithubProject, project_id, populate_existing=True)
+        if project:
+            await _sync_project(db, project, reason)
+
+
+async def _sync_project(db: AsyncSession, project: GithubProject, reason: str) -> None:
+    """Sync (incremental, salvo se a reconciliação completa estiver vencida) do projeto inteiro."""
+    from app.services.github import get_github_token, sync_github_project
+    from app.services.github_rate_limit import PRIORITY_BACKGROUND
+
+    account = await db.get(Account, project.account_id)
+    if not account:
+        return
+
+    token = await get_github_token(db, account)
+    result = await sync_github_project(db, account, project, token, priority=PRIORITY_BACKGROUND)
+    logger.info(
+        f"Synced project {project.id} due to {reason}: {result.total} items "
+        f"({result.changed} changed)"
+    )
+
+
+async def _refresh_items_by_content(db: AsyncSession, content_node_id: str, reason: str) -> bool:
+    """Atualiza, em cada projeto, os itens cujo conteúdo é a issue/PR informada."""
+    stmt = select(ProjectItem.project_id, ProjectItem.item_node_id).where(
+        ProjectItem.content_node_id == content_node_id
+    )
+    rows = (await db.execute(stmt)).all()
+    if not rows:
+        return False
+
+    item_ids_by_project: dict[int, list[str]] = {}
+    for project_id, item_node_id in rows:
+        item_ids_by_project.setdefault(project_id, []).append(item_node_id)
+
+    for project_id, item_node_ids in item_ids_by_project.items():
+        project = await db.get(GithubProject, project_id)
+        if project:
+            await _refresh_project_items(db, project, item_node_ids, reason)
+    return True
+
+
 async def handle_project_v2_item_event(
     db: AsyncSession,
     event_action: str,
@@ -95,7 +174,7 @@ async def handle_project_v2_item_event(
         project_data = payload.get("project_v2", {})
 
         item_node_id = project_item_data.get("node_id")
-        project_node_id = project_data.get("node_id")
+        project_node_id = project_data.get("node_id") or project_item_data.get("project_node_id")
 
         if not item_node_id or not project_node_id:
             logger.warning("Missing node IDs in project_v2_item webhook")
@@ -124,19 +203,13 @@ async def handle_project_v2_item_event(
                 logger.info(f"Deleted project item {item_node_id}")
 
         else:
-            # Para created/edited: fazer sync completo do projeto
-            # (mais simples que tentar atualizar apenas este item)
-            from app.services.github import get_github_token, sync_github_project
-
-            account = await db.get(Account, project.account_id)
-            if account:
-                token = await get_github_token(db, account)
-                count = await sync_github_project(db, account, project, token)
-                logger.info(f"Synced project {project.id} via webhook: {count} items")
+            # Para created/edited/converted: buscar apenas este item
+            await _refresh_project_items(db, project, [item_node_id], f"project_v2_item.{event_action}")
 
     except Exception as e:
         logger.error(f"Error processing project_v2_item webhook: {e}", exc_info=True)
-        # Não lançar exceção - webhook deve retornar 200 mesmo com erro
+        # Propagar para a fila de webhooks agendar nova tentativa
+        raise
 
 
 async def handle_issues_event(
@@ -169,29 +242,15 @@ async def handle_issues_event(
             logger.warning("Missing issue node_id in webhook")
             return
 
-        # Buscar item do projeto associado à issue
-        stmt = select(ProjectItem).where(ProjectItem.content_node_id == issue_node_id)
-        result = await db.execute(stmt)
-        items = result.scalars().all()
+        await invalidate_issue_details(db, issue_node_id)
 
-        if not items:
+        # Atualizar os itens de cada projeto que contém esta issue
+        if not await _refresh_items_by_content(db, issue_node_id, f"issues.{event_action}"):
             logger.info(f"Issue {issue_node_id} not found in any project, ignoring")
-            return
-
-        # Atualizar cada projeto que contém esta issue
-        for item in items:
-            project = await db.get(GithubProject, item.project_id)
-            if project:
-                from app.services.github import get_github_token, sync_github_project
-
-                account = await db.get(Account, project.account_id)
-                if account:
-                    token = await get_github_token(db, account)
-                    await sync_github_project(db, account, project, token)
-                    logger.info(f"Synced project {project.id} due to issue update")
 
     except Exception as e:
         logger.error(f"Error processing issues webhook: {e}", exc_info=True)
+        raise
 
 
 async def handle_pull_request_event(
@@ -223,29 +282,139 @@ async def handle_pull_request_event(
             logger.warning("Missing PR node_id in webhook")
             return
 
-        # Buscar item do projeto associado ao PR
-        stmt = select(ProjectItem).where(ProjectItem.content_node_id == pr_node_id)
-        result = await db.execute(stmt)
-        items = result.scalars().all()
+        await invalidate_issue_details(db, pr_node_id)
 
-        if not items:
+        # Atualizar os itens de cada projeto que contém este PR
+        if not await _refresh_items_by_content(db, pr_node_id, f"pull_request.{event_action}"):
             logger.info(f"PR {pr_node_id} not found in any project, ignoring")
-            return
 
-        # Atualizar cada projeto que contém este PR
-        for item in items:
-            project = await db.get(GithubProject, item.project_id)
-            if project:
-                from app.services.github import get_github_token, sync_github_project
+    except Exception as e:
+        logger.error(f"Error processing pull_request webhook: {e}", exc_info=True)
+        raise
+
 
-                account = await db.get(Account, project.account_id)
-                if account:
-                    token = await get_github_token(db, account)
-                    await sync_github_project(db, account, project, token)
-                    logger.info(f"Synced project {project.id} due to PR update")
+async def handle_projects_v2_event(
+    db: AsyncSession,
+    event_action: str,
+    payload: dict[str, Any],
+) -> None:
+    """
+    Processa eventos de projects_v2 (projeto editado, fechado, reaberto...).
 
+    Os metadados de campos ficam em cache no projeto; aqui apenas os marcamos
+    como desatualizados para que o próximo sync busque de novo.
+    """
+    logger.info(f"Processing projects_v2 event: {event_action}")
+
+    project_node_id = (payload.get("projects_v2") or {}).get("node_id")
+    if not project_node_id:
+        logger.warning("Missing project node_id in projects_v2 webhook")
+        return
+
+    stmt = select(GithubProject).where(GithubProject.project_node_id == project_node_id)
+    project = (await db.execute(stmt)).scalar_one_or_none()
+    if not project:
+        logger.info(f"Project {project_node_id} not found in database, ignoring webhook")
+        return
+
+    project.metadata_synced_at = None
+    await db.commit()
+    logger.info(f"Marked metadata of project {project.id} as stale")
+
+
+async def handle_issue_comment_event(
+    db: AsyncSession,
+    event_action: str,
+    payload: dict[str, Any],
+) -> None:
+    """
+    Processa eventos de issue_comment (created, edited, deleted).
+
+    O payload já traz o comentário completo, então a thread guardada é
+    atualizada sem consultar o GitHub. Os itens do projeto não mudam.
+    """
+    logger.info(f"Processing issue_comment event: {event_action}")
+
+    try:
+        if not await apply_issue_comment_event(db, event_action, payload):
+            logger.info("Comment thread not stored locally, ignoring issue_comment webhook")
     except Exception as e:
-        logger.error(f"Error processing pull_request webhook: {e}", exc_info=True)
+        logger.error(f"Error processing issue_comment webhook: {e}", exc_info=True)
+        raise
+
+
+async def handle_webhook_batch(
+    db: AsyncSession,
+    events: list[tuple[str, str, dict[str, Any]]],
+) -> None:
+    """
+    Processa uma rajada de eventos `(event, action, payload)` de uma só vez.
+
+    Os itens tocados são unidos por projeto e atualizados em uma única busca;
+    acima de `webhook_coalesce_max_items` itens num projeto, um sync
+    incremental sai mais barato e é usado no lugar. Remoções são aplicadas
+    segundo o último evento de cada item. Eventos sem agrupamento vão para o
+    handler individual.
+    """
+    item_ids_by_project: dict[int, set[str]] = {}
+    deleted_item_ids: set[str] = set()
+    projects_by_node_id: dict[str, GithubProject | None] = {}
+
+    for event, action, payload in events:
+        if event == "project_v2_item":
+            project_item_data = payload.get("projects_v2_item", {})
+            item_node_id = project_item_data.get("node_id")
+            project_node_id = (payload.get("project_v2") or {}).get("node_id") or project_item_data.get(
+                "project_node_id"
+            )
+            if not item_node_id or not project_node_id:
+                continue
+            if project_node_id not in projects_by_node_id:
+                stmt = select(GithubProject).where(GithubProject.project_node_id == project_node_id)
+                projects_by_node_id[project_node_id] = (await db.execute(stmt)).scalar_one_or_none()
+            project = projects_by_node_id[project_node_id]
+            if not project:
+                continue
+            if action == "deleted":
+                deleted_item_ids.add(item_node_id)
+                item_ids_by_project.get(project.id, set()).discard(item_node_id)
+            else:
+                deleted_item_ids.discard(item_node_id)
+                item_ids_by_project.setdefault(project.id, set()).add(item_node_id)
+
+        elif event in ("issues", "pull_request"):
+            content = payload.get("issue") or payload.get("pull_request") or {}
+            content_node_id = content.get("node_id")
+            if not content_node_id:
+                continue
+            await invalidate_issue_details(db, content_node_id)
+            stmt = select(ProjectItem.project_id, ProjectItem.item_node_id).where(
+                ProjectItem.content_node_id == content_node_id
+            )
+            for project_id, item_node_id in (await db.execute(stmt)).all():
+                item_ids_by_project.setdefault(project_id, set()).add(item_node_id)
+
+        else:
+            handler = WEBHOOK_HANDLERS.get(event)
+            if handler:
+                await handler(db, action, payload)
+
+    if deleted_item_ids:
+        await db.execute(delete(ProjectItem).where(ProjectItem.item_node_id.in_(deleted_item_ids)))
+        await db.commit()
+        logger.info(f"Deleted {len(deleted_item_ids)} project items via webhook batch")
+
+    for project_id, item_node_ids in item_ids_by_project.items():
+        if not item_node_ids:
+            continue
+        project = await db.get(GithubProject, project_id)
+        if not project:
+            continue
+        reason = f"{len(events)} webhook events"
+        if len(item_node_ids) > settings.webhook_coalesce_max_items:
+            await _sync_project(db, project, reason)
+        else:
+            await _refresh_project_items(db, project, sorted(item_node_ids), reason)
 
 
 # Mapeamento de eventos para handlers
@@ -253,4 +422,6 @@ WEBHOOK_HANDLERS = {
     "project_v2_item": handle_project_v2_item_event,
     "issues": handle_issues_event,
     "pull_request": handle_pull_request_event,
+    "projects_v2": handle_projects_v2_event,
+    "issue_comment": handle_issue_comment_event,
 }
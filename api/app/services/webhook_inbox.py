@@ -0,0 +1,337 @@
+"""
+Fila durável (inbox) de webhooks do GitHub.
+
+O endpoint de webhooks só valida a assinatura, grava a entrega em
+`webhook_delivery` e responde 202. O processamento acontece aqui, em background:
+- entregas repetidas (mesmo `X-GitHub-Delivery`) são descartadas
+- cada partição (projeto) é processada em ordem de chegada
+- partições diferentes rodam em paralelo (`webhook_worker_concurrency`)
+- falhas são repetidas com backoff exponencial até `webhook_max_attempts`
+- rajadas de um mesmo projeto são agrupadas: a partição só é processada após
+  `webhook_coalesce_window_seconds` sem novos eventos (ou quando o evento mais
+  antigo completa `webhook_coalesce_max_delay_seconds`) e vira um único lote
+- o lote é reservado no banco (`processing` + `lease_token`/`lease_until`) antes
+  de ser processado, então vários workers/processos podem drenar a mesma fila;
+  reservas vencidas (worker que caiu) são retomadas por outro worker
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, exists, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.github_project import GithubProject
+from app.models.project_item import ProjectItem
+from app.models.webhook_delivery import WebhookDelivery
+from app.services.webhook import handle_webhook_batch
+
+logger = logging.getLogger("tactyo.webhook")
+
+STATUS_PENDING = "pending"
+STATUS_PROCESSING = "processing"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# Máximo de entregas carregadas por rodada do processador
+INBOX_BATCH_SIZE = 500
+
+_processing_lock = asyncio.Lock()
+
+
+async def resolve_partition_key(db: AsyncSession, event: str, payload: dict[str, Any]) -> str:
+    """
+    Define a partição da entrega: o node id do projeto afetado.
+
+    Eventos de issue/PR não trazem o projeto; usamos o projeto local que contém
+    o conteúdo quando ele é único, senão o próprio node id do conteúdo.
+    """
+    if event == "project_v2_item":
+        project_node_id = (payload.get("project_v2") or {}).get("node_id") or (
+            payload.get("projects_v2_item") or {}
+        ).get("project_node_id")
+        if project_node_id:
+            return project_node_id
+
+    if event == "projects_v2" and (payload.get("projects_v2") or {}).get("node_id"):
+        return payload["projects_v2"]["node_id"]
+
+    content = payload.get("issue") or payload.get("pull_request") or {}
+    content_node_id = content.get("node_id")
+    if content_node_id:
+        stmt = (
+            select(GithubProject.project_node_id)
+            .join(ProjectItem, ProjectItem.project_id == GithubProject.id)
+            .where(ProjectItem.content_node_id == content_node_id)
+            .distinct()
+        )
+        project_node_ids = list((await db.execute(stmt)).scalars().all())
+        if len(project_node_ids) == 1:
+            return project_node_ids[0]
+        return f"content:{content_node_id}"
+
+    return f"event:{event}"
+
+
+async def enqueue_webhook_delivery(
+    db: AsyncSession,
+    delivery_id: str | None,
+    event: str,
+    payload: dict[str, Any],
+) -> WebhookDelivery | None:
+    """Grava a entrega na fila. Retorna None se ela já tinha sido recebida."""
+    delivery_id = delivery_id or f"local-{uuid.uuid4()}"
+
+    stmt = select(WebhookDelivery.id).where(WebhookDelivery.delivery_id == delivery_id)
+    if (await db.execute(stmt)).scalar_one_or_none() is not None:
+        return None
+
+    delivery = WebhookDelivery(
+        delivery_id=delivery_id,
+        event=event,
+        action=payload.get("action"),
+        partition_key=await resolve_partition_key(db, event, payload),
+        payload=payload,
+        status=STATUS_PENDING,
+        attempts=0,
+    )
+    db.add(delivery)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Redelivery concorrente com o mesmo X-GitHub-Delivery
+        await db.rollback()
+        return None
+    return delivery
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    seconds = settings.webhook_retry_base_seconds * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, 6 * 3600))
+
+
+def _claimable(now: datetime):
+    """Entregas que podem ser reservadas: pendentes ou com reserva vencida."""
+    return or_(
+        WebhookDelivery.status == STATUS_PENDING,
+        and_(WebhookDelivery.status == STATUS_PROCESSING, WebhookDelivery.lease_until < now),
+    )
+
+
+async def _claim_deliveries(
+    session_factory: Callable[[], AsyncSession],
+    partition_key: str,
+    delivery_ids: list[int],
+) -> tuple[str, int]:
+    """
+    Reserva as entregas para este worker. Retorna `(token da reserva, entregas reservadas)`.
+
+    Nada é reservado se outra entrega da partição já estiver reservada com lease
+    válido, o que mantém a ordem da partição entre workers.
+    No Postgres um advisory lock da partição serializa as reservas concorrentes.
+    """
+    token = uuid.uuid4().hex
+    now = datetime.now(UTC)
+    busy = aliased(WebhookDelivery)
+    async with session_factory() as db:
+        if db.get_bind().dialect.name == "postgresql":
+            await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(partition_key))))
+        result = await db.execute(
+            update(WebhookDelivery)
+            .where(
+                WebhookDelivery.id.in_(delivery_ids),
+                _claimable(now),
+                ~exists().where(
+                    busy.partition_key == partition_key,
+                    busy.status == STATUS_PROCESSING,
+                    busy.lease_until >= now,
+                ),
+            )
+            .values(
+                status=STATUS_PROCESSING,
+                lease_token=token,
+                lease_until=now + timedelta(seconds=settings.webhook_lease_seconds),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+    return token, result.rowcount or 0
+
+
+async def _process_batch(session_factory: Callable[[], AsyncSession], token: str) -> bool:
+    """Processa em sessão própria o lote reservado com `token`. Retorna False se ele deve ser repetido depois."""
+    async with session_factory() as db:
+        stmt = (
+            select(WebhookDelivery)
+            .where(WebhookDelivery.lease_token == token, WebhookDelivery.status == STATUS_PROCESSING)
+            .order_by(WebhookDelivery.id)
+        )
+        deliveries = list((await db.execute(stmt)).scalars().all())
+        events = [(delivery.event, delivery.action or "unknown", delivery.payload or {}) for delivery in deliveries]
+    if not events:
+        return True
+
+    delivery_ids = [delivery.id for delivery in deliveries]
+    error: str | None = None
+    try:
+        async with session_factory() as db:
+            await handle_webhook_batch(db, events)
+    except Exception as exc:
+        logger.error(f"Error processing webhook deliveries {delivery_ids}: {exc}", exc_info=True)
+        error = str(exc) or exc.__class__.__name__
+
+    now = datetime.now(UTC)
+    async with session_factory() as db:
+        # Só finaliza o que ainda é nosso: com a reserva vencida outro worker pode ter retomado o lote
+        stmt = select(WebhookDelivery).where(
+            WebhookDelivery.id.in_(delivery_ids), WebhookDelivery.lease_token == token
+        )
+        for delivery in (await db.execute(stmt)).scalars().all():
+            delivery.attempts += 1
+            delivery.lease_token = None
+            delivery.lease_until = None
+            if error is None:
+                delivery.status = STATUS_DONE
+                delivery.processed_at = now
+                delivery.last_error = None
+            elif delivery.attempts >= settings.webhook_max_attempts:
+                delivery.status = STATUS_FAILED
+                delivery.last_error = error
+                logger.warning(
+                    f"Webhook delivery {delivery.delivery_id} failed after {delivery.attempts} attempts"
+                )
+            else:
+                delivery.status = STATUS_PENDING
+                delivery.next_attempt_at = now + _retry_delay(delivery.attempts)
+                delivery.last_error = error
+        await db.commit()
+    return error is None
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+async def _process_partition(
+    session_factory: Callable[[], AsyncSession],
+    partition_key: str,
+    deliveries: list[tuple[int, datetime, datetime | None]],
+    limit: asyncio.Semaphore,
+) -> tuple[int, float | None]:
+    """
+    Processa, como um lote, as entregas prontas de uma partição.
+
+    Entregas aguardando retentativa bloqueiam as seguintes para manter a ordem;
+    partições reservadas por outro worker são puladas. Retorna `(entregas processadas, segundos até a partição ficar pronta)`.
+    """
+    now = datetime.now(UTC)
+    ready: list[int] = []
+    for delivery_id, _, next_attempt_at in deliveries:
+        if next_attempt_at is not None and _as_utc(next_attempt_at) > now:
+            break
+        ready.append(delivery_id)
+    if not ready:
+        return 0, None
+
+    received = [_as_utc(received_at) for _, received_at, _ in deliveries[: len(ready)]]
+    quiet_at = max(received) + timedelta(seconds=settings.webhook_coalesce_window_seconds)
+    deadline = min(received) + timedelta(seconds=settings.webhook_coalesce_max_delay_seconds)
+    ready_at = min(quiet_at, deadline)
+    if ready_at > now:
+        return 0, (ready_at - now).total_seconds()
+
+    async with limit:
+        token, claimed = await _claim_deliveries(session_factory, partition_key, ready)
+        if claimed:
+            await _process_batch(session_factory, token)
+    return claimed, None
+
+
+async def _drain_inbox(session_factory: Callable[[], AsyncSession]) -> int:
+    """Processa rodadas da fila até não sobrar entrega pronta que este worker consiga reservar."""
+    total = 0
+    while True:
+        async with session_factory() as db:
+            stmt = (
+                select(
+                    WebhookDelivery.id,
+                    WebhookDelivery.partition_key,
+                    WebhookDelivery.received_at,
+                    WebhookDelivery.next_attempt_at,
+                )
+                .where(_claimable(datetime.now(UTC)))
+                .order_by(WebhookDelivery.id)
+                .limit(INBOX_BATCH_SIZE)
+            )
+            rows = (await db.execute(stmt)).all()
+
+        partitions: dict[str, list[tuple[int, datetime, datetime | None]]] = {}
+        for delivery_id, partition_key, received_at, next_attempt_at in rows:
+            partitions.setdefault(partition_key, []).append((delivery_id, received_at, next_attempt_at))
+
+        limit = asyncio.Semaphore(max(1, settings.webhook_worker_concurrency))
+        results = await asyncio.gather(
+            *(
+                _process_partition(session_factory, partition_key, deliveries, limit)
+                for partition_key, deliveries in partitions.items()
+            )
+        )
+        processed = sum(count for count, _ in results)
+        total += processed
+        if processed:
+            continue
+
+        waits = [wait for _, wait in results if wait is not None]
+        if not waits:
+            break
+        await asyncio.sleep(min(waits))
+    return total
+
+
+async def process_webhook_inbox(session_factory: Callable[[], AsyncSession] = SessionLocal) -> int:
+    """
+    Processa as entregas pendentes da fila.
+
+    Chamado após cada webhook recebido e periodicamente pelo scheduler (para as
+    retentativas e reservas vencidas). Apenas uma execução por processo roda por
+    vez; entregas que chegam durante a execução são pegas na rodada seguinte do
+    mesmo loop, que também aguarda as janelas de agrupamento ainda abertas.
+    Entre processos, a reserva de cada lote no banco evita processamento duplo.
+    """
+    if _processing_lock.locked():
+        return 0
+
+    async with _processing_lock:
+        return await _drain_inbox(session_factory)
+
+
+async def purge_processed_webhooks(session_factory: Callable[[], AsyncSession] = SessionLocal) -> int:
+    """Remove entregas concluídas há mais de `webhook_retention_days`."""
+    cutoff = datetime.now(UTC) - timedelta(days=settings.webhook_retention_days)
+    async with session_factory() as db:
+        result = await db.execute(
+            delete(WebhookDelivery).where(
+                WebhookDelivery.status == STATUS_DONE,
+                WebhookDelivery.processed_at < cutoff,
+            )
+        )
+        await db.commit()
+        return result.rowcount or 0
+
+
+async def run_webhook_inbox_job() -> None:
+    """Job do scheduler: retentativas pendentes e limpeza da fila."""
+    processed = await process_webhook_inbox()
+    purged = await purge_processed_webhooks()
+    if processed or purged:
+        logger.info(f"Webhook inbox: {processed} entregas processadas, {purged} removidas")
@@ -0,0 +1,72 @@
+"""
+Utilities for classifying project item statuses.
+
+Maps the free-form Status column of a project to a fixed category
+(todo, in_progress, done) that is persisted on each item.
+"""
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+STATUS_CATEGORY_TODO = "todo"
+STATUS_CATEGORY_IN_PROGRESS = "in_progress"
+STATUS_CATEGORY_DONE = "done"
+
+DONE_STATUS_KEYWORDS = ("done", "concluído", "concluido", "finalizado", "finished", "completo", "completed")
+TODO_STATUS_KEYWORDS = ("todo", "to do", "backlog", "a fazer", "não iniciado", "nao iniciado")
+
+
+def _keyword_category(normalized: str) -> str | None:
+    if any(keyword in normalized for keyword in DONE_STATUS_KEYWORDS):
+        return STATUS_CATEGORY_DONE
+    if any(keyword in normalized for keyword in TODO_STATUS_KEYWORDS):
+        return STATUS_CATEGORY_TODO
+    return None
+
+
+@lru_cache(maxsize=256)
+def _status_category_map(status_columns: tuple[str, ...]) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    for index, column in enumerate(status_columns):
+        normalized = column.strip().lower()
+        if not normalized or normalized in mapping:
+            continue
+        category = _keyword_category(normalized)
+        if category is None:
+            # A primeira coluna do quadro é a de entrada; as demais sem palavra-chave estão em andamento
+            category = STATUS_CATEGORY_TODO if index == 0 else STATUS_CATEGORY_IN_PROGRESS
+        mapping[normalized] = category
+    return mapping
+
+
+def derive_status_category(status: str | None, status_columns: Iterable[str] | None = None) -> str:
+    """
+    Deriva a categoria de um status a partir das colunas do projeto.
+
+    Prioridade de detecção:
+    1. Colunas do projeto (`GithubProject.status_columns`): colunas com palavra-chave
+       de concluído são "done", a primeira coluna e as de palavra-chave de a fazer são
+       "todo" e as demais "in_progress"
+    2. Status fora das colunas: mesmas palavras-chave, senão "in_progress"
+
+    Itens sem status são "todo".
+
+    Examples:
+        >>> derive_status_category("Done")
+        'done'
+
+        >>> derive_status_category("Review", ["Backlog", "Review", "Done"])
+        'in_progress'
+
+        >>> derive_status_category(None)
+        'todo'
+    """
+    normalized = (status or "").strip().lower()
+    if not normalized:
+        return STATUS_CATEGORY_TODO
+
+    columns = tuple(column for column in status_columns or () if isinstance(column, str))
+    category = _status_category_map(columns).get(normalized)
+    if category:
+        return category
+    return _keyword_category(normalized) or STATUS_CATEGORY_IN_PROGRESS
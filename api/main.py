@@ -30,6 +30,7 @@ if settings.enable_cors:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
 app.include_router(api_router, prefix="/api")
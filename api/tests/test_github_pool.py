@@ -0,0 +1,43 @@
+import pytest
+
+from app.core.config import settings
+from app.services.github_pool import GithubClientPool
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_pool_reuses_client_per_token():
+    pool = GithubClientPool()
+
+    async with pool.lease("token-a") as first:
+        pass
+    async with pool.lease("token-a") as second:
+        pass
+    async with pool.lease("token-b") as other:
+        pass
+
+    assert first is second
+    assert other is not first
+    assert len(pool) == 2
+    await pool.aclose()
+    assert first.is_closed and other.is_closed
+    assert len(pool) == 0
+
+
+@pytest.mark.anyio
+async def test_pool_evicts_idle_clients_but_not_in_flight(monkeypatch):
+    monkeypatch.setattr(settings, "github_client_idle_ttl_seconds", -1)
+    pool = GithubClientPool()
+
+    async with pool.lease("token-a") as idle_client:
+        pass
+    async with pool.lease("token-b") as busy_client:
+        await pool.evict_idle()
+        assert idle_client.is_closed
+        assert not busy_client.is_closed
+
+    await pool.aclose()
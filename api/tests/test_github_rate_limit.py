@@ -0,0 +1,88 @@
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services.github_pool import github_client_pool
+from app.services.github_rate_limit import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RESOURCE_GRAPHQL,
+    GithubRateLimitGovernor,
+    governed_request,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _headers(remaining: int, reset_in: int = 600) -> dict[str, str]:
+    reset = int((datetime.now(UTC) + timedelta(seconds=reset_in)).timestamp())
+    return {
+        "x-ratelimit-limit": "5000",
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(reset),
+        "x-ratelimit-resource": "graphql",
+    }
+
+
+def test_background_keeps_headroom_for_interactive(monkeypatch):
+    monkeypatch.setattr(settings, "github_rate_limit_headroom", 100)
+    governor = GithubRateLimitGovernor()
+    governor.update_from_headers("tok", _headers(remaining=150), RESOURCE_GRAPHQL)
+
+    assert governor._delay_for("tok", RESOURCE_GRAPHQL, PRIORITY_INTERACTIVE) == 0
+    # 50 pontos livres acima da folga para ~600s: chamadas espaçadas
+    assert 10 < governor._delay_for("tok", RESOURCE_GRAPHQL, PRIORITY_BACKGROUND) <= 12
+
+    governor.update_from_headers("tok", _headers(remaining=80), RESOURCE_GRAPHQL)
+    assert governor._delay_for("tok", RESOURCE_GRAPHQL, PRIORITY_BACKGROUND) > 590
+
+
+def test_exhausted_budget_fails_fast_for_interactive():
+    governor = GithubRateLimitGovernor()
+    governor.update_from_headers("tok", _headers(remaining=0), RESOURCE_GRAPHQL)
+
+    with pytest.raises(HTTPException) as exc_info:
+        governor._delay_for("tok", RESOURCE_GRAPHQL, PRIORITY_INTERACTIVE)
+    assert exc_info.value.status_code == 429
+
+
+def test_snapshot_by_account_uses_registered_token():
+    governor = GithubRateLimitGovernor()
+    governor.register_account("acc-1", "tok")
+    governor.update_from_graphql("tok", {"limit": 5000, "cost": 1, "remaining": 4999, "resetAt": "2025-01-01T00:00:00Z"})
+
+    snapshot = governor.snapshot_by_account()
+
+    assert snapshot["acc-1"]["resources"]["graphql"]["remaining"] == 4999
+    assert snapshot["acc-1"]["resources"]["graphql"]["last_cost"] == 1
+
+
+@pytest.mark.anyio
+async def test_governed_request_retries_secondary_limit(monkeypatch):
+    responses = [
+        httpx.Response(403, headers={"retry-after": "0"}, text="You have exceeded a secondary rate limit"),
+        httpx.Response(200, headers=_headers(remaining=4000), json={"data": {}}),
+    ]
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(
+        github_client_pool,
+        "_build_client",
+        lambda token: httpx.AsyncClient(base_url="https://api.github.com", transport=httpx.MockTransport(handler)),
+    )
+
+    response = await governed_request("tok-secondary", "POST", "/graphql", resource=RESOURCE_GRAPHQL, json={})
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    await github_client_pool.aclose()
@@ -35,7 +35,7 @@ async def test_configure_github_project(client: AsyncClient, monkeypatch):
     assert status_response.status_code == 200
     assert status_response.json()["configured"] is True
 
-    async def fake_fetch_metadata(client, owner, number):
+    async def fake_fetch_metadata(client, owner, number, owner_type=None):
         return ProjectMetadata(
             node_id="PROJECT_NODE_ID",
             title="Tactyo",
@@ -83,7 +83,7 @@ async def test_sync_github_project(client: AsyncClient, session_factory, monkeyp
     status_response = await client.get("/api/settings/github-token")
     assert status_response.status_code == 200
 
-    async def fake_fetch_metadata(client, owner, number):
+    async def fake_fetch_metadata(client, owner, number, owner_type=None):
         return ProjectMetadata(
             node_id="PROJECT_NODE_ID",
             title="Tactyo",
@@ -92,8 +92,8 @@ async def test_sync_github_project(client: AsyncClient, session_factory, monkeyp
             field_mappings={"Status": {"id": "status-id", "name": "Status"}},
         )
 
-    async def fake_fetch_items(client, project_node_id):
-        return [
+    async def fake_item_pages(client, project_node_id, fields=None):
+        yield [
             ProjectItemPayload(
                 node_id="ITEM_NODE",
                 content_node_id="ISSUE_NODE",
@@ -113,7 +113,7 @@ async def test_sync_github_project(client: AsyncClient, session_factory, monkeyp
         return [ProjectSummary(node_id="PROJECT_NODE_ID", number=1, title="Tactyo", updated_at=None)]
 
     monkeypatch.setattr("app.services.github.fetch_project_metadata", fake_fetch_metadata)
-    monkeypatch.setattr("app.services.github.fetch_project_items", fake_fetch_items)
+    monkeypatch.setattr("app.services.github.iter_project_item_pages", fake_item_pages)
     monkeypatch.setattr("app.services.github.list_projects", fake_list_projects)
 
     project_response = await client.post(
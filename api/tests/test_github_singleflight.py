@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.services.github_singleflight import GithubSingleflight, is_mutation, query_key
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_queries_share_one_call():
+    singleflight = GithubSingleflight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"node": {"id": "I_1"}}
+
+    key = query_key("token", "query { node }", {"b": 2, "a": 1})
+    same_key = query_key("token", "query { node }", {"a": 1, "b": 2})
+    waiters = [asyncio.create_task(singleflight.do(k, call)) for k in (key, same_key, key)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert results[0] is results[1] is results[2]
+    assert len(singleflight) == 0
+
+    # Sem TTL, a chamada seguinte vai de novo ao GitHub
+    await singleflight.do(key, call)
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_ttl_results_are_dropped_after_mutation_and_errors_are_not_cached():
+    singleflight = GithubSingleflight()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    key = query_key("token", "query { viewer { login } }", None)
+    assert await singleflight.do(key, call, ttl=60) == 1
+    assert await singleflight.do(key, call, ttl=60) == 1
+
+    singleflight.forget_token("token")
+    assert await singleflight.do(key, call, ttl=60) == 2
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    other = query_key("token", "query { other }", None)
+    with pytest.raises(RuntimeError):
+        await singleflight.do(other, failing, ttl=60)
+    assert await singleflight.do(other, call, ttl=60) == 3
+
+
+def test_is_mutation():
+    assert is_mutation("\n  mutation($id: ID!) { deleteIssue }")
+    assert not is_mutation("query { viewer { login } }")
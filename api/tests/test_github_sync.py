@@ -0,0 +1,350 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.models.github_project import GithubProject
+from app.models.github_project_field import GithubProjectField
+from app.services.github import (
+    ITEM_PAGE_SIZE_MIN,
+    SYNCED_ITEM_COLUMNS,
+    _bulk_delete_orphan_items,
+    _bulk_upsert_project_items,
+    _needs_full_sync,
+    build_project_item_query,
+    compute_field_mappings_hash,
+    compute_payload_hash,
+    fetch_project_item_comments_since,
+    fetch_project_item_details_batch,
+    fetch_project_item_stamps,
+    fetch_project_items_by_ids,
+    fetch_project_metadata,
+    iter_project_item_pages,
+    parse_project_item_node,
+    payload_high_water_mark,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeGraphQLClient:
+    def __init__(self, responses: list[dict]):
+        self.responses = list(responses)
+        self.calls: list[dict] = []
+
+    async def execute(self, query: str, variables: dict):
+        self.calls.append({"query": query, "variables": variables})
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _item_node(node_id: str, item_updated: str, content_updated: str | None = None) -> dict:
+    return {
+        "id": node_id,
+        "updatedAt": item_updated,
+        "content": {
+            "__typename": "Issue",
+            "id": f"ISSUE_{node_id}",
+            "title": f"Item {node_id}",
+            "url": f"https://github.com/org/repo/issues/{node_id}",
+            "updatedAt": content_updated,
+            "assignees": {"nodes": [{"login": "alice"}]},
+            "labels": {"nodes": [{"name": "type:task"}]},
+        },
+        "fieldValues": {
+            "nodes": [
+                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "field": {"name": "Status"}, "name": "Todo"},
+                {"__typename": "ProjectV2ItemFieldNumberValue", "field": {"name": "Estimate"}, "number": 3},
+            ]
+        },
+    }
+
+
+def test_parse_project_item_node_uses_latest_timestamp_as_high_water_mark():
+    payload = parse_project_item_node(_item_node("A", "2025-01-01T10:00:00Z", "2025-01-02T10:00:00Z"))
+
+    assert payload.status == "Todo"
+    assert payload.estimate == 3.0
+    assert payload.assignees == ["alice"]
+    assert payload.labels == ["type:task"]
+    assert payload_high_water_mark(payload) == datetime(2025, 1, 2, 10, tzinfo=UTC)
+
+
+def test_parse_project_item_node_reads_sub_issue_parent():
+    node = _item_node("A", "2025-01-01T10:00:00Z")
+    node["content"]["parent"] = {"id": "ISSUE_PARENT"}
+
+    assert parse_project_item_node(node).parent_content_node_id == "ISSUE_PARENT"
+    assert parse_project_item_node(_item_node("B", "2025-01-01T10:00:00Z")).parent_content_node_id is None
+    assert "parent { id }" in build_project_item_query([_field("Title", "TITLE")]).fragment
+
+
+def test_needs_full_sync_respects_interval():
+    now = datetime(2025, 1, 1, 12, tzinfo=UTC)
+    project = GithubProject(owner_login="viaiv", project_number=1, project_node_id="PVT")
+    assert _needs_full_sync(project, now) is True
+
+    project.items_high_water_mark = now
+    project.last_full_sync_at = now - timedelta(minutes=5)
+    assert _needs_full_sync(project, now) is False
+
+    project.last_full_sync_at = now - timedelta(days=1)
+    assert _needs_full_sync(project, now) is True
+
+
+@pytest.mark.anyio
+async def test_fetch_project_item_stamps_paginates_and_takes_latest_update():
+    client = FakeGraphQLClient(
+        [
+            {
+                "node": {
+                    "items": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                        "nodes": [{"id": "A", "updatedAt": "2025-01-01T00:00:00Z", "content": {"updatedAt": "2025-01-03T00:00:00Z"}}],
+                    }
+                }
+            },
+            {
+                "node": {
+                    "items": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [{"id": "B", "updatedAt": "2025-01-02T00:00:00Z", "content": None}],
+                    }
+                }
+            },
+        ]
+    )
+
+    stamps = await fetch_project_item_stamps(client, "PVT")
+
+    assert [stamp.node_id for stamp in stamps] == ["A", "B"]
+    assert stamps[0].updated_at == datetime(2025, 1, 3, tzinfo=UTC)
+    assert stamps[1].updated_at == datetime(2025, 1, 2, tzinfo=UTC)
+    assert client.calls[1]["variables"]["after"] == "c1"
+
+
+@pytest.mark.anyio
+async def test_fetch_project_items_by_ids_skips_removed_nodes():
+    client = FakeGraphQLClient([{"nodes": [_item_node("A", "2025-01-01T00:00:00Z"), None]}])
+
+    items = await fetch_project_items_by_ids(client, ["A", "GONE", "A"])
+
+    assert [item.node_id for item in items] == ["A"]
+    assert client.calls[0]["variables"]["ids"] == ["A", "GONE"]
+
+
+def test_compute_payload_hash_is_stable_and_detects_changes():
+    payload = parse_project_item_node(_item_node("A", "2025-01-01T00:00:00Z"))
+    same = parse_project_item_node(_item_node("A", "2025-01-01T00:00:00Z"))
+
+    assert compute_payload_hash(payload) == compute_payload_hash(same)
+    assert len(compute_payload_hash(payload)) == 64
+
+    same.title = "Outro título"
+    assert compute_payload_hash(payload) != compute_payload_hash(same)
+
+
+@pytest.mark.anyio
+async def test_iter_project_item_pages_yields_each_page():
+    client = FakeGraphQLClient(
+        [
+            {
+                "node": {
+                    "items": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                        "nodes": [_item_node("A", "2025-01-01T00:00:00Z")],
+                    }
+                }
+            },
+            {
+                "node": {
+                    "items": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [_item_node("B", "2025-01-02T00:00:00Z")],
+                    }
+                }
+            },
+        ]
+    )
+
+    pages = [page async for page in iter_project_item_pages(client, "PVT")]
+
+    assert [[item.node_id for item in page] for page in pages] == [["A"], ["B"]]
+    assert client.calls[0]["variables"]["after"] is None
+    assert client.calls[1]["variables"]["after"] == "c1"
+
+
+def _metadata_project(title: str = "Board") -> dict:
+    return {
+        "projectV2": {
+            "id": "PVT",
+            "title": title,
+            "fields": {"nodes": [{"__typename": "ProjectV2Field", "id": "F1", "name": "Estimate", "dataType": "NUMBER"}]},
+        }
+    }
+
+
+@pytest.mark.anyio
+async def test_fetch_project_metadata_queries_only_known_owner_root():
+    client = FakeGraphQLClient([{"user": _metadata_project()}])
+
+    metadata = await fetch_project_metadata(client, "alice", 1, owner_type="user")
+
+    assert metadata.owner_type == "user"
+    assert "user(login" in client.calls[0]["query"]
+    assert "organization(login" not in client.calls[0]["query"]
+
+
+@pytest.mark.anyio
+async def test_fetch_project_metadata_falls_back_to_both_roots():
+    client = FakeGraphQLClient([{"user": None}, {"organization": _metadata_project(), "user": None}])
+
+    metadata = await fetch_project_metadata(client, "acme", 1, owner_type="user")
+
+    assert metadata.owner_type == "organization"
+    assert len(client.calls) == 2
+
+
+def test_field_mappings_hash_ignores_key_order_and_detects_changes():
+    mappings = {"Status": {"id": "S", "options": [{"id": "1", "name": "Todo"}]}, "Estimate": {"id": "E"}}
+    reordered = {"Estimate": {"id": "E"}, "Status": {"options": [{"name": "Todo", "id": "1"}], "id": "S"}}
+    renamed = {"Status": {"id": "S", "options": [{"id": "1", "name": "Backlog"}]}, "Estimate": {"id": "E"}}
+
+    assert compute_field_mappings_hash(mappings) == compute_field_mappings_hash(reordered)
+    assert compute_field_mappings_hash(mappings) != compute_field_mappings_hash(renamed)
+
+
+def _field(name: str, field_type: str) -> GithubProjectField:
+    return GithubProjectField(field_id=f"F_{name}", field_name=name, field_type=field_type)
+
+
+def test_build_project_item_query_selects_only_stored_field_types():
+    query = build_project_item_query(
+        [_field("Title", "TITLE"), _field("Status", "SINGLE_SELECT"), _field("Labels", "LABELS")]
+    )
+
+    assert "ProjectV2ItemFieldTextValue" in query.fragment
+    assert "ProjectV2ItemFieldSingleSelectValue" in query.fragment
+    assert "ProjectV2ItemFieldIterationValue" not in query.fragment
+    assert "ProjectV2ItemFieldLabelValue" not in query.fragment
+    assert "ProjectV2ItemFieldRepositoryValue" not in query.fragment
+    assert "fieldValues(first: 3)" in query.fragment
+
+    with_relationships = build_project_item_query([_field("Title", "TITLE"), _field("Parent", "LABELS")])
+    assert "ProjectV2ItemFieldLabelValue" in with_relationships.fragment
+    assert with_relationships.nodes_per_item > query.nodes_per_item
+    assert build_project_item_query([]).page_size() <= query.page_size()
+
+
+@pytest.mark.anyio
+async def test_iter_project_item_pages_shrinks_page_on_github_timeout(caplog):
+    page = {
+        "node": {
+            "items": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [_item_node("A", "2025-01-01T00:00:00Z")],
+            }
+        }
+    }
+    client = FakeGraphQLClient([HTTPException(502, detail="timeout"), page])
+    fields = [_field("Title", "TITLE"), _field("Status", "SINGLE_SELECT")]
+
+    pages = [page async for page in iter_project_item_pages(client, "PVT", fields)]
+
+    assert [[item.node_id for item in page] for page in pages] == [["A"]]
+    first, retry = (call["variables"] for call in client.calls)
+    assert retry["after"] == first["after"]
+    assert retry["first"] == max(ITEM_PAGE_SIZE_MIN, first["first"] // 2)
+    assert [record.levelname for record in caplog.records if record.name == "tactyo.github"] == ["WARNING"]
+
+
+@pytest.mark.anyio
+async def test_fetch_project_item_details_batch_chunks_ids(monkeypatch):
+    monkeypatch.setattr("app.services.github.NODES_BATCH_SIZE", 2)
+    client = FakeGraphQLClient(
+        [
+            {"nodes": [{"__typename": "Issue", "id": "I1", "bodyText": "one"}, {"__typename": "Issue", "id": "I2"}]},
+            {"nodes": [None]},
+        ]
+    )
+
+    details = await fetch_project_item_details_batch(client, ["I1", "I2", "I3", "I1"])
+
+    assert [call["variables"]["ids"] for call in client.calls] == [["I1", "I2"], ["I3"]]
+    assert set(details) == {"I1", "I2"}
+    assert details["I1"]["body_text"] == "one"
+
+
+def _comments_page(comment_ids: list[tuple[str, str]], has_previous: bool) -> dict:
+    return {
+        "node": {
+            "__typename": "Issue",
+            "comments": {
+                "pageInfo": {"hasPreviousPage": has_previous, "startCursor": f"before-{comment_ids[0][0]}"},
+                "nodes": [{"id": comment_id, "createdAt": created_at} for comment_id, created_at in comment_ids],
+            },
+        }
+    }
+
+
+@pytest.mark.anyio
+async def test_fetch_comments_since_stops_at_known_comment():
+    client = FakeGraphQLClient(
+        [
+            _comments_page([("C4", "2025-01-04T00:00:00Z"), ("C5", "2025-01-05T00:00:00Z")], True),
+            _comments_page([("C2", "2025-01-02T00:00:00Z"), ("C3", "2025-01-03T00:00:00Z")], True),
+        ]
+    )
+
+    comments = await fetch_project_item_comments_since(
+        client, "I_1", datetime(2025, 1, 2, tzinfo=UTC)
+    )
+
+    assert [comment["id"] for comment in comments] == ["C3", "C4", "C5"]
+    assert client.calls[1]["variables"]["before"] == "before-C4"
+
+
+class StatementRecorder:
+    """Sessão falsa que só guarda os statements executados."""
+
+    def __init__(self):
+        self.statements: list = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return type("Result", (), {"rowcount": 0})()
+
+
+@pytest.mark.anyio
+async def test_bulk_upsert_and_orphan_delete_compile_for_postgresql():
+    db = StatementRecorder()
+    row = dict.fromkeys(SYNCED_ITEM_COLUMNS)
+    row.update(item_node_id="I1", account_id=uuid.uuid4(), project_id=1)
+
+    await _bulk_upsert_project_items(db, [row])
+    await _bulk_delete_orphan_items(db, GithubProject(id=1), {"I1", "I2"})
+
+    upsert, orphan_delete = (stmt.compile(dialect=postgresql.dialect()) for stmt in db.statements)
+
+    upsert_sql = str(upsert)
+    assert "ON CONFLICT (item_node_id) DO UPDATE SET " in upsert_sql
+    set_clause, guard = upsert_sql.split("DO UPDATE SET ", 1)[1].split(" WHERE ", 1)
+    assert set(set_clause.split(", ")) == {f"{column} = excluded.{column}" for column in SYNCED_ITEM_COLUMNS}
+    assert guard == (
+        "project_item.content_hash IS DISTINCT FROM excluded.content_hash "
+        "AND project_item.remote_sync_status IS DISTINCT FROM %(remote_sync_status_1)s"
+    )
+    assert upsert.params["remote_sync_status_1"] == "pending"
+
+    assert str(orphan_delete) == (
+        "DELETE FROM project_item WHERE project_item.project_id = %(project_id_1)s "
+        "AND project_item.item_node_id != ALL (%(seen_node_ids)s::VARCHAR(255)[])"
+    )
+    assert sorted(orphan_delete.params["seen_node_ids"]) == ["I1", "I2"]
@@ -0,0 +1,69 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.models.account import Account
+from app.models.account_github_credentials import AccountGithubCredentials
+from app.services import github
+from app.services.github import get_github_token, invalidate_github_token, store_github_token
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (Account, AccountGithubCredentials):
+            await conn.run_sync(lambda sync_conn, table=model.__table__: table.create(sync_conn))
+    invalidate_github_token()
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    invalidate_github_token()
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_token_is_decrypted_once_and_replaced_on_store(db_session, monkeypatch):
+    account = Account(id=uuid.uuid4(), name="Acme")
+    db_session.add(account)
+    await store_github_token(db_session, account, "ghp_primeiro")
+
+    decrypted: list[bytes] = []
+    original_decrypt = github.decrypt_secret
+
+    def counting_decrypt(nonce, ciphertext):
+        decrypted.append(ciphertext)
+        return original_decrypt(nonce, ciphertext)
+
+    monkeypatch.setattr(github, "decrypt_secret", counting_decrypt)
+
+    assert await get_github_token(db_session, account) == "ghp_primeiro"
+    assert await get_github_token(db_session, account) == "ghp_primeiro"
+    assert len(decrypted) == 1
+
+    await store_github_token(db_session, account, "ghp_segundo")
+    assert await get_github_token(db_session, account) == "ghp_segundo"
+    assert len(decrypted) == 2
+
+
+@pytest.mark.anyio
+async def test_token_cache_evicts_least_recently_used(db_session, monkeypatch):
+    monkeypatch.setattr(settings, "github_token_cache_max_entries", 2)
+    accounts = [Account(id=uuid.uuid4(), name=f"Conta {index}") for index in range(3)]
+    db_session.add_all(accounts)
+    for index, account in enumerate(accounts):
+        await store_github_token(db_session, account, f"ghp_{index}")
+
+    first, second, third = accounts
+    await get_github_token(db_session, first)
+    await get_github_token(db_session, second)
+    await get_github_token(db_session, first)
+    await get_github_token(db_session, third)
+
+    assert list(github._github_token_cache) == [first.id, third.id]
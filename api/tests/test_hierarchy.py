@@ -0,0 +1,109 @@
+import json
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.github_project import GithubProject
+from app.models.project_item import ProjectItem
+from app.services.github import link_project_item_parents
+from app.services.hierarchy import (
+    build_hierarchy,
+    hierarchy_response,
+    iter_hierarchy_ndjson,
+    load_hierarchy_nodes,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(ProjectItem.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _item(item_id: int, title: str, parent: int | None = None, **values) -> ProjectItem:
+    return ProjectItem(
+        id=item_id,
+        account_id=uuid.uuid4(),
+        project_id=1,
+        item_node_id=f"I{item_id}",
+        title=title,
+        parent_item_id=parent,
+        **values,
+    )
+
+
+@pytest.mark.anyio
+async def test_hierarchy_rolls_up_subtrees_and_keeps_cycles(db_session):
+    db_session.add_all(
+        [
+            _item(1, "A história", epic_option_id="E1", epic_name="Login", estimate=1),
+            _item(2, "B tarefa", parent=1, estimate=3, status_category="done"),
+            _item(3, "C tarefa", parent=1, estimate=5),
+            _item(4, "D subtarefa", parent=3, estimate=2, status_category="done"),
+            _item(5, "E solta"),
+            _item(6, "F pai removido", parent=99),
+            _item(7, "G ciclo", parent=8),
+            _item(8, "H ciclo", parent=7),
+            # Vem antes do ciclo na ordem por título, mas não faz parte dele
+            _item(9, "Abaixo do ciclo", parent=8),
+        ]
+    )
+    await db_session.flush()
+
+    groups = build_hierarchy(await load_hierarchy_nodes(db_session, 1))
+    response = hierarchy_response(groups)
+
+    [epic] = response.epics
+    assert (epic.epic_option_id, epic.item_count, epic.completed_count) == ("E1", 4, 2)
+    story = epic.items[0]
+    assert [child.title for child in story.children] == ["B tarefa", "C tarefa"]
+    assert (story.total_estimate, story.completed_estimate) == (11.0, 5.0)
+    assert (story.children[1].item_count, story.children[1].completed_estimate) == (2, 2.0)
+
+    # Só o ciclo G <-> H é cortado; o item abaixo dele continua sob H
+    assert [orphan.title for orphan in response.orphans] == ["E solta", "F pai removido", "H ciclo"]
+    cycle = response.orphans[2]
+    assert [child.title for child in cycle.children] == ["Abaixo do ciclo", "G ciclo"]
+    assert cycle.item_count == 3
+
+    lines = [json.loads(line) for line in iter_hierarchy_ndjson(groups)]
+    assert [(line["kind"], line.get("title"), line.get("depth")) for line in lines[:5]] == [
+        ("epic", None, None),
+        ("item", "A história", 0),
+        ("item", "B tarefa", 1),
+        ("item", "C tarefa", 1),
+        ("item", "D subtarefa", 2),
+    ]
+    assert sum(1 for line in lines if line["kind"] == "item") == 9
+
+
+@pytest.mark.anyio
+async def test_link_project_item_parents_resolves_sub_issues(db_session):
+    db_session.add_all(
+        [
+            _item(1, "Épico", content_node_id="ISSUE_1"),
+            _item(2, "Filha", content_node_id="ISSUE_2", parent_content_node_id="ISSUE_1"),
+            _item(3, "Neta", content_node_id="ISSUE_3", parent_content_node_id="ISSUE_2"),
+            _item(4, "Pai fora do projeto", content_node_id="ISSUE_4", parent_content_node_id="ISSUE_X"),
+            _item(5, "Desvinculada", parent=1, content_node_id="ISSUE_5"),
+        ]
+    )
+    await db_session.flush()
+    project = GithubProject(id=1)
+
+    assert await link_project_item_parents(db_session, project) == 3
+    assert await link_project_item_parents(db_session, project) == 0
+
+    db_session.expire_all()
+    nodes = {node.id: node.parent_item_id for node in await load_hierarchy_nodes(db_session, 1)}
+    assert nodes == {1: None, 2: 1, 3: 2, 4: None, 5: None}
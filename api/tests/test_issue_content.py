@@ -0,0 +1,159 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.issue_content_cache import IssueContentCache
+from app.services import issue_content
+from app.services.issue_content import (
+    apply_issue_comment_event,
+    get_issue_comments,
+    get_issue_details,
+    invalidate_issue_details,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: IssueContentCache.__table__.create(sync_conn))
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class FakeClient:
+    def __init__(self, token, priority=None):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+
+class FakeBackgroundTasks:
+    def __init__(self):
+        self.tasks = []
+
+    def add_task(self, func, *args):
+        self.tasks.append((func, args))
+
+
+def _comment(comment_id: str, created_at: str) -> dict:
+    return {"id": comment_id, "body": comment_id, "created_at": created_at, "updated_at": created_at}
+
+
+@pytest.fixture
+def github_calls(monkeypatch):
+    calls: list[tuple] = []
+
+    async def fake_details(client, content_node_id):
+        calls.append(("details", content_node_id))
+        return {"id": content_node_id, "body": f"body {len(calls)}", "updated_at": "2025-01-01T00:00:00Z"}
+
+    async def fake_comments(client, content_node_id, since, limit):
+        calls.append(("comments", since))
+        if since is None:
+            return [_comment("C1", "2025-01-01T00:00:00Z")]
+        return [_comment("C2", "2025-01-02T00:00:00Z")]
+
+    monkeypatch.setattr(issue_content, "GithubGraphQLClient", FakeClient)
+    monkeypatch.setattr(issue_content, "fetch_project_item_details", fake_details)
+    monkeypatch.setattr(issue_content, "fetch_project_item_comments_since", fake_comments)
+    return calls
+
+
+@pytest.mark.anyio
+async def test_details_are_served_from_store_until_invalidated(session_factory, github_calls):
+    async with session_factory() as db:
+        first = await get_issue_details(db, "token", "I_1")
+        second = await get_issue_details(db, "token", "I_1")
+        await invalidate_issue_details(db, "I_1")
+        third = await get_issue_details(db, "token", "I_1")
+
+    assert first == second
+    assert third["body"] == "body 2"
+    assert github_calls == [("details", "I_1"), ("details", "I_1")]
+
+
+@pytest.mark.anyio
+async def test_stale_comments_refresh_in_background_incrementally(session_factory, github_calls):
+    background = FakeBackgroundTasks()
+    async with session_factory() as db:
+        assert [c["id"] for c in await get_issue_comments(db, "token", "I_1")] == ["C1"]
+
+        entry = await issue_content._get_entry(db, "I_1")
+        entry.comments_fetched_at = datetime.now(UTC) - timedelta(days=1)
+        await db.commit()
+
+        stale = await get_issue_comments(db, "token", "I_1", background)
+
+    assert [c["id"] for c in stale] == ["C1"]
+    func, args = background.tasks[0]
+    await func(*args, session_factory=session_factory)
+
+    async with session_factory() as db:
+        refreshed = await get_issue_comments(db, "token", "I_1")
+
+    assert [c["id"] for c in refreshed] == ["C1", "C2"]
+    assert github_calls[1] == ("comments", datetime(2025, 1, 1, tzinfo=UTC))
+
+
+@pytest.mark.anyio
+async def test_issue_comment_webhook_updates_stored_thread(session_factory, github_calls):
+    async with session_factory() as db:
+        await get_issue_comments(db, "token", "I_1")
+        created = {
+            "issue": {"node_id": "I_1"},
+            "comment": {"node_id": "C9", "body": "new", "created_at": "2025-01-03T00:00:00Z", "user": {"login": "bob"}},
+        }
+        assert await apply_issue_comment_event(db, "created", created)
+        assert await apply_issue_comment_event(db, "deleted", {"issue": {"node_id": "I_1"}, "comment": {"node_id": "C1"}})
+        comments = await get_issue_comments(db, "token", "I_1")
+
+    assert [(c["id"], c["author_login"]) for c in comments] == [("C9", "bob")]
+    assert len(github_calls) == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_first_fetch_reuses_the_entry_created_by_the_other(tmp_path, github_calls, monkeypatch):
+    # Arquivo em disco: cada requisição usa a própria conexão
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'issues.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: IssueContentCache.__table__.create(sync_conn))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    # As duas requisições leem "não existe" antes de qualquer uma gravar
+    both_read = asyncio.Barrier(2)
+    original_get_entry = issue_content._get_entry
+    reads = 0
+
+    async def racing_get_entry(db, content_node_id):
+        nonlocal reads
+        entry = await original_get_entry(db, content_node_id)
+        reads += 1
+        if reads <= 2:
+            await both_read.wait()
+        return entry
+
+    monkeypatch.setattr(issue_content, "_get_entry", racing_get_entry)
+
+    async def fetch() -> dict:
+        async with session_factory() as db:
+            return await get_issue_details(db, "token", "I_1")
+
+    first, second = await asyncio.gather(fetch(), fetch())
+
+    assert first["id"] == second["id"] == "I_1"
+    async with session_factory() as db:
+        assert await db.scalar(select(func.count()).select_from(IssueContentCache)) == 1
+    await engine.dispose()
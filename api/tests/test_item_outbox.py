@@ -0,0 +1,218 @@
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.models.account import Account
+from app.models.github_project import GithubProject
+from app.models.github_project_field import GithubProjectField
+from app.models.item_mutation_outbox import ItemMutationOutbox
+from app.models.project_item import ProjectItem
+from app.services import github, item_outbox
+from app.services.item_outbox import process_item_outbox
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    # Arquivo em disco: cada worker usa as próprias conexões, como em processos separados
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    async with engine.begin() as conn:
+        for model in (Account, GithubProject, GithubProjectField, ProjectItem, ItemMutationOutbox):
+            await conn.run_sync(lambda sync_conn, table=model.__table__: table.create(sync_conn))
+    github.invalidate_project_field_index()
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class FakeClient:
+    def __init__(self, failing: set[str]):
+        self.failing = failing
+        self.documents: list[dict] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def execute_with_errors(self, query: str, variables: dict):
+        self.documents.append(variables)
+        errors = [
+            {"path": [name.replace("input", "m")], "message": "GitHub indisponível"}
+            for name, field_input in variables.items()
+            if field_input["itemId"] in self.failing
+        ]
+        return {}, errors
+
+
+@pytest.fixture
+async def seeded(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "github_write_behind", True)
+    monkeypatch.setattr(settings, "github_outbox_max_attempts", 2)
+
+    async def fake_token(db, account):
+        return "token"
+
+    monkeypatch.setattr(github, "get_github_token", fake_token)
+
+    account_id = uuid.uuid4()
+    async with session_factory() as db:
+        db.add(Account(id=account_id, name="Acme"))
+        db.add(GithubProject(id=1, account_id=account_id, owner_login="acme", project_number=1, project_node_id="PVT"))
+        db.add(
+            GithubProjectField(
+                project_id=1,
+                field_id="F_STATUS",
+                field_name="Status",
+                field_type="SINGLE_SELECT",
+                options=[{"id": "O_TODO", "name": "Todo"}, {"id": "O_DONE", "name": "Done"}],
+            )
+        )
+        for item_id in (1, 2):
+            db.add(ProjectItem(id=item_id, account_id=account_id, project_id=1, item_node_id=f"I{item_id}", status="Todo"))
+        await db.commit()
+    return account_id
+
+
+async def _edit(session_factory, item_id: int, new_status: str) -> ProjectItem:
+    async with session_factory() as db:
+        account = (await db.execute(select(Account))).scalar_one()
+        project = await db.get(GithubProject, 1)
+        item = await db.get(ProjectItem, item_id)
+        await github.apply_local_project_item_updates(db, account, project, item, {"status": new_status}, None)
+        await db.commit()
+        return item
+
+
+@pytest.mark.anyio
+async def test_write_behind_edit_returns_pending_and_worker_pushes_latest_value(session_factory, seeded, monkeypatch):
+    client = FakeClient(failing=set())
+    monkeypatch.setattr(github, "GithubGraphQLClient", lambda token, priority=None: client)
+
+    await _edit(session_factory, 1, "Done")
+    item = await _edit(session_factory, 1, "Todo")
+
+    assert item.status == "Todo"
+    assert item.remote_sync_status == "pending"
+    assert client.documents == []
+
+    assert await process_item_outbox(session_factory) == 1
+    assert [field_input["value"] for field_input in client.documents[0].values()] == [{"singleSelectOptionId": "O_TODO"}]
+
+    async with session_factory() as db:
+        item = await db.get(ProjectItem, 1)
+        statuses = (await db.execute(select(ItemMutationOutbox.status).order_by(ItemMutationOutbox.id))).scalars().all()
+    assert item.remote_sync_status is None
+    assert statuses == ["superseded", "done"]
+
+
+@pytest.mark.anyio
+async def test_failed_push_is_retried_then_marked_failed_on_item(session_factory, seeded, monkeypatch):
+    client = FakeClient(failing={"I2"})
+    monkeypatch.setattr(github, "GithubGraphQLClient", lambda token, priority=None: client)
+
+    await _edit(session_factory, 1, "Done")
+    await _edit(session_factory, 2, "Done")
+    assert await process_item_outbox(session_factory) == 2
+
+    async with session_factory() as db:
+        item_1, item_2 = await db.get(ProjectItem, 1), await db.get(ProjectItem, 2)
+        assert item_1.remote_sync_status is None
+        assert (item_2.remote_sync_status, item_2.remote_sync_error) == ("pending", "GitHub indisponível")
+
+        record = (await db.execute(select(ItemMutationOutbox).where(ItemMutationOutbox.item_id == 2))).scalar_one()
+        record.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+        await db.commit()
+
+    assert await process_item_outbox(session_factory) == 1
+
+    async with session_factory() as db:
+        item_2 = await db.get(ProjectItem, 2)
+    assert (item_2.status, item_2.remote_sync_status) == ("Done", "failed")
+
+
+@pytest.mark.anyio
+async def test_concurrent_workers_push_an_item_once_and_in_order(session_factory, seeded, monkeypatch):
+    client = FakeClient(failing=set())
+    other_worker: list[asyncio.Task] = []
+    running = 0
+    peak = 0
+    original_execute = client.execute_with_errors
+
+    async def slow_execute(query: str, variables: dict):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        if not other_worker:
+            # Nova edição do item e um segundo worker (outro processo) durante o primeiro envio
+            await _edit(session_factory, 1, "Todo")
+            other_worker.append(asyncio.create_task(item_outbox._drain_outbox(session_factory)))
+        await asyncio.sleep(0.05)
+        running -= 1
+        return await original_execute(query, variables)
+
+    client.execute_with_errors = slow_execute
+    monkeypatch.setattr(github, "GithubGraphQLClient", lambda token, priority=None: client)
+
+    await _edit(session_factory, 1, "Done")
+    processed = await item_outbox._drain_outbox(session_factory)
+    processed += await other_worker[0]
+
+    assert processed == 2
+    assert peak == 1
+    assert [next(iter(document.values()))["value"] for document in client.documents] == [
+        {"singleSelectOptionId": "O_DONE"},
+        {"singleSelectOptionId": "O_TODO"},
+    ]
+    async with session_factory() as db:
+        item = await db.get(ProjectItem, 1)
+        statuses = (await db.execute(select(ItemMutationOutbox.status).order_by(ItemMutationOutbox.id))).scalars().all()
+    assert item.remote_sync_status is None
+    assert statuses == ["done", "done"]
+
+
+@pytest.mark.anyio
+async def test_expired_lease_is_taken_over(session_factory, seeded, monkeypatch):
+    client = FakeClient(failing=set())
+    monkeypatch.setattr(github, "GithubGraphQLClient", lambda token, priority=None: client)
+
+    await _edit(session_factory, 1, "Done")
+    async with session_factory() as db:
+        record = (await db.execute(select(ItemMutationOutbox))).scalar_one()
+        # Reservado por um worker que caiu e a reserva venceu
+        record.status, record.lease_token = "processing", "worker-morto"
+        record.lease_until = datetime.now(UTC) - timedelta(seconds=1)
+        await db.commit()
+
+    assert await process_item_outbox(session_factory) == 1
+
+    async with session_factory() as db:
+        record = (await db.execute(select(ItemMutationOutbox))).scalar_one()
+    assert (record.status, record.lease_token) == ("done", None)
+
+
+@pytest.mark.anyio
+async def test_write_behind_epic_edit_stays_local(session_factory, seeded):
+    async with session_factory() as db:
+        account = (await db.execute(select(Account))).scalar_one()
+        project = await db.get(GithubProject, 1)
+        item = await db.get(ProjectItem, 1)
+        await github.apply_local_project_item_updates(
+            db, account, project, item, {"epic_option_id": "7", "epic_name": "Login"}, None
+        )
+        await db.commit()
+
+    async with session_factory() as db:
+        item = await db.get(ProjectItem, 1)
+        records = (await db.execute(select(ItemMutationOutbox))).scalars().all()
+    assert (item.epic_option_id, item.epic_name, item.remote_sync_status) == ("7", "Login", None)
+    assert records == []
@@ -0,0 +1,107 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.routers.projects import (
+    _build_epic_summaries,
+    _build_iteration_summaries,
+    _epic_aggregate_query,
+    _iteration_aggregate_query,
+)
+from app.models.github_project import GithubProject
+from app.models.project_item import ProjectItem
+from app.services.github import recategorize_project_items
+from app.utils.status_category import derive_status_category
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(ProjectItem.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _item(node_id: str, **values) -> ProjectItem:
+    values.setdefault("status_category", derive_status_category(values.get("status")))
+    return ProjectItem(account_id=uuid.uuid4(), project_id=1, item_node_id=node_id, **values)
+
+
+def test_derive_status_category_uses_project_columns():
+    columns = ["Backlog", "Ready", "In review", "Entregue", "Done"]
+
+    assert [derive_status_category(column, columns) for column in columns] == [
+        "todo",
+        "in_progress",
+        "in_progress",
+        "in_progress",
+        "done",
+    ]
+    assert derive_status_category(" concluído ", columns) == "done"
+    assert derive_status_category("Ready", ["Ready", "Done"]) == "todo"
+    assert derive_status_category("", columns) == "todo"
+
+
+@pytest.mark.anyio
+async def test_dashboards_aggregate_in_sql(db_session):
+    start, end = datetime(2025, 1, 6, tzinfo=UTC), datetime(2025, 1, 20, tzinfo=UTC)
+    db_session.add_all(
+        [
+            _item("A", status="Done", estimate=5, iteration_id="it-1", iteration="Sprint 1",
+                  iteration_start=start, iteration_end=end, epic_option_id="ep-1", epic_name="Login"),
+            _item("B", status=" Done ", estimate=3, iteration_id="it-1", iteration="Sprint 1",
+                  iteration_start=start, iteration_end=end, epic_option_id="ep-1", epic_name="Login"),
+            _item("C", status="Todo", estimate=2, iteration_id="it-1", iteration="Sprint 1",
+                  iteration_start=start, iteration_end=end),
+            _item("D", status="", estimate=None),
+            ProjectItem(account_id=uuid.uuid4(), project_id=2, item_node_id="OTHER", status="Done", estimate=8),
+        ]
+    )
+    await db_session.flush()
+
+    rows = (await db_session.execute(_iteration_aggregate_query(1))).all()
+    iterations = {summary.iteration_id: summary for summary in _build_iteration_summaries(rows)}
+
+    sprint = iterations["it-1"]
+    assert (sprint.name, sprint.start_date.date(), sprint.end_date.date()) == ("Sprint 1", start.date(), end.date())
+    assert (sprint.item_count, sprint.completed_count) == (3, 2)
+    assert (sprint.total_estimate, sprint.completed_estimate) == (10.0, 8.0)
+    assert [(entry.status, entry.count, entry.total_estimate) for entry in sprint.status_breakdown] == [
+        ("Done", 2, 8.0),
+        ("Todo", 1, 2.0),
+    ]
+    backlog = iterations[None]
+    assert (backlog.name, backlog.item_count, backlog.total_estimate) == ("Sem sprint", 1, 0.0)
+    assert [entry.status for entry in backlog.status_breakdown] == [None]
+
+    rows = (await db_session.execute(_epic_aggregate_query(1))).all()
+    epics = {summary.epic_option_id: summary for summary in _build_epic_summaries(rows)}
+
+    assert (epics["ep-1"].name, epics["ep-1"].item_count, epics["ep-1"].completed_estimate) == ("Login", 2, 8.0)
+    assert (epics[None].name, epics[None].item_count, epics[None].completed_count) == ("Sem épico", 2, 0)
+
+
+@pytest.mark.anyio
+async def test_recategorize_project_items_follows_status_columns(db_session):
+    db_session.add_all([_item("A", status="Entregue"), _item("B", status="Entregue"), _item("C", status="Todo")])
+    await db_session.flush()
+    project = GithubProject(id=1, status_columns=["Todo", "Entregue", "Done"])
+
+    assert await recategorize_project_items(db_session, project) == 0
+
+    # "Entregue" passa a ser a coluna de entrada do quadro
+    project.status_columns = ["Entregue", "Done"]
+    assert await recategorize_project_items(db_session, project) == 2
+
+    categories = {item.item_node_id: item.status_category for item in await db_session.scalars(select(ProjectItem))}
+    assert categories == {"A": "todo", "B": "todo", "C": "todo"}
@@ -0,0 +1,305 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.account import Account
+from app.models.epic_option import EpicOption
+from app.models.github_project import GithubProject
+from app.models.github_project_field import GithubProjectField
+from app.models.project_item import ProjectItem
+from app.services import github
+from app.services.github import (
+    ItemFieldMutation,
+    ProjectMetadata,
+    apply_item_field_mutations,
+    apply_project_metadata,
+    build_item_field_mutation_document,
+    bulk_update_project_items,
+    get_project_field_index,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeMutationClient:
+    def __init__(self, token=None, priority=None):
+        self.documents: list[tuple[str, dict]] = []
+        self.failing_items: set[str] = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def execute_with_errors(self, query: str, variables: dict):
+        self.documents.append((query, variables))
+        errors = [
+            {"path": [name.replace("input", "m")], "message": f"falhou {field_input['itemId']}"}
+            for name, field_input in variables.items()
+            if field_input["itemId"] in self.failing_items
+        ]
+        return {}, errors
+
+
+def test_build_item_field_mutation_document_aliases_each_change():
+    document, variables = build_item_field_mutation_document(
+        "PVT",
+        [
+            ItemFieldMutation("I1", "F_STATUS", {"singleSelectOptionId": "O1"}),
+            ItemFieldMutation("I2", "F_ITER"),
+        ],
+    )
+
+    assert "m0: updateProjectV2ItemFieldValue(input: $input0)" in document
+    assert "m1: clearProjectV2ItemFieldValue(input: $input1)" in document
+    assert variables["input0"]["value"] == {"singleSelectOptionId": "O1"}
+    assert "value" not in variables["input1"]
+
+
+@pytest.mark.anyio
+async def test_apply_item_field_mutations_maps_errors_by_alias(monkeypatch):
+    monkeypatch.setattr(github, "ITEM_MUTATIONS_PER_DOCUMENT", 2)
+    client = FakeMutationClient()
+    client.failing_items = {"I3"}
+    mutations = [ItemFieldMutation(f"I{index}", "F", {"iterationId": "S"}) for index in range(1, 5)]
+
+    errors = await apply_item_field_mutations(client, "PVT", mutations)
+
+    assert len(client.documents) == 2
+    assert errors == [None, None, "falhou I3", None]
+
+
+@pytest.fixture
+async def db_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for table in (GithubProjectField.__table__, ProjectItem.__table__, EpicOption.__table__):
+            await conn.run_sync(lambda sync_conn, table=table: table.create(sync_conn))
+    github.invalidate_project_field_index()
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_bulk_update_validates_locally_and_reports_per_item(db_session, monkeypatch):
+    account = Account(id=uuid.uuid4(), name="Acme")
+    project = GithubProject(id=1, account_id=account.id, project_node_id="PVT", status_columns=["Todo", "Done"])
+    db_session.add_all(
+        [
+            GithubProjectField(
+                project_id=1,
+                field_id="F_STATUS",
+                field_name="Status",
+                field_type="SINGLE_SELECT",
+                options=[{"id": "O_TODO", "name": "Todo"}, {"id": "O_DONE", "name": "Done"}],
+            ),
+            GithubProjectField(
+                project_id=1,
+                field_id="F_ITER",
+                field_name="Iteration",
+                field_type="ITERATION",
+                options={"iterations": [{"id": "S2", "title": "Sprint 2", "startDate": "2025-01-06", "duration": 14}]},
+            ),
+        ]
+    )
+    for item_id in (1, 2, 3):
+        db_session.add(
+            ProjectItem(id=item_id, account_id=account.id, project_id=1, item_node_id=f"I{item_id}", status="Todo")
+        )
+    await db_session.flush()
+
+    client = FakeMutationClient()
+    client.failing_items = {"I2"}
+
+    async def fake_token(db, account):
+        return "token"
+
+    monkeypatch.setattr(github, "get_github_token", fake_token)
+    monkeypatch.setattr(github, "GithubGraphQLClient", lambda token: client)
+
+    results = await bulk_update_project_items(
+        db_session,
+        account,
+        project,
+        [
+            (1, {"status": "Done", "iteration_id": "S2"}),
+            (2, {"status": "Done"}),
+            (3, {"status": "Blocked"}),
+            (99, {"status": "Done"}),
+        ],
+        None,
+    )
+
+    assert [(result.item_id, result.error) for result in results] == [
+        (1, None),
+        (2, "falhou I2"),
+        (3, "Status inválido para este projeto"),
+        (99, "Item não encontrado"),
+    ]
+    # Uma única ida ao GitHub para todas as alterações válidas
+    assert len(client.documents) == 1
+    assert len(client.documents[0][1]) == 3
+
+    item_1, item_2 = results[0].item, await db_session.get(ProjectItem, 2)
+    assert (item_1.status, item_1.iteration, item_1.iteration_id) == ("Done", "Sprint 2", "S2")
+    assert item_1.status_category == "done"
+    assert item_2.status == "Todo"
+
+
+@pytest.mark.anyio
+async def test_bulk_update_assigns_label_based_epics_locally(db_session, monkeypatch):
+    account = Account(id=uuid.uuid4(), name="Acme")
+    project = GithubProject(id=1, account_id=account.id, project_node_id="PVT", status_columns=["Todo", "Done"])
+    epic = EpicOption(project_id=1, option_name="Login", label_name="epic:login")
+    db_session.add_all(
+        [
+            epic,
+            GithubProjectField(
+                project_id=1,
+                field_id="F_STATUS",
+                field_name="Status",
+                field_type="SINGLE_SELECT",
+                options=[{"id": "O_TODO", "name": "Todo"}, {"id": "O_DONE", "name": "Done"}],
+            ),
+            ProjectItem(id=1, account_id=account.id, project_id=1, item_node_id="I1", status="Todo"),
+            ProjectItem(id=2, account_id=account.id, project_id=1, item_node_id="I2", status="Todo"),
+        ]
+    )
+    await db_session.flush()
+
+    client = FakeMutationClient()
+
+    async def fake_token(db, account):
+        return "token"
+
+    monkeypatch.setattr(github, "get_github_token", fake_token)
+    monkeypatch.setattr(github, "GithubGraphQLClient", lambda token: client)
+
+    # O projeto não tem campo Epic no GitHub: o épico (label) é gravado só localmente
+    results = await bulk_update_project_items(
+        db_session,
+        account,
+        project,
+        [
+            (1, {"epic_option_id": str(epic.id), "epic_name": "Login"}),
+            (2, {"epic_option_id": str(epic.id), "epic_name": "Login", "status": "Done"}),
+        ],
+        None,
+    )
+
+    assert [(result.item_id, result.error) for result in results] == [(1, None), (2, None)]
+    assert [(result.item.epic_option_id, result.item.epic_name) for result in results] == [
+        (str(epic.id), "Login"),
+        (str(epic.id), "Login"),
+    ]
+    # Só o status vai ao GitHub
+    assert len(client.documents) == 1
+    assert [field_input["fieldId"] for field_input in client.documents[0][1].values()] == ["F_STATUS"]
+
+
+@pytest.mark.anyio
+async def test_single_item_edit_sends_all_field_changes_in_one_document(db_session, monkeypatch):
+    account = Account(id=uuid.uuid4(), name="Acme")
+    project = GithubProject(id=1, account_id=account.id, project_node_id="PVT", status_columns=["Todo", "Done"])
+    db_session.add_all(
+        [
+            GithubProjectField(
+                project_id=1,
+                field_id="F_STATUS",
+                field_name="Status",
+                field_type="SINGLE_SELECT",
+                options=[{"id": "O_DONE", "name": "Done"}],
+            ),
+            GithubProjectField(project_id=1, field_id="F_ITER", field_name="Iteration", field_type="ITERATION"),
+            ProjectItem(id=1, account_id=account.id, project_id=1, item_node_id="I1", status="Todo"),
+        ]
+    )
+    await db_session.flush()
+    item = await db_session.get(ProjectItem, 1)
+
+    client = FakeMutationClient()
+
+    async def fake_token(db, account):
+        return "token"
+
+    monkeypatch.setattr(github, "get_github_token", fake_token)
+    monkeypatch.setattr(github, "GithubGraphQLClient", lambda token: client)
+
+    await github.apply_local_project_item_updates(
+        db_session, account, project, item, {"status": "Done", "iteration_id": "S1"}, None
+    )
+
+    assert len(client.documents) == 1
+    assert [field_input["fieldId"] for field_input in client.documents[0][1].values()] == ["F_STATUS", "F_ITER"]
+    assert (item.status, item.iteration_id) == ("Done", "S1")
+
+    client.failing_items = {"I1"}
+    with pytest.raises(github.HTTPException):
+        await github.apply_local_project_item_updates(db_session, account, project, item, {"status": None}, None)
+    assert item.status == "Done"
+
+
+def _metadata(field_mappings: dict) -> ProjectMetadata:
+    return ProjectMetadata(node_id="PVT", title="Projeto", owner="acme", number=1, field_mappings=field_mappings)
+
+
+@pytest.mark.anyio
+async def test_field_index_is_reused_until_fields_change(db_session):
+    project = GithubProject(id=1, project_node_id="PVT")
+    status_mapping = {"id": "F_STATUS", "dataType": "SINGLE_SELECT", "options": [{"id": "O_TODO", "name": "Todo"}]}
+    await apply_project_metadata(db_session, project, _metadata({"Status": status_mapping}))
+
+    index = await get_project_field_index(db_session, project)
+    assert index.status.option_by_name(" todo ")["id"] == "O_TODO"
+    assert index.status.option("O_TODO")["name"] == "Todo"
+    assert index.iteration is None
+
+    # Metadados iguais não descartam o índice
+    await apply_project_metadata(db_session, project, _metadata({"Status": status_mapping}))
+    assert await get_project_field_index(db_session, project) is index
+
+    iteration_mapping = {
+        "id": "F_ITER",
+        "dataType": "ITERATION",
+        "configuration": {"iterations": [{"id": "S1", "title": "Sprint 1", "startDate": "2025-01-06", "duration": 14}]},
+    }
+    # Campos alterados por outro processo: o hash do projeto lido do banco não é mais o do índice
+    other_process = GithubProject(id=1, project_node_id="PVT")
+    await apply_project_metadata(
+        db_session, other_process, _metadata({"Status": status_mapping, "Iteration": iteration_mapping})
+    )
+    assert await get_project_field_index(db_session, project) is index
+
+    rebuilt = await get_project_field_index(db_session, other_process)
+    assert rebuilt is not index
+    assert rebuilt.iteration.option("S1")["title"] == "Sprint 1"
+    assert [option.id for option in rebuilt.iteration_options] == ["S1"]
+
+
+@pytest.mark.anyio
+async def test_single_item_edit_keeps_label_based_epic_local(db_session, monkeypatch):
+    account = Account(id=uuid.uuid4(), name="Acme")
+    project = GithubProject(id=1, account_id=account.id, project_node_id="PVT")
+    epic = EpicOption(project_id=1, option_name="Login", label_name="epic:login")
+    db_session.add_all([epic, ProjectItem(id=1, account_id=account.id, project_id=1, item_node_id="I1")])
+    await db_session.flush()
+    item = await db_session.get(ProjectItem, 1)
+
+    def unexpected_client(token):
+        raise AssertionError("épico não deveria ir ao GitHub")
+
+    monkeypatch.setattr(github, "GithubGraphQLClient", unexpected_client)
+
+    await github.apply_local_project_item_updates(
+        db_session, account, project, item, {"epic_option_id": str(epic.id), "epic_name": "Login"}, None
+    )
+    assert (item.epic_option_id, item.epic_name) == (str(epic.id), "Login")
+
+    await github.apply_local_project_item_updates(db_session, account, project, item, {"epic_option_id": None}, None)
+    assert (item.epic_option_id, item.epic_name) == (None, None)
@@ -0,0 +1,118 @@
+import json
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.routers import projects
+from app.models.github_project import GithubProject
+from app.models.project_item import ProjectItem
+from main import app
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_session(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(ProjectItem.__table__.create)
+
+    async def fake_account(db, user):
+        return None
+
+    async def fake_project(db, account, project_id):
+        return GithubProject(id=1)
+
+    monkeypatch.setattr(projects, "_get_account_or_404", fake_account)
+    monkeypatch.setattr(projects, "_get_project_or_404", fake_project)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _day(day: int) -> datetime:
+    return datetime(2025, 1, day, tzinfo=UTC)
+
+
+async def _list(db_session, **params):
+    params.setdefault("limit", None)
+    params.setdefault("cursor", None)
+    params.setdefault("fields", None)
+    params.setdefault("include_field_values", True)
+    response = await projects.list_current_project_items(
+        status=None, iteration=None, epic=None, search=None, db=db_session, current_user=None, x_project_id=None, **params
+    )
+    return json.loads(response.body), response.headers.get("X-Next-Cursor")
+
+
+@pytest.mark.anyio
+async def test_items_keyset_pages_follow_full_ordering(db_session):
+    dates = [
+        (_day(5), _day(9), _day(1)),
+        (_day(5), _day(9), _day(3)),
+        (_day(5), None, None),
+        (None, None, _day(2)),
+        (None, None, None),
+        (_day(2), _day(4), None),
+        (None, None, None),
+    ]
+    for index, (start, end, updated) in enumerate(dates, start=1):
+        db_session.add(
+            ProjectItem(
+                id=index,
+                account_id=uuid.uuid4(),
+                project_id=1,
+                item_node_id=f"I{index}",
+                title=f"Item {index}",
+                start_date=start,
+                end_date=end,
+                updated_at=updated,
+                estimate=index,
+                field_values={"Estimate": index},
+            )
+        )
+    await db_session.commit()
+
+    everything, next_cursor = await _list(db_session)
+    assert next_cursor is None
+    assert [item["id"] for item in everything] == [6, 2, 1, 3, 4, 5, 7]
+    assert everything[0]["estimate"] == 6.0 and everything[0]["assignees"] == []
+
+    paged: list[int] = []
+    cursor = None
+    while True:
+        page, cursor = await _list(db_session, limit=2, cursor=cursor, fields="title", include_field_values=False)
+        assert all(set(item) == {"id", "title"} for item in page)
+        paged.extend(item["id"] for item in page)
+        if cursor is None:
+            break
+    assert paged == [item["id"] for item in everything]
+
+
+@pytest.mark.anyio
+async def test_items_list_rejects_unknown_fields_and_bad_cursor(db_session):
+    with pytest.raises(HTTPException) as unknown:
+        await _list(db_session, fields="title,secret")
+    assert unknown.value.status_code == 422
+
+    with pytest.raises(HTTPException) as bad_cursor:
+        await _list(db_session, cursor="não-é-cursor")
+    assert bad_cursor.value.status_code == 400
+
+
+def test_items_list_openapi_documents_partial_items_and_cursor_header():
+    response = app.openapi()["paths"]["/api/projects/current/items"]["get"]["responses"]["200"]
+
+    assert response["content"]["application/json"]["schema"]["items"] == {
+        "$ref": "#/components/schemas/ProjectItemPartialResponse"
+    }
+    assert response["headers"]["X-Next-Cursor"]["schema"] == {"type": "string"}
+    partial = app.openapi()["components"]["schemas"]["ProjectItemPartialResponse"]
+    assert partial["required"] == ["id"]
+    assert set(partial["properties"]) == set(projects.ITEM_LIST_FIELDS)
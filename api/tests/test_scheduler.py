@@ -0,0 +1,79 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.models.account import Account
+from app.models.github_project import GithubProject
+from app.services import scheduler
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (Account, GithubProject):
+            await conn.run_sync(lambda sync_conn, table=model.__table__: table.create(sync_conn))
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_sync_all_projects_respects_global_and_account_limits(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "github_sync_max_concurrency", 3)
+    monkeypatch.setattr(settings, "github_sync_account_concurrency", 2)
+    monkeypatch.setattr(scheduler, "SessionLocal", session_factory)
+
+    # A conta "busy" tem mais projetos que o seu limite; a "other" só um
+    busy, other = uuid.uuid4(), uuid.uuid4()
+    async with session_factory() as db:
+        for account_id, name, projects in ((busy, "busy", 5), (other, "other", 1)):
+            db.add(Account(id=account_id, name=name))
+            for number in range(projects):
+                db.add(
+                    GithubProject(
+                        account_id=account_id,
+                        owner_login=name,
+                        project_number=number,
+                        project_node_id=f"PVT_{name}_{number}",
+                    )
+                )
+        await db.commit()
+
+    running: dict[uuid.UUID, int] = {}
+    peak_global = 0
+    peak_by_account: dict[uuid.UUID, int] = {}
+    finished = 0
+    finished_before_start: dict[uuid.UUID, int] = {}
+
+    async def fake_token(db, account):
+        return "token"
+
+    async def fake_sync(db, account, project, token, priority=None):
+        nonlocal peak_global, finished
+        finished_before_start.setdefault(account.id, finished)
+        running[account.id] = running.get(account.id, 0) + 1
+        peak_global = max(peak_global, sum(running.values()))
+        peak_by_account[account.id] = max(peak_by_account.get(account.id, 0), running[account.id])
+        await asyncio.sleep(0.02)
+        running[account.id] -= 1
+        finished += 1
+        return SimpleNamespace(total=0, changed=0, unchanged=0, deleted=0)
+
+    monkeypatch.setattr(scheduler, "get_github_token", fake_token)
+    monkeypatch.setattr(scheduler, "sync_github_project", fake_sync)
+
+    await scheduler.sync_all_projects()
+
+    assert peak_global == 3
+    assert peak_by_account == {busy: 2, other: 1}
+    # Projetos aguardando a vez da conta não ocupam vagas globais: "other" começa de imediato
+    assert finished_before_start[other] == 0
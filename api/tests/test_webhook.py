@@ -0,0 +1,80 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.account import Account
+from app.models.github_project import GithubProject
+from app.services import github, webhook
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (Account, GithubProject):
+            await conn.run_sync(lambda sync_conn, table=model.__table__: table.create(sync_conn))
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def project(db_session, monkeypatch):
+    async def fake_token(db, account):
+        return "token"
+
+    monkeypatch.setattr(github, "get_github_token", fake_token)
+
+    account_id = uuid.uuid4()
+    db_session.add(Account(id=account_id, name="Acme"))
+    db_session.add(GithubProject(id=1, account_id=account_id, owner_login="acme", project_number=1, project_node_id="PVT"))
+    await db_session.commit()
+    return await db_session.get(GithubProject, 1)
+
+
+def _result(total: int):
+    return github.ProjectSyncResult(total=total, changed=total, unchanged=0, deleted=0)
+
+
+@pytest.mark.anyio
+async def test_targeted_refresh_updates_only_the_given_items(db_session, project, monkeypatch):
+    refreshed: list[list[str]] = []
+
+    async def fake_refresh(db, account, project, token, item_node_ids, priority=None):
+        refreshed.append(item_node_ids)
+        return _result(len(item_node_ids))
+
+    async def unexpected_sync(*args, **kwargs):
+        raise AssertionError("sync completo não deveria rodar")
+
+    monkeypatch.setattr(github, "refresh_project_items", fake_refresh)
+    monkeypatch.setattr(github, "sync_github_project", unexpected_sync)
+
+    await webhook._refresh_project_items(db_session, project, ["I1", "I2"], "test")
+
+    assert refreshed == [["I1", "I2"]]
+
+
+@pytest.mark.anyio
+async def test_failed_targeted_refresh_falls_back_to_full_sync(db_session, project, monkeypatch):
+    synced: list[tuple[uuid.UUID, int]] = []
+
+    async def failing_refresh(db, account, project, token, item_node_ids, priority=None):
+        raise RuntimeError("GitHub indisponível")
+
+    async def fake_sync(db, account, project, token, priority=None):
+        synced.append((account.id, project.id))
+        return _result(0)
+
+    monkeypatch.setattr(github, "refresh_project_items", failing_refresh)
+    monkeypatch.setattr(github, "sync_github_project", fake_sync)
+
+    await webhook._refresh_project_items(db_session, project, ["I1"], "test")
+
+    assert synced == [(project.account_id, 1)]
@@ -0,0 +1,182 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.models.webhook_delivery import WebhookDelivery
+from app.services import webhook_inbox
+from app.services.webhook_inbox import enqueue_webhook_delivery, process_webhook_inbox
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def inbox_session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: WebhookDelivery.__table__.create(sync_conn))
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def _item_event(project_node_id: str, item_node_id: str) -> dict:
+    return {
+        "action": "edited",
+        "projects_v2_item": {"node_id": item_node_id, "project_node_id": project_node_id},
+    }
+
+
+@pytest.mark.anyio
+async def test_enqueue_dedupes_on_delivery_id(inbox_session_factory):
+    async with inbox_session_factory() as db:
+        first = await enqueue_webhook_delivery(db, "d-1", "project_v2_item", _item_event("P1", "I1"))
+        second = await enqueue_webhook_delivery(db, "d-1", "project_v2_item", _item_event("P1", "I1"))
+
+    assert first is not None and first.partition_key == "P1"
+    assert second is None
+
+
+@pytest.mark.anyio
+async def test_failed_delivery_blocks_only_its_partition(inbox_session_factory, monkeypatch):
+    handled: list[str] = []
+
+    async def fake_batch(db, events):
+        item_node_ids = [payload["projects_v2_item"]["node_id"] for _, _, payload in events]
+        if "I1" in item_node_ids:
+            raise RuntimeError("boom")
+        handled.extend(item_node_ids)
+
+    monkeypatch.setattr(webhook_inbox, "handle_webhook_batch", fake_batch)
+    monkeypatch.setattr(settings, "webhook_max_attempts", 3)
+    monkeypatch.setattr(settings, "webhook_coalesce_window_seconds", 0)
+
+    async with inbox_session_factory() as db:
+        await enqueue_webhook_delivery(db, "d-1", "project_v2_item", _item_event("P1", "I1"))
+        await enqueue_webhook_delivery(db, "d-2", "project_v2_item", _item_event("P1", "I2"))
+        await enqueue_webhook_delivery(db, "d-3", "project_v2_item", _item_event("P2", "I3"))
+
+    await process_webhook_inbox(inbox_session_factory)
+
+    # P1 vira um único lote que falha e será repetido inteiro; P2 segue normalmente
+    assert handled == ["I3"]
+    async with inbox_session_factory() as db:
+        deliveries = {
+            delivery.delivery_id: delivery
+            for delivery in (await db.execute(select(WebhookDelivery))).scalars().all()
+        }
+    assert deliveries["d-1"].status == "pending"
+    assert deliveries["d-1"].attempts == 1
+    assert deliveries["d-1"].next_attempt_at is not None
+    assert deliveries["d-1"].last_error == "boom"
+    assert deliveries["d-2"].status == "pending"
+    assert deliveries["d-2"].attempts == 1
+    assert deliveries["d-3"].status == "done"
+
+
+@pytest.mark.anyio
+async def test_burst_in_a_partition_is_processed_as_one_batch(inbox_session_factory, monkeypatch):
+    batches: list[list[str]] = []
+
+    async def fake_batch(db, events):
+        batches.append([payload["projects_v2_item"]["node_id"] for _, _, payload in events])
+
+    monkeypatch.setattr(webhook_inbox, "handle_webhook_batch", fake_batch)
+    monkeypatch.setattr(settings, "webhook_coalesce_window_seconds", 0)
+
+    async with inbox_session_factory() as db:
+        for index in range(5):
+            await enqueue_webhook_delivery(db, f"d-{index}", "project_v2_item", _item_event("P1", f"I{index}"))
+
+    processed = await process_webhook_inbox(inbox_session_factory)
+
+    assert processed == 5
+    assert batches == [["I0", "I1", "I2", "I3", "I4"]]
+
+
+@pytest.fixture
+async def shared_inbox_session_factory(tmp_path):
+    # Arquivo em disco: cada worker usa as próprias conexões, como em processos separados
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'inbox.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: WebhookDelivery.__table__.create(sync_conn))
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_concurrent_workers_drain_a_partition_once_and_in_order(shared_inbox_session_factory, monkeypatch):
+    session_factory = shared_inbox_session_factory
+    handled: list[str] = []
+    other_worker: list[asyncio.Task] = []
+    running = 0
+    peak = 0
+
+    async def fake_batch(db, events):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        if not other_worker:
+            # Um segundo worker (outro processo) começa enquanto o primeiro lote está em andamento
+            other_worker.append(asyncio.create_task(webhook_inbox._drain_inbox(session_factory)))
+        await asyncio.sleep(0.05)
+        handled.extend(payload["projects_v2_item"]["node_id"] for _, _, payload in events)
+        running -= 1
+
+    monkeypatch.setattr(webhook_inbox, "handle_webhook_batch", fake_batch)
+    monkeypatch.setattr(webhook_inbox, "INBOX_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "webhook_coalesce_window_seconds", 0)
+
+    async with session_factory() as db:
+        for index in range(6):
+            await enqueue_webhook_delivery(db, f"d-{index}", "project_v2_item", _item_event("P1", f"I{index}"))
+
+    processed = await webhook_inbox._drain_inbox(session_factory)
+    processed += await other_worker[0]
+
+    assert processed == 6
+    assert handled == [f"I{index}" for index in range(6)]
+    assert peak == 1
+    async with session_factory() as db:
+        statuses = (await db.execute(select(WebhookDelivery.status))).scalars().all()
+    assert set(statuses) == {"done"}
+
+
+@pytest.mark.anyio
+async def test_expired_lease_is_taken_over(inbox_session_factory, monkeypatch):
+    handled: list[str] = []
+
+    async def fake_batch(db, events):
+        handled.extend(payload["projects_v2_item"]["node_id"] for _, _, payload in events)
+
+    monkeypatch.setattr(webhook_inbox, "handle_webhook_batch", fake_batch)
+    monkeypatch.setattr(settings, "webhook_coalesce_window_seconds", 0)
+
+    async with inbox_session_factory() as db:
+        await enqueue_webhook_delivery(db, "d-1", "project_v2_item", _item_event("P1", "I1"))
+        await enqueue_webhook_delivery(db, "d-2", "project_v2_item", _item_event("P1", "I2"))
+        first, second = (await db.execute(select(WebhookDelivery).order_by(WebhookDelivery.id))).scalars().all()
+        # d-1 ficou reservada por um worker que caiu e a reserva venceu
+        first.status, first.lease_token = "processing", "worker-morto"
+        first.lease_until = datetime.now(UTC) - timedelta(seconds=1)
+        await db.commit()
+
+    assert await process_webhook_inbox(inbox_session_factory) == 2
+    assert handled == ["I1", "I2"]
+
+    async with inbox_session_factory() as db:
+        await enqueue_webhook_delivery(db, "d-3", "project_v2_item", _item_event("P1", "I3"))
+        third = (await db.execute(select(WebhookDelivery).where(WebhookDelivery.delivery_id == "d-3"))).scalar_one()
+        third.status, third.lease_token = "processing", "outro-worker"
+        third.lease_until = datetime.now(UTC) + timedelta(minutes=5)
+        await db.commit()
+        await enqueue_webhook_delivery(db, "d-4", "project_v2_item", _item_event("P1", "I4"))
+
+    # Partição reservada por outro worker com lease válido: nada é processado aqui
+    assert await process_webhook_inbox(inbox_session_factory) == 0
+    assert handled == ["I1", "I2"]